@@ -1,7 +1,10 @@
+import os
+import shutil
 from abc import ABC, abstractmethod
 from typing import Generic
 
 import dill
+import numpy as np
 
 from abstractions import Effect, Policy
 from abstractions.type_vars import ActionTypeVar, StateTypeVar
@@ -67,22 +70,56 @@ class Agent(ABC, Generic[ActionTypeVar, StateTypeVar]):
         """
         raise NotImplementedError("finalize_episode method not implemented")
 
+    def learn_from_batch(self, batch) -> np.ndarray:
+        """
+        learns off-policy from a TransitionBatch of transitions generated by some other agent,
+        so many agents can share the same experience. This is available for off-policy agents
+
+        :param batch: the transitions to learn from
+        :return: the rewards determined by the agent for each transition
+        """
+        raise NotImplementedError("learn_from_batch not implemented")
+
+    def freeze(self, states: list[StateTypeVar] = None):
+        """
+        compiles the greedy policy of the agent into a read only policy, to be used once
+        training is done. This is available for agents keeping their Q function as a QTable
+
+        :param states: states to be covered by the policy, defaults to every state the agent knows
+        :return: a FrozenGreedyPolicy
+        """
+        raise NotImplementedError("freeze not implemented")
+
     def dump(self, filename: str) -> None:
         """
-        creates an artifact of the agent for later use.
+        creates an artifact of the agent for later use. The agent is stored as a checkpoint
+        directory(see utils.checkpoint), or as a dill pickle if its states can't be encoded.
 
         :param filename: the path where the file will be saved
         """
-        with open(f"{filename}.agent", "wb") as handle:
-            dill.dump(self, handle)
+        from utils.checkpoint import UnsupportedCheckpointError, save_checkpoint
+
+        try:
+            save_checkpoint(self, f"{filename}.agent")
+        except UnsupportedCheckpointError:
+            if os.path.isdir(f"{filename}.agent"):
+                shutil.rmtree(f"{filename}.agent")
+            with open(f"{filename}.agent", "wb") as handle:
+                dill.dump(self, handle)
 
     @staticmethod
-    def load(filename: str):
+    def load(filename: str, mmap: bool = True):
         """
         loads an artifact of an agent
 
         :param filename: the path to the file containing the agent
+        :param mmap: whether arrays of checkpoints should be memory mapped
         :return: a loaded agent
         """
+        if os.path.isdir(f"{filename}.agent"):
+            from utils.checkpoint import load_checkpoint
+
+            return load_checkpoint(f"{filename}.agent", mmap)
+
         with open(f"{filename}.agent", "rb") as handle:
             return dill.load(handle)
@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
 from typing import Any
 
-from abstractions import State, Action
+import numpy as np
+
+from abstractions import State, Action, Q
 
 
 class Policy(ABC):
@@ -9,6 +11,8 @@ class Policy(ABC):
     Abstract policy class.
     """
 
+    actions: tuple[Action, ...] = NotImplemented
+
     @abstractmethod
     def __call__(self, state: State, action: Action) -> float:
         """
@@ -27,3 +31,45 @@ class Policy(ABC):
         :param args: different implementations will use different parameters
         """
         raise NotImplementedError("update method not implemented")
+
+    def bind(self, q: Q) -> None:
+        """
+        Called by agents with their Q function once they are built, for policies reading values
+        from it. Does nothing by default.
+
+        :param q: the Q function of the agent
+        """
+
+    def remove(self, state: State) -> None:
+        """
+        Forgets what the policy knows about a state, called by agents whenever they drop a
+        state. Does nothing by default.
+
+        :param state: state to be removed
+        """
+
+    def decay(self) -> None:
+        """
+        Decays the exploration of the policy, called by agents by the end of every episode.
+        Does nothing by default.
+        """
+
+    def sample(self, state: State, rng: np.random.Generator = None) -> Action:
+        """
+        Samples an action for a state following the policy. This goes through every action
+        accumulating probabilities, policies that can do better should override it.
+
+        :param state: the state to select the action for
+        :param rng: random generator to be used, defaults to numpy global random state
+        :return: the selected action
+        """
+        n0 = (np.random if rng is None else rng).uniform()
+        cum_sum = 0
+        for action in self.actions:
+            cum_sum += self(state, action)
+            if n0 <= cum_sum:
+                return action
+
+        raise ValueError(
+            f"policy adds to: {cum_sum:.5f} over actions: {self.actions} in state: {state}"
+        )
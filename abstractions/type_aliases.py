@@ -1,4 +1,4 @@
-from typing import Callable
+from typing import Callable, MutableMapping
 
 from abstractions import Action
 from abstractions import State
@@ -9,5 +9,5 @@ WorldModel = Callable[[State, Action], Callable[[State], float]]
 Effect = int
 RewardFunction = Callable[[Effect], float]
 StateActionReward = Callable[[State, Action], float]
-Q = dict[tuple[State, Action], float]
+Q = MutableMapping[tuple[State, Action], float]
 PolicyRec = dict[StateTypeVar, ActionTypeVar]
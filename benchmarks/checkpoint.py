@@ -0,0 +1,59 @@
+"""
+Compares saving and loading a tag agent with a 83521 state Q table as a checkpoint and as a
+dill pickle.
+
+run with: python -m benchmarks.checkpoint
+"""
+import os
+import tempfile
+import time
+
+import dill
+import numpy as np
+
+from abstractions import Agent
+from exploring_agents import QAgent
+from grid_world.state import TagState
+from notebooks.utils.basics import basic_actions, basic_tag_reward
+from utils.q_table import QTable
+
+
+def get_agent(size: int = 17) -> QAgent:
+    r = range(size)
+    states = [TagState((a, b), (c, d)) for a in r for b in r for c in r for d in r]
+    agent = QAgent(basic_tag_reward, basic_actions)
+    agent.q = QTable(basic_actions, states=states)
+    agent.q.add_to_rows(np.arange(len(states)), np.random.rand(len(states), 4))
+    for state in states:
+        agent.policy.update(state, agent.q.best_action(state))
+    agent.visited_states = set(states)
+    return agent
+
+
+def timed(f) -> float:
+    start = time.perf_counter()
+    f()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    np.random.seed(0)
+    agent = get_agent()
+    with tempfile.TemporaryDirectory() as directory:
+        checkpoint = os.path.join(directory, "checkpoint")
+        pickle = os.path.join(directory, "agent.dill")
+
+        def dill_dump():
+            with open(pickle, "wb") as handle:
+                dill.dump(agent, handle)
+
+        def dill_load():
+            with open(pickle, "rb") as handle:
+                dill.load(handle)
+
+        print(f"{'format':<24}{'dump':>10}{'load':>10}")
+        dump = timed(lambda: agent.dump(checkpoint))
+        load = timed(lambda: Agent.load(checkpoint))
+        print(f"{'checkpoint':<24}{dump:>10.2f}{load:>10.2f}")
+        dump, load = timed(dill_dump), timed(dill_load)
+        print(f"{'dill':<24}{dump:>10.2f}{load:>10.2f}")
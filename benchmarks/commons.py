@@ -0,0 +1,39 @@
+import time
+from typing import Callable
+
+import numpy as np
+
+from abstractions import Agent, World
+from exploring_agents.training import train_agent
+
+
+def compare_agents(
+    agent_factories: dict[str, Callable[[], Agent]],
+    world: World,
+    episodes: int,
+    seeds: int = 5,
+) -> None:
+    """
+    Trains fresh agents from each factory on a world, once for each seed, and prints the mean
+    of the environment steps taken, the length of the last episodes, and the training time.
+
+    :param agent_factories: functions building the agents to be compared, by name
+    :param world: the world to train the agents in
+    :param episodes: number of episodes to train each agent for
+    :param seeds: number of seeds to average results over
+    """
+    print(f"{'agent':<24}{'steps':>10}{'last 10':>10}{'seconds':>10}")
+    for name, factory in agent_factories.items():
+        steps, last, seconds = [], [], []
+        for seed in range(seeds):
+            np.random.seed(seed)
+            agent = factory()
+            start = time.perf_counter()
+            lengths, _ = train_agent(agent, world, episodes)
+            seconds.append(time.perf_counter() - start)
+            steps.append(sum(lengths))
+            last.append(np.mean(lengths[-10:]))
+        print(
+            f"{name:<24}{np.mean(steps):>10.0f}{np.mean(last):>10.1f}"
+            f"{np.mean(seconds):>10.2f}"
+        )
@@ -0,0 +1,20 @@
+"""
+Compares QAgent with DynaQAgent, which also plans with a learned model of the world, on
+large_world_01.
+
+run with: python -m benchmarks.dyna_q
+"""
+from benchmarks.commons import compare_agents
+from exploring_agents import DynaQAgent, QAgent
+from notebooks.utils.basics import basic_actions, basic_reward
+from notebooks.utils.worlds import large_world_01
+
+if __name__ == "__main__":
+    compare_agents(
+        {
+            "QAgent": lambda: QAgent(basic_reward, basic_actions, alpha=0.5),
+            "DynaQAgent": lambda: DynaQAgent(basic_reward, basic_actions, alpha=0.5),
+        },
+        large_world_01,
+        episodes=100,
+    )
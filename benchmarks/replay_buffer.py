@@ -0,0 +1,34 @@
+"""
+Compares QAgent learning only from what happens with QAgent also replaying past transitions,
+sampled uniformly and by priority, on large_world_01.
+
+run with: python -m benchmarks.replay_buffer
+"""
+from benchmarks.commons import compare_agents
+from exploring_agents import QAgent
+from exploring_agents.commons.replay_buffer import ReplayBuffer
+from notebooks.utils.basics import basic_actions, basic_reward
+from notebooks.utils.worlds import large_world_01
+
+if __name__ == "__main__":
+    compare_agents(
+        {
+            "QAgent": lambda: QAgent(basic_reward, basic_actions, alpha=0.5),
+            "QAgent uniform replay": lambda: QAgent(
+                basic_reward,
+                basic_actions,
+                alpha=0.5,
+                replay_buffer=ReplayBuffer(),
+                replay_batch_size=16,
+            ),
+            "QAgent prioritized": lambda: QAgent(
+                basic_reward,
+                basic_actions,
+                alpha=0.5,
+                replay_buffer=ReplayBuffer(prioritized=True),
+                replay_batch_size=16,
+            ),
+        },
+        large_world_01,
+        episodes=100,
+    )
@@ -0,0 +1,22 @@
+"""
+Compares QAgent with TileCodingAgent, whose values generalize to nearby states, on an open
+100x100 world, from one corner to the other.
+
+run with: python -m benchmarks.tile_coding
+"""
+from benchmarks.commons import compare_agents
+from exploring_agents import QAgent, TileCodingAgent
+from grid_world.grid_world import GridWorld
+from notebooks.utils.basics import basic_actions, basic_reward
+
+if __name__ == "__main__":
+    compare_agents(
+        {
+            "QAgent": lambda: QAgent(basic_reward, basic_actions, alpha=0.5),
+            "TileCodingAgent": lambda: TileCodingAgent(
+                basic_reward, basic_actions, alpha=0.5, tile_width=8
+            ),
+        },
+        GridWorld(grid_shape=(100, 100), terminal_states_coordinates=((99, 99),)),
+        episodes=30,
+    )
@@ -0,0 +1,30 @@
+"""
+Compares TrueOnlineSarsaAgent with LambdaSarsaAgent on large_world_01, with long traces.
+
+With a small learning rate both agents need about as many steps, the gain is in the time
+each step takes. With a large one LambdaSarsaAgent becomes unstable and needs several times
+more steps, while TrueOnlineSarsaAgent degrades much less.
+
+run with: python -m benchmarks.true_online_sarsa
+"""
+from benchmarks.commons import compare_agents
+from exploring_agents import LambdaSarsaAgent, TrueOnlineSarsaAgent
+from notebooks.utils.basics import basic_actions, basic_reward
+from notebooks.utils.worlds import large_world_01
+
+if __name__ == "__main__":
+    for alpha in (0.3, 0.9):
+        print(f"alpha={alpha}")
+        compare_agents(
+            {
+                "LambdaSarsaAgent": lambda: LambdaSarsaAgent(
+                    basic_reward, basic_actions, alpha=alpha, et_lambda=0.9
+                ),
+                "TrueOnlineSarsaAgent": lambda: TrueOnlineSarsaAgent(
+                    basic_reward, basic_actions, alpha=alpha, et_lambda=0.9
+                ),
+            },
+            large_world_01,
+            episodes=100,
+            seeds=10,
+        )
@@ -0,0 +1,98 @@
+from typing import Sequence
+
+import numpy as np
+
+from abstractions import RewardFunction, StateEvalDict
+from grid_world.action import GWorldAction
+from grid_world.grid_world import GridWorld
+from policies import GreedyPolicy
+
+
+def _get_world_tensors(
+    world: GridWorld,
+    reward_function: RewardFunction,
+    actions: tuple[GWorldAction, ...],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Builds transitions and rewards for a world indexed by grid cells instead of states, so
+    worlds with different walls can be stacked together. Walls become cells that lead to
+    themselves with reward 0.
+    """
+    n_cols = world.grid_shape[1]
+    cells = np.array(
+        [i * n_cols + j for (i, j) in (s.coordinates for s in world.states)]
+    )
+    next_states, effects = world.get_transition_arrays(actions)
+
+    next_cells = np.repeat(np.arange(world.grid_size)[:, None], len(actions), axis=1)
+    next_cells[cells] = cells[next_states]
+    rewards = np.zeros((world.grid_size, len(actions)))
+    rewards[cells] = [[reward_function(e) for e in row] for row in effects.tolist()]
+
+    return next_cells, rewards, cells
+
+
+def batched_value_iteration(
+    worlds: Sequence[GridWorld],
+    reward_function: RewardFunction,
+    actions: tuple[GWorldAction, ...],
+    gamma: float = 1,
+    epsilon: float = 0.01,
+    max_iterations: int = 10000,
+) -> list[tuple[GreedyPolicy, StateEvalDict]]:
+    """
+    Solves a family of grid worlds of the same shape at once, using value iteration. This assumes
+    worlds are deterministic.
+
+    Transitions and rewards of all K worlds are stacked into (K, S, A) arrays, and every
+    iteration updates all worlds that haven't converged yet with a few vectorized operations.
+    Worlds stop being updated once their values converge.
+
+    :param worlds: worlds to be solved, all of them must have the same shape
+    :param reward_function: the reward function we are trying to maximize
+    :param actions: all possible actions
+    :param gamma: discount factor for rewards
+    :param epsilon: stop criteria. A world is considered solved whenever the maximum change on
+        a state evaluation is lower than this
+    :param max_iterations: max number of iterations to run
+    :return: the optimal policy and its value function for each world
+    """
+    if len({w.grid_shape for w in worlds}) > 1:
+        raise ValueError("all worlds must have the same shape")
+
+    tensors = [_get_world_tensors(w, reward_function, actions) for w in worlds]
+    next_cells = np.stack([t[0] for t in tensors])
+    rewards = np.stack([t[1] for t in tensors])
+
+    v = np.zeros(next_cells.shape[:2])
+    active = np.arange(len(worlds))
+    for _ in range(max_iterations):
+        if active.size == 0:
+            break
+        v_active = v[active]
+        q = rewards[active] + gamma * np.take_along_axis(
+            v_active[:, :, None], next_cells[active], axis=1
+        )
+        new_v = q.max(axis=2)
+        v[active] = new_v
+        active = active[np.abs(new_v - v_active).max(axis=1) > epsilon]
+
+    q = rewards + gamma * np.take_along_axis(v[:, :, None], next_cells, axis=1)
+    best_actions = q.argmax(axis=2)
+
+    results = []
+    for k, (world, (_, _, cells)) in enumerate(zip(worlds, tensors)):
+        results.append(
+            (
+                GreedyPolicy(
+                    actions,
+                    {
+                        s: actions[i]
+                        for s, i in zip(world.states, best_actions[k, cells].tolist())
+                    },
+                ),
+                dict(zip(world.states, v[k, cells].tolist())),
+            )
+        )
+
+    return results
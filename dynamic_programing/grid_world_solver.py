@@ -0,0 +1,78 @@
+from typing import Callable
+
+import numpy as np
+
+from abstractions import RewardFunction, StateEvalDict
+from dynamic_programing.policy_improvement import dynamic_programing_gpi
+from dynamic_programing.solution_cache import SolutionCache
+from grid_world.action import GWorldAction
+from grid_world.grid_world import GridWorld
+from grid_world.state import GWorldState
+from policies import GreedyPolicy
+
+
+def _landing_indicator(landing_state: GWorldState) -> Callable[[GWorldState], int]:
+    return lambda x: 1 if x == landing_state else 0
+
+
+def solve_grid_world(
+    world: GridWorld,
+    reward_function: RewardFunction,
+    actions: tuple[GWorldAction, ...],
+    gamma: float = 1,
+    v0: StateEvalDict = None,
+    cache: SolutionCache = None,
+) -> [GreedyPolicy, StateEvalDict]:
+    """
+    Finds the optimal policy for a grid world using DP. This assumes the world is deterministic.
+
+    If a cache is provided, solutions are looked up there before solving, and stored there after.
+
+    :param world: the world to be solved
+    :param reward_function: the reward function we are trying to maximize
+    :param actions: all possible actions
+    :param gamma: discount factor for rewards
+    :param v0: estimated EvalFunction for the initial policy, can speed things up
+    :param cache: an optional cache of solutions
+    :return: the optimal policy and its value function
+    """
+    next_states, effects = world.get_transition_arrays(actions)
+    rewards = np.array(
+        [[reward_function(e) for e in row] for row in effects.tolist()], dtype=float
+    )
+
+    if cache is not None:
+        key = cache.get_key(world, actions, rewards, gamma)
+        if (solution := cache.load(key)) is not None:
+            policy, v = solution
+            return (
+                GreedyPolicy(
+                    actions,
+                    {s: actions[i] for s, i in zip(world.states, policy.tolist())},
+                ),
+                dict(zip(world.states, v.tolist())),
+            )
+
+    action_index = {a: i for i, a in enumerate(actions)}
+    rewards_list = rewards.tolist()
+    pi, v = dynamic_programing_gpi(
+        world_model=lambda s, a: _landing_indicator(
+            world.states[next_states[world.state_index[s], action_index[a]]]
+        ),
+        reward_function=lambda s, a: rewards_list[world.state_index[s]][
+            action_index[a]
+        ],
+        actions=actions,
+        states=world.states,
+        v0=v0,
+        gamma=gamma,
+    )
+
+    if cache is not None:
+        cache.store(
+            key,
+            np.array([action_index[pi.policy_map[s]] for s in world.states], np.int8),
+            np.array([v[s] for s in world.states], dtype=float),
+        )
+
+    return pi, v
@@ -21,11 +21,14 @@ def q_estimate(
     world_model: WorldModel,
     reward_function: StateActionReward,
     states: Collection[State],
+    gamma: float = 1,
 ) -> float:
     """
     This is an estimate of the q function for pi bootstrapping from V.
     """
-    return reward_function(s, a) + sum([world_model(s, a)(s0) * v[s0] for s0 in states])
+    return reward_function(s, a) + gamma * sum(
+        [world_model(s, a)(s0) * v[s0] for s0 in states]
+    )
 
 
 def _argmax_q(
@@ -35,11 +38,14 @@ def _argmax_q(
     reward_function: StateActionReward,
     actions: tuple[Action, ...],
     states: tuple[State, ...],
+    gamma: float = 1,
 ) -> Action:
     best_action = actions[0]
-    best_score = q_estimate(s, best_action, v, world_model, reward_function, states)
+    best_score = q_estimate(
+        s, best_action, v, world_model, reward_function, states, gamma
+    )
     for a in actions[1:]:
-        qa = q_estimate(s, a, v, world_model, reward_function, states)
+        qa = q_estimate(s, a, v, world_model, reward_function, states, gamma)
         if qa > best_score:
             best_score = qa
             best_action = a
@@ -53,6 +59,7 @@ def get_greedy_policy(
     reward_function: StateActionReward,
     actions: tuple[Action, ...],
     states: tuple[State, ...],
+    gamma: float = 1,
 ) -> Policy:
     """
     Creates a greed policy with respect to an evaluation function. Since this function only
@@ -65,10 +72,11 @@ def get_greedy_policy(
     :param reward_function: the reward for taking an action in a given state
     :param actions: all possible action
     :param states: all possible states
+    :param gamma: discount factor for rewards
     :return: the greedy policy
     """
     gpr = {
-        s: _argmax_q(s, v, world_model, reward_function, actions, states)
+        s: _argmax_q(s, v, world_model, reward_function, actions, states, gamma)
         for s in states
     }
 
@@ -76,11 +84,11 @@ def get_greedy_policy(
 
 
 def _dpi_step(
-    v_pi, world_model, reward_function, actions, states
+    v_pi, world_model, reward_function, actions, states, gamma
 ) -> [Policy, StateEvalDict]:
-    pi_1 = get_greedy_policy(v_pi, world_model, reward_function, actions, states)
+    pi_1 = get_greedy_policy(v_pi, world_model, reward_function, actions, states, gamma)
     v_pi_1 = iterative_policy_evaluation(
-        pi_1, world_model, reward_function, actions, states, v_pi
+        pi_1, world_model, reward_function, actions, states, v_pi, gamma
     )
 
     return pi_1, v_pi_1
@@ -94,6 +102,7 @@ def dynamic_programing_gpi(
     pi: Policy = None,
     v0: StateEvalDict = None,
     max_epochs: int = 100,
+    gamma: float = 1,
 ) -> [Policy, StateEvalDict]:
     """
     General policy improvement algorithm using dynamic programing.
@@ -107,6 +116,7 @@ def dynamic_programing_gpi(
     :param v0: estimated EvalFunction for pi, can speed things up
     :param max_epochs: max number of policy iterations to run(will stop early if the value
         function converges)
+    :param gamma: discount factor for rewards
     :return: the optimal policy and its value function
     """
 
@@ -114,12 +124,12 @@ def dynamic_programing_gpi(
         pi = RandomPolicy(actions)
 
     v_pi = iterative_policy_evaluation(
-        pi, world_model, reward_function, actions, states, v0
+        pi, world_model, reward_function, actions, states, v0, gamma
     )
 
     for i in range(max_epochs):
         v_pi_0 = v_pi
-        pi, v_pi = _dpi_step(v_pi, world_model, reward_function, actions, states)
+        pi, v_pi = _dpi_step(v_pi, world_model, reward_function, actions, states, gamma)
 
         if float_dict_comparison(v_pi, v_pi_0):
             break
@@ -0,0 +1,105 @@
+import hashlib
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from abstractions import Action
+from grid_world.grid_world import GridWorld
+
+
+class SolutionCache:
+    def __init__(self, directory: str, max_bytes: int = 256 * 2**20):
+        """
+        On disk cache of DP solutions. Each solution is stored as two NumPy arrays: the index
+        of the action the policy chooses for each state, and the value of each state(both following
+        the order of world.states). Entries are keyed by the world fingerprint, the reward table and
+        gamma, so any change in those results in a new entry.
+
+        Cached arrays are memory mapped when loaded. Whenever the directory grows larger than
+        max_bytes the least recently used entries are deleted.
+
+        :param directory: where solutions will be stored
+        :param max_bytes: size cap for the cache directory
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def get_key(
+        world: GridWorld,
+        actions: tuple[Action, ...],
+        rewards: np.ndarray,
+        gamma: float,
+    ) -> str:
+        """
+        Builds the key identifying a solution.
+
+        :param world: the world being solved
+        :param actions: actions considered by the solution
+        :param rewards: (S, A) array with the reward for each state action pair
+        :param gamma: discount factor used by the solution
+        :return: a hex digest identifying the solution
+        """
+        key = hashlib.sha256(world.fingerprint.encode())
+        key.update(repr(tuple(str(a) for a in actions)).encode())
+        key.update(np.ascontiguousarray(rewards, dtype=np.float64).tobytes())
+        key.update(repr(float(gamma)).encode())
+        return key.hexdigest()
+
+    def load(self, key: str) -> tuple[np.ndarray, np.ndarray] | None:
+        """
+        Loads a solution from the cache.
+
+        :param key: the solution key
+        :return: memory mapped arrays with policy action indexes and state values, or None
+            if the solution is not cached
+        """
+        entry = os.path.join(self.directory, key)
+        try:
+            policy = np.load(os.path.join(entry, "policy.npy"), mmap_mode="r")
+            v = np.load(os.path.join(entry, "v.npy"), mmap_mode="r")
+        except FileNotFoundError:
+            return None
+
+        # mark entry as recently used
+        os.utime(entry)
+        return policy, v
+
+    def store(self, key: str, policy: np.ndarray, v: np.ndarray) -> None:
+        """
+        Stores a solution in the cache, evicting old entries if needed.
+
+        :param key: the solution key
+        :param policy: index of the action the policy chooses for each state
+        :param v: value of each state
+        """
+        # write to a temporary dir first, so readers never see partial entries
+        tmp_entry = tempfile.mkdtemp(prefix=".", dir=self.directory)
+        np.save(os.path.join(tmp_entry, "policy.npy"), policy)
+        np.save(os.path.join(tmp_entry, "v.npy"), v)
+        try:
+            os.replace(tmp_entry, os.path.join(self.directory, key))
+        except OSError:
+            # someone else already stored this solution
+            shutil.rmtree(tmp_entry, ignore_errors=True)
+
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if name.startswith(".") or not os.path.isdir(path):
+                continue
+            size = sum(os.path.getsize(os.path.join(path, f)) for f in os.listdir(path))
+            entries.append((os.path.getmtime(path), size, path))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_bytes:
+                break
+            shutil.rmtree(path, ignore_errors=True)
+            total_size -= size
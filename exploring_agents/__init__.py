@@ -1,6 +1,14 @@
+from exploring_agents.generic_agents.dyna_q_agent import DynaQAgent
 from exploring_agents.generic_agents.lambda_q_agent import LambdaQAgent
 from exploring_agents.generic_agents.lambda_sarsa_agent import LambdaSarsaAgent
 from exploring_agents.generic_agents.monte_carlo_agent import MonteCarloAgent
 from exploring_agents.generic_agents.q_agent import QAgent
 from exploring_agents.generic_agents.random_agent import RandomAgent
 from exploring_agents.generic_agents.sarsa_agent import SarsaAgent
+from exploring_agents.generic_agents.successor_representation_agent import (
+    SuccessorRepresentationAgent,
+)
+from exploring_agents.generic_agents.tile_coding_agent import TileCodingAgent
+from exploring_agents.generic_agents.true_online_sarsa_agent import (
+    TrueOnlineSarsaAgent,
+)
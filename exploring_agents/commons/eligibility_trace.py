@@ -1,3 +1,8 @@
+from typing import Iterator
+
+import numpy as np
+
+
 class EligibilityTrace:
     def __init__(
         self,
@@ -5,25 +10,60 @@ class EligibilityTrace:
         et_lambda: float = 0.5,
         gamma: float = 1,
         alpha: float = 1,
+        threshold: float = 1e-8,
+        initial_capacity: int = 64,
     ):
-        self.et_dict = {}
+        """
+        Eligibility traces over arbitrary arguments.
+
+        Traces are kept in an array, scaled by a global factor, so decaying every trace is O(1).
+        Traces falling below threshold are dropped, so the cost of going through the relevant
+        arguments follows the number of active traces, not how many arguments were visited.
+
+        :param kind: how traces of visited arguments are updated, one of: accumulating, dutch, replacing
+        :param et_lambda: the lambda decay parameter
+        :param gamma: the gamma discount parameter
+        :param alpha: learning rate, used by dutch traces
+        :param threshold: traces smaller than this are dropped
+        :param initial_capacity: number of traces to allocate initially
+        """
         self.et_lambda = et_lambda
         self.gamma = gamma
         self.kind = kind
         self.alpha = alpha
+        self.threshold = threshold
+        self._index: dict[tuple, int] = {}
+        self._arguments: list[tuple] = []
+        self._values = np.zeros(max(initial_capacity, 1))
+        self._scale = 1.0
 
     def __call__(self, *x: any) -> float:
-        return self.et_dict.get(x, 0)
+        if (i := self._index.get(x)) is None:
+            return 0
+        return float(self._values[i] * self._scale)
 
     def update(self, *x: any):
-        self.et_dict.update(
-            {
-                y: self.gamma * self.et_lambda * self.et_dict[y]
-                for y in self.et_dict
-                if y != x
-            }
-        )
-        # self.et_dict[tuple(x)] = self._visited_arguments_update(x)
+        """
+        Decays every trace, except for the one of x(if provided)
+        """
+        decay = self.gamma * self.et_lambda
+        if decay == 0:
+            kept = self(*x)
+            self.reset()
+            if kept:
+                self._set(x, kept)
+            return
+
+        if (i := self._index.get(x)) is not None:
+            self._values[i] /= decay
+        self._scale *= decay
+
+        n = len(self._arguments)
+        if n and np.abs(self._values[:n]).min() * self._scale < self.threshold:
+            self._prune()
+        if self._scale < 1e-100:
+            self._values[:n] *= self._scale
+            self._scale = 1.0
 
     def visited_arguments_update(self, *x) -> None:
         if self.kind == "replacing":
@@ -36,10 +76,35 @@ class EligibilityTrace:
             updated_value = self.gamma * self.et_lambda * self.__call__(*x) + 1
         else:
             raise ValueError("kind must be one of: accumulating, dutch, replacing")
-        self.et_dict[tuple(x)] = updated_value
+        self._set(x, updated_value)
 
     def get_relevant_arguments(self) -> list[any]:
-        return list(self.et_dict.keys())
+        return list(self._arguments)
+
+    def items(self) -> Iterator[tuple[tuple, float]]:
+        """
+        Iterates over active arguments and their traces
+        """
+        n = len(self._arguments)
+        return zip(self._arguments, (self._values[:n] * self._scale).tolist())
 
     def reset(self):
-        self.et_dict = {}
+        self._index = {}
+        self._arguments = []
+        self._scale = 1.0
+
+    def _set(self, x: tuple, value: float) -> None:
+        if (i := self._index.get(x)) is None:
+            i = len(self._arguments)
+            if i == len(self._values):
+                self._values = np.concatenate([self._values, np.zeros(i)])
+            self._index[x] = i
+            self._arguments.append(x)
+        self._values[i] = value / self._scale
+
+    def _prune(self) -> None:
+        n = len(self._arguments)
+        keep = np.abs(self._values[:n]) * self._scale >= self.threshold
+        self._values[: keep.sum()] = self._values[:n][keep]
+        self._arguments = [x for x, k in zip(self._arguments, keep.tolist()) if k]
+        self._index = {x: i for i, x in enumerate(self._arguments)}
@@ -0,0 +1,50 @@
+from abc import ABC
+
+from abstractions import Agent, State
+from policies.frozen_greedy_policy import FrozenGreedyPolicy
+from utils.bounded_q_table import BoundedQTable
+from utils.q_table import QTable
+
+
+class QTableAgent(Agent, ABC):
+    """
+    Base class for agents keeping their Q function as a QTable in self.q.
+    """
+
+    q: QTable = NotImplemented
+    # agents keeping data of their own by row of q(like eligibility traces) set this, since that
+    # data would end up pointing to other states once a BoundedQTable reuses rows
+    keeps_rows: bool = False
+
+    def freeze(self, states: list[State] = None) -> FrozenGreedyPolicy:
+        """
+        compiles the greedy policy of the agent into a read only policy, to be used once
+        training is done
+
+        :param states: states to be covered by the policy, defaults to every state the agent knows
+        :return: a FrozenGreedyPolicy
+        """
+        return self.q.freeze(states)
+
+    def _track_evictions(self) -> None:
+        """
+        has the agent forget the states evicted from its Q table, whenever it is a
+        BoundedQTable. Agents call this once their Q table and policy are set
+
+        :raises TypeError: whenever the agent keeps rows and its Q table is bounded
+        """
+        if not isinstance(self.q, BoundedQTable):
+            return
+        if self.keeps_rows:
+            raise TypeError(
+                f"{type(self).__name__} keeps data by row of its Q table, so the table can't "
+                f"be bounded"
+            )
+        self.q.add_eviction_listener(self._forget)
+
+    def _forget(self, state: State, row: int) -> None:
+        """
+        drops what the agent knows about a state evicted from its Q table
+        """
+        self.visited_states.discard(state)
+        self.policy.remove(state)
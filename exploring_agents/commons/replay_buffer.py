@@ -0,0 +1,163 @@
+import numpy as np
+
+from utils.q_table import QTable
+
+
+class ReplayBuffer:
+    def __init__(
+        self,
+        capacity: int = 10000,
+        prioritized: bool = False,
+        priority_exponent: float = 0.6,
+        min_priority: float = 1e-3,
+        importance_exponent: float = 0.4,
+        importance_exponent_increment: float = 1e-4,
+    ):
+        """
+        Fixed size memory of past transitions, used to learn from them more than once.
+
+        Transitions are stored as integers, the rows and columns of a QTable, in preallocated
+        arrays. Once full the oldest transitions are overwritten.
+
+        Prioritized sampling changes the distribution updates are averaged over, which biases
+        them. Importance sampling weights correct this, fully once importance_exponent reaches
+        1, which it does by growing a little every time the buffer is sampled.
+
+        :param capacity: max number of transitions to be kept
+        :param prioritized: whether transitions with larger td errors should be sampled more often
+        :param priority_exponent: how much priorities matter, 0 means uniform sampling
+        :param min_priority: smallest priority a transition can have, so all of them can be sampled
+        :param importance_exponent: how much of the bias of prioritized sampling is corrected
+        :param importance_exponent_increment: how much importance_exponent grows with each sample,
+            up to 1
+        """
+        self.capacity = capacity
+        self.prioritized = prioritized
+        self.priority_exponent = priority_exponent
+        self.min_priority = min_priority
+        self.importance_exponent = importance_exponent
+        self.importance_exponent_increment = importance_exponent_increment
+        self.rows = np.zeros(capacity, dtype=np.int64)
+        self.cols = np.zeros(capacity, dtype=np.int64)
+        self.rewards = np.zeros(capacity)
+        self.next_rows = np.zeros(capacity, dtype=np.int64)
+        self.priorities = np.zeros(capacity)
+        self._position = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, row: int, col: int, reward: float, next_row: int) -> None:
+        """
+        Stores a transition, new transitions get the highest priority so they are seen soon.
+
+        :param row: row of the state where the action was taken
+        :param col: column of the action taken
+        :param reward: reward received
+        :param next_row: row of the state reached
+        """
+        i = self._position
+        self.rows[i] = row
+        self.cols[i] = col
+        self.rewards[i] = reward
+        self.next_rows[i] = next_row
+        self.priorities[i] = (
+            self.priorities[: self._size].max(initial=1) if self.prioritized else 1
+        )
+        self._position = (i + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+
+    def remove_row(self, row: int) -> None:
+        """
+        Drops the transitions from or to a row, used when the row is taken over by another
+        state(see BoundedQTable). The remaining transitions keep their order.
+
+        :param row: the row whose transitions should be dropped
+        """
+        n = self._size
+        # oldest first, the buffer wraps around once it is full
+        order = np.arange(n)
+        if n == self.capacity:
+            order = np.roll(order, -self._position)
+        keep = order[(self.rows[order] != row) & (self.next_rows[order] != row)]
+        if len(keep) == n:
+            return
+
+        for x in (self.rows, self.cols, self.rewards, self.next_rows, self.priorities):
+            x[: len(keep)] = x[keep]
+        self._size = len(keep)
+        self._position = self._size % self.capacity
+
+    def sample(self, batch_size: int) -> np.ndarray:
+        """
+        Samples transitions, with replacement.
+
+        :param batch_size: number of transitions to be sampled
+        :return: indexes of the sampled transitions
+        """
+        if not self.prioritized:
+            return np.random.randint(0, self._size, batch_size)
+        indexes = np.random.choice(self._size, batch_size, p=self._probabilities())
+        self.importance_exponent = min(
+            1.0, self.importance_exponent + self.importance_exponent_increment
+        )
+        return indexes
+
+    def importance_weights(self, indexes: np.ndarray) -> np.ndarray:
+        """
+        Gets the weights that make updates from prioritized samples unbiased:
+        (N * P(i)) ** -importance_exponent, scaled so the largest one in the batch is 1.
+
+        :param indexes: the sampled transitions
+        :return: the weight of each transition, all of them 1 when sampling is uniform
+        """
+        if not self.prioritized:
+            return np.ones(len(indexes))
+        weights = (self._size * self._probabilities()[indexes]) ** (
+            -self.importance_exponent
+        )
+        return weights / weights.max()
+
+    def _probabilities(self) -> np.ndarray:
+        p = self.priorities[: self._size] ** self.priority_exponent
+        return p / p.sum()
+
+    def update_priorities(self, indexes: np.ndarray, td_errors: np.ndarray) -> None:
+        self.priorities[indexes] = np.maximum(np.abs(td_errors), self.min_priority)
+
+
+def batch_q_update(
+    q: QTable,
+    buffer: ReplayBuffer,
+    indexes: np.ndarray,
+    alpha: float,
+    gamma: float,
+    weights: np.ndarray = None,
+) -> np.ndarray:
+    """
+    Applies the q-learning update of many transitions at once. All td errors are computed
+    with the values from before the update, entries sampled more than once are updated with
+    the mean of their td errors, so the learning rate doesn't grow with repetitions.
+
+    :param q: the Q function to be updated
+    :param buffer: where transitions are stored
+    :param indexes: transitions to learn from
+    :param alpha: learning rate
+    :param gamma: discount factor
+    :param weights: importance sampling weights of the transitions, see
+        ReplayBuffer.importance_weights
+    :return: the td error of each transition
+    """
+    rows, cols = buffer.rows[indexes], buffer.cols[indexes]
+    td_errors = (
+        buffer.rewards[indexes]
+        + gamma * q.best_values(buffer.next_rows[indexes])
+        - q.array[rows, cols]
+    )
+    _, inverse, counts = np.unique(
+        rows * len(q.actions) + cols, return_inverse=True, return_counts=True
+    )
+    deltas = td_errors if weights is None else weights * td_errors
+    q.add_at(rows, cols, alpha * deltas / counts[inverse])
+    return td_errors
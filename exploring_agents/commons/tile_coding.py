@@ -0,0 +1,137 @@
+from typing import Callable, Final, Sequence
+
+import numpy as np
+
+from abstractions import Action, State
+from grid_world.state import GWorldState, TagState
+
+# large primes used to hash tiles into memory
+_HASH_PRIMES: Final = np.array(
+    [2654435761, 2246822519, 3266489917, 668265263, 374761393, 1181783497],
+    dtype=np.int64,
+)
+
+
+def coordinate_features(state: State) -> tuple[int, ...]:
+    """
+    Gets the coordinates of the agents in a grid world or tag state.
+
+    :param state: a GWorldState or a TagState
+    :return: the coordinates as a flat tuple
+    """
+    if isinstance(state, GWorldState):
+        return state.coordinates
+    elif isinstance(state, TagState):
+        return (
+            *getattr(state.coordinates_1, "coordinates", state.coordinates_1),
+            *getattr(state.coordinates_2, "coordinates", state.coordinates_2),
+        )
+    raise ValueError(f"can't get coordinates of state: {state}")
+
+
+class TileCoder:
+    def __init__(
+        self,
+        n_tilings: int = 8,
+        tile_width: float = 4,
+        memory_size: int = 4096,
+    ):
+        """
+        Maps points into the tiles containing them, one for each of several overlapping
+        tilings, each offset from the others by a fraction of the tile width. Nearby points share
+        most of their tiles, which lets values learned for one generalize to the others.
+
+        Tiles are hashed into a fixed memory, so memory depends only on memory_size, not on how
+        far points spread. Collisions are rare as long as memory is larger than the number of
+        tiles visited.
+
+        :param n_tilings: number of tilings, which is the number of active features of a point
+        :param tile_width: width of the tiles in every dimension
+        :param memory_size: number of features points are hashed into
+        """
+        self.n_tilings: Final = n_tilings
+        self.tile_width: Final = tile_width
+        self.memory_size: Final = memory_size
+        self._offsets: dict[int, np.ndarray] = {}
+
+    def _get_offsets(self, dimensions: int) -> np.ndarray:
+        if dimensions > len(_HASH_PRIMES) - 1:
+            raise ValueError(
+                f"at most {len(_HASH_PRIMES) - 1} dimensions are supported"
+            )
+        if (offsets := self._offsets.get(dimensions)) is None:
+            # asymmetric displacements(1, 3, 5, ...) avoid tilings aligned along diagonals
+            displacement = 2 * np.arange(dimensions) + 1
+            offsets = self._offsets[dimensions] = (
+                np.arange(self.n_tilings)[:, None]
+                * displacement[None, :]
+                * (self.tile_width / self.n_tilings)
+            ) % self.tile_width
+        return offsets
+
+    def __call__(self, point: Sequence[float]) -> np.ndarray:
+        """
+        Gets the active features of a point.
+
+        :param point: the coordinates of the point
+        :return: array with the index of the active feature of each tiling
+        """
+        point = np.asarray(point, dtype=float)
+        tiles = np.floor(
+            (point[None, :] + self._get_offsets(len(point))) / self.tile_width
+        ).astype(np.int64)
+        hashed = (
+            np.arange(self.n_tilings) * _HASH_PRIMES[0]
+            + tiles @ _HASH_PRIMES[1 : len(point) + 1]
+        )
+        return hashed % self.memory_size
+
+
+class TiledQFunction:
+    def __init__(
+        self,
+        actions: tuple[Action, ...],
+        tile_coder: TileCoder,
+        features: Callable[[State], Sequence[float]] = None,
+        q_0: float = 0,
+    ):
+        """
+        A linear approximation of the values of state-action pairs over tile coded features.
+        The value of a pair is the sum of the weights of the active features of the state, so
+        weights take a fixed (memory_size, A) array, regardless of the number of states.
+
+        :param actions: actions available, these index the columns of the weights
+        :param tile_coder: maps features of states into active features
+        :param features: maps states into points to be tile coded, defaults to their coordinates
+        :param q_0: initial value of every state-action pair
+        """
+        self.actions: Final = actions
+        self.action_index: Final = {a: i for i, a in enumerate(actions)}
+        self.tile_coder: Final = tile_coder
+        self.features = features if features is not None else coordinate_features
+        self.weights = np.full(
+            (tile_coder.memory_size, len(actions)), q_0 / tile_coder.n_tilings
+        )
+
+    def active_features(self, state: State) -> np.ndarray:
+        return self.tile_coder(self.features(state))
+
+    def values(self, state: State) -> np.ndarray:
+        """
+        Gets the values of every action in a state.
+        """
+        return self.weights[self.active_features(state)].sum(axis=0)
+
+    def add(self, active_features: np.ndarray, action: Action, delta: float) -> None:
+        """
+        Moves the value of a state-action pair by delta.
+
+        :param active_features: the active features of the state
+        :param action: the action
+        :param delta: how much the value should change
+        """
+        np.add.at(
+            self.weights,
+            (active_features, self.action_index[action]),
+            delta / len(active_features),
+        )
@@ -0,0 +1,74 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from abstractions import Action, Effect, RewardFunction, State
+
+
+@dataclass(frozen=True)
+class TransitionBatch:
+    """
+    A contiguous sequence of transitions, as generated by some behaviour policy. States and
+    actions are stored once, and transitions refer to them by index, so many learners can
+    consume the same batch, each mapping it to its own Q table with a single lookup.
+
+    :param states: distinct states referred to by the batch
+    :param actions: actions referred to by the batch
+    :param state_ids: for each transition, the index of the state where it started
+    :param action_ids: for each transition, the index of the action taken
+    :param effects: for each transition, the effect observed
+    :param next_state_ids: for each transition, the index of the state where it ended
+    """
+
+    states: tuple[State, ...]
+    actions: tuple[Action, ...]
+    state_ids: np.ndarray
+    action_ids: np.ndarray
+    effects: np.ndarray
+    next_state_ids: np.ndarray
+
+    @staticmethod
+    def from_episode(
+        episode_states: list[State],
+        episode_actions: list[Action],
+        episode_effects: list[Effect],
+        actions: tuple[Action, ...],
+    ) -> "TransitionBatch":
+        """
+        Builds a batch from an episode, in the format returned by run_episode.
+
+        :param episode_states: the visited states, including the last one
+        :param episode_actions: the actions taken
+        :param episode_effects: the effects observed after each action
+        :param actions: actions available to the behaviour policy
+        :return: a batch with all transitions of the episode
+        """
+        state_index: dict[State, int] = {}
+        ids = np.fromiter(
+            (state_index.setdefault(s, len(state_index)) for s in episode_states),
+            dtype=np.int64,
+            count=len(episode_states),
+        )
+        action_index = {a: i for i, a in enumerate(actions)}
+        return TransitionBatch(
+            states=tuple(state_index),
+            actions=tuple(actions),
+            state_ids=ids[:-1],
+            action_ids=np.array([action_index[a] for a in episode_actions], np.int64),
+            effects=np.asarray(episode_effects, dtype=np.int64),
+            next_state_ids=ids[1:],
+        )
+
+    def __len__(self) -> int:
+        return len(self.state_ids)
+
+    def rewards(self, reward_function: RewardFunction) -> np.ndarray:
+        """
+        Gets the reward of every transition, the reward function is called once for each
+        distinct effect.
+
+        :param reward_function: the reward function of the learner
+        :return: array of rewards
+        """
+        effects, inverse = np.unique(self.effects, return_inverse=True)
+        return np.array([reward_function(e) for e in effects.tolist()])[inverse]
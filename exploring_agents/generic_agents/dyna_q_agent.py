@@ -0,0 +1,155 @@
+import heapq
+import time
+from itertools import count
+from typing import Final
+
+from abstractions import RewardFunction, Action, DecayFunction, State, Effect, Q
+from exploring_agents.commons.q_table_agent import QTableAgent
+from policies import EpsilonGreedy
+from utils.policy import get_best_action_from_q, sample_action
+from utils.q_table import QTable, as_q_table
+
+
+class DynaQAgent(QTableAgent):
+    keeps_rows = True
+
+    def __init__(
+        self,
+        reward_function: RewardFunction,
+        actions: tuple[Action, ...],
+        gamma: float = 1,
+        alpha: float = 0.1,
+        epsilon: float = 0.1,
+        planning_steps: int = 10,
+        planning_time: float = None,
+        priority_threshold: float = 1e-4,
+        epsilon_decay: DecayFunction = None,
+        alpha_decay: DecayFunction = None,
+        q_0: Q = None,
+    ):
+        """
+        Agent implementing Dyna-Q with prioritized sweeping. Besides updating its Q function like q-learning, it
+        learns a model of the world: the last state and effect observed for each state-action pair. After every
+        action it uses this model to run planning updates, starting from the state-action pairs whose values are
+        expected to change the most, and moving backwards to their predecessors.
+
+        The model assumes the world is deterministic, in stochastic worlds the last outcome is used.
+
+        :param reward_function: the reward function we are trying to maximize
+        :param actions: actions available to the agent
+        :param gamma: the gamma discount value to be used when calculating episode returns
+        :param alpha: learning rate
+        :param epsilon: exploration rate to be considered when building policies
+        :param planning_steps: max number of planning updates after every action
+        :param planning_time: optional max time in seconds to be spent planning after every action
+        :param priority_threshold: state-action pairs are only queued for planning if their update is larger than this
+        :param epsilon_decay: a rule to decay the epsilon parameter.
+        :param alpha_decay: a rule to decay the alpha parameter.
+        :param q_0: initial estimates of state-action values, will be considered as a constant 0 if not provided
+        """
+
+        self.reward_function: Final = reward_function
+        self.policy: EpsilonGreedy = EpsilonGreedy(epsilon, actions, epsilon_decay)
+        self.actions: Final = actions
+        self.gamma = gamma
+        self.alpha = alpha
+        self.planning_steps = planning_steps
+        self.planning_time = planning_time
+        self.priority_threshold = priority_threshold
+        self.q: QTable = as_q_table(q_0, actions)
+        self._track_evictions()
+        self.alpha_decay = alpha_decay if alpha_decay is not None else (lambda x: x)
+
+        self.model: dict[tuple[State, Action], tuple[State, Effect]] = {}
+        self.predecessors: dict[State, set[tuple[State, Action]]] = {}
+        self._queue: list[tuple[float, int, tuple[State, Action]]] = []
+        self._queued_priorities: dict[tuple[State, Action], float] = {}
+        self._counter = count()
+
+        for state in self.q.states:
+            self.policy.update(
+                state, get_best_action_from_q(self.q, state, self.actions)
+            )
+
+    def select_action(self, state: State) -> Action:
+        return sample_action(self.policy, state, self.actions)
+
+    def run_update(
+        self, state: State, action: Action, effect: Effect, next_state: State
+    ) -> float:
+        reward = self.reward_function(effect)
+
+        # learn the model of the world
+        self.model[state, action] = (next_state, effect)
+        self.predecessors.setdefault(next_state, set()).add((state, action))
+
+        # learn from what happened
+        self._backup(state, action, next_state, reward)
+
+        # learn from what we expect to happen
+        self._plan()
+
+        return reward
+
+    def finalize_episode(
+        self,
+        episode_states: list[State],
+        episode_returns: list[float],
+        episode_actions: list[Action],
+    ):
+        self.policy.decay()
+        self.alpha = self.alpha_decay(self.alpha)
+
+    def _backup(
+        self, state: State, action: Action, next_state: State, reward: float
+    ) -> None:
+        """
+        Runs a q-learning update, and queues the predecessors of the updated state.
+        """
+        cur_q = self.q.get((state, action), 0)
+        self.q[state, action] = cur_q + self.alpha * (
+            reward + self.gamma * self.q.best_value(next_state) - cur_q
+        )
+        self.policy.update(state, self.q.best_action(state))
+
+        # the value of state may have changed, so the pairs leading to it may need updates
+        state_value = self.q.best_value(state)
+        for sa in self.predecessors.get(state, ()):
+            _, sa_effect = self.model[sa]
+            self._push(
+                sa,
+                abs(
+                    self.reward_function(sa_effect)
+                    + self.gamma * state_value
+                    - self.q.get(sa, 0)
+                ),
+            )
+
+    def _plan(self) -> None:
+        """
+        Runs planning updates from the queue, until it is empty or we run out of steps or time.
+        """
+        deadline = (
+            time.perf_counter() + self.planning_time
+            if self.planning_time is not None
+            else None
+        )
+        steps = 0
+        while self._queue and steps < self.planning_steps:
+            if deadline is not None and time.perf_counter() > deadline:
+                break
+            priority, _, sa = heapq.heappop(self._queue)
+            if self._queued_priorities.get(sa) != -priority:
+                # this entry was superseded by one with a higher priority
+                continue
+            del self._queued_priorities[sa]
+            next_state, effect = self.model[sa]
+            self._backup(*sa, next_state, self.reward_function(effect))
+            steps += 1
+
+    def _push(self, sa: tuple[State, Action], priority: float) -> None:
+        if priority <= self.priority_threshold:
+            return
+        if priority > self._queued_priorities.get(sa, 0):
+            self._queued_priorities[sa] = priority
+            heapq.heappush(self._queue, (-priority, next(self._counter), sa))
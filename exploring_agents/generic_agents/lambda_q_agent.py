@@ -1,7 +1,11 @@
 from typing import Final
 
-from abstractions import Agent, RewardFunction, Action, DecayFunction, State, Effect, Q
+import numpy as np
+
+from abstractions import RewardFunction, Action, DecayFunction, State, Effect, Q
 from exploring_agents.commons.eligibility_trace import EligibilityTrace
+from exploring_agents.commons.q_table_agent import QTableAgent
+from exploring_agents.commons.transition_batch import TransitionBatch
 from policies import EpsilonGreedy
 from utils.evaluators import best_q_value
 from utils.policy import (
@@ -9,9 +13,12 @@ from utils.policy import (
     sample_action_and_exploration,
     sample_action,
 )
+from utils.q_table import QTable, as_q_table
+
 
+class LambdaQAgent(QTableAgent):
+    keeps_rows = True
 
-class LambdaQAgent(Agent):
     def __init__(
         self,
         reward_function: RewardFunction,
@@ -21,6 +28,7 @@ class LambdaQAgent(Agent):
         epsilon: float = 0.1,
         et_lambda: float = 0.5,
         et_kind: str = "accumulating",
+        et_threshold: float = 1e-8,
         epsilon_decay: DecayFunction = None,
         alpha_decay: DecayFunction = None,
         lambda_decay: DecayFunction = None,
@@ -35,6 +43,9 @@ class LambdaQAgent(Agent):
         :param gamma: the gamma discount value to be used when calculating episode returns
         :param alpha: learning rate
         :param epsilon: exploration rate to be considered when building policies
+        :param et_lambda: the lambda parameter of eligibility traces
+        :param et_kind: kind of eligibility trace, one of: accumulating, dutch, replacing
+        :param et_threshold: eligibility traces smaller than this are dropped
         :param epsilon_decay: a rule to decay the epsilon parameter.
         :param alpha_decay: a rule to decay the alpha parameter.
         :param lambda_decay: a rule to decay the lambda parameter.
@@ -48,13 +59,18 @@ class LambdaQAgent(Agent):
         self.alpha = alpha
         self.et_lambda = et_lambda
         self.et_kind = et_kind
-        self.q: Q = q_0 if q_0 is not None else {}
+        self.q: QTable = as_q_table(q_0, actions)
+        self._track_evictions()
         self.alpha_decay = alpha_decay if alpha_decay is not None else (lambda x: x)
         self.lambda_decay = lambda_decay if lambda_decay is not None else (lambda x: x)
-        self.visited_states: set[State] = set(x for (x, a) in self.q.keys())
+        self.visited_states: set[State] = set(self.q.states)
         self.next_action = None
         self.eligibility_trace = EligibilityTrace(
-            et_lambda=self.et_lambda, gamma=self.gamma, kind=self.et_kind, alpha=alpha
+            et_lambda=self.et_lambda,
+            gamma=self.gamma,
+            kind=self.et_kind,
+            alpha=alpha,
+            threshold=et_threshold,
         )
 
         for state in self.visited_states:
@@ -83,8 +99,57 @@ class LambdaQAgent(Agent):
     def run_update(
         self, state: State, action: Action, effect: Effect, next_state: State
     ) -> float:
-        self.eligibility_trace.visited_arguments_update(state, action)
         reward = self.reward_function(effect)
+        self._learn(state, action, reward, next_state)
+
+        # update traces: look ahead to see if we will explore
+        self.next_action, has_explored = sample_action_and_exploration(
+            self.policy, next_state, self.actions
+        )
+        if has_explored:
+            # if so we reset everything
+            self.eligibility_trace.reset()
+        else:
+            # we just update the traces
+            self.eligibility_trace.update()
+
+        return reward
+
+    def learn_from_batch(self, batch: TransitionBatch) -> np.ndarray:
+        """
+        Learns off-policy from transitions generated by some other agent. Traces are kept while
+        the actions in the batch follow the greedy policy of this agent, and reset otherwise.
+
+        :param batch: a contiguous sequence of transitions to learn from
+        :return: the rewards determined by the agent
+        """
+        rewards = batch.rewards(self.reward_function)
+        state_ids = batch.state_ids.tolist()
+        action_ids = batch.action_ids.tolist()
+        next_state_ids = batch.next_state_ids.tolist()
+
+        for t, reward in enumerate(rewards.tolist()):
+            state, action = batch.states[state_ids[t]], batch.actions[action_ids[t]]
+            next_state = batch.states[next_state_ids[t]]
+            self._learn(state, action, reward, next_state)
+
+            if t + 1 < len(batch) and self.q.get(
+                (next_state, batch.actions[action_ids[t + 1]]), 0
+            ) >= best_q_value(self.q, next_state, self.actions):
+                self.eligibility_trace.update()
+            else:
+                self.eligibility_trace.reset()
+
+        return rewards
+
+    def _learn(
+        self, state: State, action: Action, reward: float, next_state: State
+    ) -> None:
+        """
+        Runs a q-learning update over all pairs with eligibility traces, and updates the policy
+        of their states.
+        """
+        self.eligibility_trace.visited_arguments_update(state, action)
 
         # learn from what happened
         delta = (
@@ -93,30 +158,17 @@ class LambdaQAgent(Agent):
             - self.q.get((state, action), 0)
         )
         update_dict = {
-            sap: self.q.get(sap, 0) + self.alpha * delta * self.eligibility_trace(*sap)
-            for sap in self.eligibility_trace.get_relevant_arguments()
+            sap: self.q.get(sap, 0) + self.alpha * delta * trace
+            for sap, trace in self.eligibility_trace.items()
         }
         self.q.update(update_dict)
 
         # improve from what was learned
-        for cur_state in {state for state, actiongi in update_dict.keys()}:
+        for cur_state in {state for state, _ in update_dict.keys()}:
             self.policy.update(
                 cur_state, get_best_action_from_q(self.q, cur_state, self.actions)
             )
 
-        # update traces: look ahead to see if we will explore
-        self.next_action, has_explored = sample_action_and_exploration(
-            self.policy, next_state, self.actions
-        )
-        if has_explored:
-            # if so we reset everything
-            self.eligibility_trace.reset()
-        else:
-            # we just update the traces
-            self.eligibility_trace.update()
-
-        return reward
-
     def finalize_episode(
         self,
         episode_states: list[State],
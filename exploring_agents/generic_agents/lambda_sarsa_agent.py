@@ -1,12 +1,16 @@
 from typing import Final
 
-from abstractions import Agent, RewardFunction, Action, DecayFunction, State, Effect, Q
+from abstractions import RewardFunction, Action, DecayFunction, State, Effect, Q
 from exploring_agents.commons.eligibility_trace import EligibilityTrace
+from exploring_agents.commons.q_table_agent import QTableAgent
 from policies import EpsilonGreedy
 from utils.policy import get_best_action_from_q, sample_action
+from utils.q_table import QTable, as_q_table
 
 
-class LambdaSarsaAgent(Agent):
+class LambdaSarsaAgent(QTableAgent):
+    keeps_rows = True
+
     def __init__(
         self,
         reward_function: RewardFunction,
@@ -16,6 +20,7 @@ class LambdaSarsaAgent(Agent):
         epsilon: float = 0.1,
         et_lambda: float = 0.5,
         et_kind: str = "accumulating",
+        et_threshold: float = 1e-8,
         epsilon_decay: DecayFunction = None,
         alpha_decay: DecayFunction = None,
         lambda_decay: DecayFunction = None,
@@ -30,6 +35,9 @@ class LambdaSarsaAgent(Agent):
         :param gamma: the gamma discount value to be used when calculating episode returns
         :param alpha: learning rate
         :param epsilon: exploration rate to be considered when building policies
+        :param et_lambda: the lambda parameter of eligibility traces
+        :param et_kind: kind of eligibility trace, one of: accumulating, dutch, replacing
+        :param et_threshold: eligibility traces smaller than this are dropped
         :param epsilon_decay: a rule to decay the epsilon parameter.
         :param alpha_decay: a rule to decay the alpha parameter.
         :param lambda_decay: a rule to decay the lambda parameter.
@@ -43,7 +51,8 @@ class LambdaSarsaAgent(Agent):
         self.alpha = alpha
         self.et_lambda = et_lambda
         self.et_kind = et_kind
-        self.q: Q = q_0 if q_0 is not None else {}
+        self.q: QTable = as_q_table(q_0, actions)
+        self._track_evictions()
         self.alpha_decay = alpha_decay if alpha_decay is not None else (lambda x: x)
         self.lambda_decay = lambda_decay if lambda_decay is not None else (lambda x: x)
         self.next_action: [None, Action] = None
@@ -52,9 +61,10 @@ class LambdaSarsaAgent(Agent):
             gamma=self.gamma,
             kind=self.et_kind,
             alpha=self.alpha,
+            threshold=et_threshold,
         )
 
-        for state in set(x for (x, a) in self.q.keys()):
+        for state in self.q.states:
             self.policy.update(
                 state, get_best_action_from_q(self.q, state, self.actions)
             )
@@ -91,8 +101,8 @@ class LambdaSarsaAgent(Agent):
             - self.q.get((state, action), 0)
         )
         update_dict = {
-            sap: self.q.get(sap, 0) + self.alpha * delta * self.eligibility_trace(*sap)
-            for sap in self.eligibility_trace.get_relevant_arguments()
+            sap: self.q.get(sap, 0) + self.alpha * delta * trace
+            for sap, trace in self.eligibility_trace.items()
         }
         self.q.update(update_dict)
 
@@ -1,12 +1,18 @@
 from typing import Final
 
-from abstractions import Agent, RewardFunction, Action, DecayFunction, State, Effect, Q
+import numpy as np
+
+from abstractions import RewardFunction, Action, DecayFunction, State, Effect, Q
+from exploring_agents.commons.q_table_agent import QTableAgent
 from policies import EpsilonGreedy
 from utils.policy import get_best_action_from_q, sample_action
-from utils.returns import first_visit_return
+from utils.returns import first_visit_indexes
+from utils.q_table import QTable, as_q_table
+
 
+class MonteCarloAgent(QTableAgent):
+    keeps_rows = True
 
-class MonteCarloAgent(Agent):
     def __init__(
         self,
         reward_function: RewardFunction,
@@ -34,10 +40,12 @@ class MonteCarloAgent(Agent):
         self.policy: EpsilonGreedy = EpsilonGreedy(epsilon, actions, epsilon_decay)
         self.gamma = gamma
         self.max_steps = max_steps
-        self.q: Q = q_0 if q_0 is not None else {}
-        self.u: dict[tuple[State, Action], int] = {}
+        self.q: QTable = as_q_table(q_0, actions)
+        self._track_evictions()
+        # number of first visits of each state-action pair, aligned with the rows of q
+        self.u: np.ndarray = np.zeros((self.q.capacity, len(actions)), dtype=np.int64)
         self.episode_terminated: bool = False
-        self.visited_states: set[State] = set(x for (x, a) in self.q.keys())
+        self.visited_states: set[State] = set(self.q.states)
 
         for state in self.visited_states:
             self.policy.update(
@@ -63,27 +71,47 @@ class MonteCarloAgent(Agent):
         episode_actions: list[Action],
     ):
         # learn from what happened
-        fvr = first_visit_return(episode_states, episode_actions, episode_returns)
-        self._update_q(fvr)
+        rows = self._update_q(episode_states, episode_returns, episode_actions)
 
-        # improve from what we learned
-        for cur_state in self.visited_states:
-            self.policy.update(
-                cur_state, get_best_action_from_q(self.q, cur_state, self.actions)
-            )
+        # improve from what we learned, only states from this episode changed
+        for row in np.unique(rows).tolist():
+            cur_state = self.q.states[row]
+            self.policy.update(cur_state, self.q.best_action(cur_state))
 
         self.policy.decay()
 
-    def _update_q(self, fvr: dict[tuple[State, Action], float]):
+    def _update_q(
+        self,
+        episode_states: list[State],
+        episode_returns: list[float],
+        episode_actions: list[Action],
+    ) -> np.ndarray:
         """
-        method to update Q estimates based on the first visit returns.
+        method to update Q estimates based on the first visit returns of an episode.
         This will make changes inplace on the agent Q function
 
-        :param fvr: returns from first visits
+        :param episode_states: states of the episode
+        :param episode_returns: returns of the episode
+        :param episode_actions: actions of the episode
+        :return: rows of q that were updated
         """
+        n = len(episode_returns)
+        rows = self.q.rows(episode_states[:n])
+        cols = np.fromiter(
+            (self.q.action_index[a] for a in episode_actions[:n]), dtype=np.int64
+        )
+        first = first_visit_indexes(rows * len(self.actions) + cols)
+        rows, cols = rows[first], cols[first]
+
+        if self.q.capacity > len(self.u):
+            new_rows = self.q.capacity - len(self.u)
+            self.u = np.concatenate(
+                [self.u, np.zeros((new_rows, len(self.actions)), dtype=np.int64)]
+            )
+        self.u[rows, cols] += 1
+
+        cur_q = self.q.array[rows, cols]
+        returns = np.asarray(episode_returns, dtype=float)[first]
+        self.q.set_entries(rows, cols, cur_q + (returns - cur_q) / self.u[rows, cols])
 
-        for s, a in fvr:
-            self.u[s, a] = self.u.get((s, a), 0) + 1
-            self.q[s, a] = self.q.get((s, a), 0) + (
-                fvr[s, a] - self.q.get((s, a), 0)
-            ) / self.u.get((s, a), 0)
+        return rows
@@ -1,12 +1,25 @@
 from typing import Final
 
-from abstractions import Agent, RewardFunction, Action, DecayFunction, State, Effect, Q
+import numpy as np
+
+from abstractions import (
+    RewardFunction,
+    Action,
+    DecayFunction,
+    State,
+    Effect,
+    Q,
+    Policy,
+)
+from exploring_agents.commons.q_table_agent import QTableAgent
+from exploring_agents.commons.replay_buffer import ReplayBuffer, batch_q_update
+from exploring_agents.commons.transition_batch import TransitionBatch
 from policies import EpsilonGreedy
-from utils.evaluators import best_q_value
 from utils.policy import get_best_action_from_q, sample_action
+from utils.q_table import QTable, as_q_table
 
 
-class QAgent(Agent):
+class QAgent(QTableAgent):
     def __init__(
         self,
         reward_function: RewardFunction,
@@ -17,6 +30,9 @@ class QAgent(Agent):
         epsilon_decay: DecayFunction = None,
         alpha_decay: DecayFunction = None,
         q_0: Q = None,
+        policy: Policy = None,
+        replay_buffer: ReplayBuffer = None,
+        replay_batch_size: int = 32,
     ):
         """
         Agent implementing a solution based on estimating the value of state-action pairs. It updates values after
@@ -30,22 +46,36 @@ class QAgent(Agent):
         :param epsilon: exploration rate to be considered when building policies
         :param epsilon_decay: a rule to decay the epsilon parameter.
         :param alpha_decay: a rule to decay the alpha parameter.
-        :param q_0: initial estimates of state-action values, will be considered as a constant 0 if not provided
+        :param q_0: initial estimates of state-action values, will be considered as a constant 0 if not provided. A
+            BoundedQTable can be given to bound the memory of the agent
+        :param policy: policy to be followed instead of epsilon greedy, like a CountBasedPolicy. Count based
+            policies without a Q table get the agent's one
+        :param replay_buffer: optional memory of past transitions, if provided the agent also learns from a batch of
+            them after every action
+        :param replay_batch_size: number of past transitions to learn from after every action
         """
 
         self.reward_function: Final = reward_function
-        self.policy: EpsilonGreedy = EpsilonGreedy(epsilon, actions, epsilon_decay)
+        self.policy: Policy = (
+            policy
+            if policy is not None
+            else EpsilonGreedy(epsilon, actions, epsilon_decay)
+        )
         self.actions: Final = actions
         self.gamma = gamma
         self.alpha = alpha
-        self.q: Q = q_0 if q_0 is not None else {}
+        self.q: QTable = as_q_table(q_0, actions)
         self.alpha_decay = alpha_decay if alpha_decay is not None else (lambda x: x)
-        self.visited_states: set[State] = set(x for (x, a) in self.q.keys())
+        self.policy.bind(self.q)
+        self.visited_states: set[State] = set(self.q.states)
+        self.replay_buffer = replay_buffer
+        self.replay_batch_size = replay_batch_size
 
         for state in self.visited_states:
             self.policy.update(
                 state, get_best_action_from_q(self.q, state, self.actions)
             )
+        self._track_evictions()
 
     def select_action(self, state: State) -> Action:
         return sample_action(self.policy, state, self.actions)
@@ -54,19 +84,81 @@ class QAgent(Agent):
         self, state: State, action: Action, effect: Effect, next_state: State
     ) -> float:
         reward = self.reward_function(effect)
+        self._learn(state, action, reward, next_state)
+        return reward
+
+    def learn_from_batch(self, batch: TransitionBatch) -> np.ndarray:
+        """
+        Learns off-policy from transitions generated by some other agent, running the same
+        updates as run_update, in order.
+
+        :param batch: the transitions to learn from
+        :return: the rewards determined by the agent
+        """
+        rewards = batch.rewards(self.reward_function)
+        for i, j, reward, k in zip(
+            batch.state_ids.tolist(),
+            batch.action_ids.tolist(),
+            rewards.tolist(),
+            batch.next_state_ids.tolist(),
+        ):
+            state, action, next_state = (
+                batch.states[i],
+                batch.actions[j],
+                batch.states[k],
+            )
+            self._learn(state, action, reward, next_state)
+        return rewards
+
+    def _learn(
+        self, state: State, action: Action, reward: float, next_state: State
+    ) -> None:
+        """
+        Runs the q-learning update of a transition, updates the policy of its state, and
+        replays past transitions if there is a replay buffer.
+        """
         self.visited_states.add(next_state)
 
         # learn from what happened
-        self.q[state, action] = self.q.get((state, action), 0) + self.alpha * (
-            reward
-            + self.gamma * best_q_value(self.q, next_state, self.actions)
-            - self.q.get((state, action), 0)
+        cur_q = self.q.get((state, action), 0)
+        self.q[state, action] = cur_q + self.alpha * (
+            reward + self.gamma * self.q.best_value(next_state) - cur_q
         )
 
         # improve from what was learned
-        self.policy.update(state, get_best_action_from_q(self.q, state, self.actions))
+        self.policy.update(state, self.q.best_action(state))
 
-        return reward
+        if self.replay_buffer is not None:
+            self._replay(state, action, reward, next_state)
+
+    def _replay(
+        self, state: State, action: Action, reward: float, next_state: State
+    ) -> None:
+        """
+        Stores a transition and learns from a batch of past ones.
+        """
+        # rows are gotten together, so a bounded table can't evict one for the other
+        row, next_row = self.q.rows((state, next_state)).tolist()
+        self.replay_buffer.add(row, self.q.action_index[action], reward, next_row)
+        indexes = self.replay_buffer.sample(self.replay_batch_size)
+        td_errors = batch_q_update(
+            self.q,
+            self.replay_buffer,
+            indexes,
+            self.alpha,
+            self.gamma,
+            self.replay_buffer.importance_weights(indexes),
+        )
+        self.replay_buffer.update_priorities(indexes, td_errors)
+
+        for row in np.unique(self.replay_buffer.rows[indexes]).tolist():
+            cur_state = self.q.states[row]
+            self.policy.update(cur_state, self.q.best_action(cur_state))
+
+    def _forget(self, state: State, row: int) -> None:
+        super()._forget(state, row)
+        if self.replay_buffer is not None:
+            self.replay_buffer.remove_row(row)
 
     def finalize_episode(
         self,
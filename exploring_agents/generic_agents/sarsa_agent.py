@@ -1,11 +1,21 @@
 from typing import Final
 
-from abstractions import Agent, RewardFunction, Action, DecayFunction, State, Effect, Q
+from abstractions import (
+    RewardFunction,
+    Action,
+    DecayFunction,
+    State,
+    Effect,
+    Q,
+    Policy,
+)
+from exploring_agents.commons.q_table_agent import QTableAgent
 from policies import EpsilonGreedy
 from utils.policy import get_best_action_from_q, sample_action
+from utils.q_table import QTable, as_q_table
 
 
-class SarsaAgent(Agent):
+class SarsaAgent(QTableAgent):
     def __init__(
         self,
         reward_function: RewardFunction,
@@ -16,6 +26,7 @@ class SarsaAgent(Agent):
         epsilon_decay: DecayFunction = None,
         alpha_decay: DecayFunction = None,
         q_0: Q = None,
+        policy: Policy = None,
     ):
         """
         Agent implementing a solution based on estimating the value of state-action pairs. It updates values after
@@ -29,23 +40,32 @@ class SarsaAgent(Agent):
         :param epsilon: exploration rate to be considered when building policies
         :param epsilon_decay: a rule to decay the epsilon parameter.
         :param alpha_decay: a rule to decay the alpha parameter.
-        :param q_0: initial estimates of state-action values, will be considered as a constant 0 if not provided
+        :param q_0: initial estimates of state-action values, will be considered as a constant 0 if not provided. A
+            BoundedQTable can be given to bound the memory of the agent
+        :param policy: policy to be followed instead of epsilon greedy, like a CountBasedPolicy. Count based
+            policies without a Q table get the agent's one
         """
 
         self.reward_function: Final = reward_function
-        self.policy: EpsilonGreedy = EpsilonGreedy(epsilon, actions, epsilon_decay)
+        self.policy: Policy = (
+            policy
+            if policy is not None
+            else EpsilonGreedy(epsilon, actions, epsilon_decay)
+        )
         self.actions: Final = actions
         self.gamma = gamma
         self.alpha = alpha
-        self.q: Q = q_0 if q_0 is not None else {}
+        self.q: QTable = as_q_table(q_0, actions)
         self.alpha_decay = alpha_decay if alpha_decay is not None else (lambda x: x)
-        self.visited_states: set[State] = set(x for (x, a) in self.q.keys())
+        self.policy.bind(self.q)
+        self.visited_states: set[State] = set(self.q.states)
         self.next_action: [None, Action] = None
 
         for state in self.visited_states:
             self.policy.update(
                 state, get_best_action_from_q(self.q, state, self.actions)
             )
+        self._track_evictions()
 
     # overriding the method
     def select_action(self, state: State, use_cached_action: bool = True) -> Action:
@@ -81,7 +101,7 @@ class SarsaAgent(Agent):
         )
 
         # improve from what was learned
-        self.policy.update(state, get_best_action_from_q(self.q, state, self.actions))
+        self.policy.update(state, self.q.best_action(state))
 
         return reward
 
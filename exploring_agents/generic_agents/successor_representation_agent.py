@@ -0,0 +1,147 @@
+from typing import Final
+
+import numpy as np
+
+from abstractions import RewardFunction, Action, DecayFunction, State, Effect
+from exploring_agents.commons.q_table_agent import QTableAgent
+from policies import EpsilonGreedy
+from utils.policy import sample_action
+from utils.q_table import QTable
+
+
+class SuccessorRepresentationAgent(QTableAgent):
+    def __init__(
+        self,
+        reward_function: RewardFunction,
+        actions: tuple[Action, ...],
+        gamma: float = 1,
+        alpha: float = 0.1,
+        epsilon: float = 0.1,
+        terminal_effects: tuple[Effect, ...] = (1,),
+        epsilon_decay: DecayFunction = None,
+        alpha_decay: DecayFunction = None,
+    ):
+        """
+        Agent learning a successor representation: for each state-action pair, the expected
+        discounted number of times each state will be reached afterwards, following the agent
+        policy. This is learned with sarsa like updates, and kept as a (S, A, S) array M.
+
+        Rewards are assumed to depend only on the state reached(as effects do in grid worlds),
+        so Q is the product of M and a vector with the reward of reaching each state. This
+        means the reward function can be swapped at any time, with set_reward_function, and Q
+        is rebuilt with a single matrix product instead of being learned again.
+
+        :param reward_function: the reward function we are trying to maximize
+        :param actions: actions available to the agent
+        :param gamma: the gamma discount value to be used when calculating episode returns
+        :param alpha: learning rate
+        :param epsilon: exploration rate to be considered when building policies
+        :param terminal_effects: effects that end episodes, nothing is expected to be reached
+            after these
+        :param epsilon_decay: a rule to decay the epsilon parameter.
+        :param alpha_decay: a rule to decay the alpha parameter.
+        """
+        self.reward_function = reward_function
+        self.policy: EpsilonGreedy = EpsilonGreedy(epsilon, actions, epsilon_decay)
+        self.actions: Final = actions
+        self.gamma = gamma
+        self.alpha = alpha
+        self.terminal_effects: Final = terminal_effects
+        self.alpha_decay = alpha_decay if alpha_decay is not None else (lambda x: x)
+        self.next_action = None
+
+        # rows of the arrays follow the rows of q
+        self.q: QTable = QTable(actions)
+        self.m = np.zeros((self.q.capacity, len(actions), self.q.capacity))
+        self.state_effects = np.zeros(self.q.capacity)
+        self.state_rewards = np.zeros(self.q.capacity)
+
+    def select_action(self, state: State, use_cached_action: bool = True) -> Action:
+        """
+        selects an action from a state based on the agent policy
+        during training we select the next action to be taken whenever we run an update
+        we can bypass this behaviour with use_cached_action
+
+        :param state: the state to select the action from
+        :param use_cached_action: flag indicating whether we should use pre-selected action
+        :return: the selected action
+        """
+        return (
+            self.next_action
+            if self.next_action is not None and use_cached_action
+            else sample_action(self.policy, state, self.actions)
+        )
+
+    def run_update(
+        self, state: State, action: Action, effect: Effect, next_state: State
+    ) -> float:
+        reward = self.reward_function(effect)
+        self.next_action = sample_action(self.policy, next_state, self.actions)
+        i, k = self.q.row(state), self.q.row(next_state)
+        self._fit_capacity()
+        self.state_effects[k] = effect
+        self.state_rewards[k] = reward
+
+        # learn what we reach from what happened
+        j = self.q.action_index[action]
+        target = -self.m[i, j]
+        target[k] += 1
+        if effect not in self.terminal_effects:
+            target += self.gamma * self.m[k, self.q.action_index[self.next_action]]
+        self.m[i, j] += self.alpha * target
+
+        n = len(self.q.states)
+        self.q[state, action] = float(self.m[i, j, :n] @ self.state_rewards[:n])
+
+        # improve from what was learned
+        self.policy.update(state, self.q.best_action(state))
+
+        return reward
+
+    def set_reward_function(self, reward_function: RewardFunction) -> None:
+        """
+        Changes the reward function of the agent, Q and the policy are rebuilt from the
+        successor representation, so they follow the new rewards right away.
+
+        :param reward_function: the new reward function
+        """
+        self.reward_function = reward_function
+        n = len(self.q.states)
+        effects, inverse = np.unique(self.state_effects[:n], return_inverse=True)
+        self.state_rewards[:n] = np.array(
+            [reward_function(e) for e in effects.tolist()]
+        )[inverse]
+
+        # only entries already in q are rewritten, the rest stay unknown
+        rows, cols = np.nonzero(self.q.known)
+        self.q.set_entries(rows, cols, self.m[rows, cols, :n] @ self.state_rewards[:n])
+        for state in self.q.states:
+            self.policy.update(state, self.q.best_action(state))
+
+    def finalize_episode(
+        self,
+        episode_states: list[State],
+        episode_returns: list[float],
+        episode_actions: list[Action],
+    ):
+        self.next_action = None
+        self.policy.decay()
+        self.alpha = self.alpha_decay(self.alpha)
+
+    def _fit_capacity(self) -> None:
+        """
+        Grows the arrays whenever q outgrows them, so they always have a row for each state.
+        They may be larger than q, like after loading the agent, where q is just large enough
+        for its states.
+        """
+        if (capacity := self.q.capacity) <= (n := self.m.shape[0]):
+            return
+        m = np.zeros((capacity, len(self.actions), capacity))
+        m[:n, :, :n] = self.m
+        self.m = m
+        self.state_effects = np.concatenate(
+            [self.state_effects, np.zeros(capacity - n)]
+        )
+        self.state_rewards = np.concatenate(
+            [self.state_rewards, np.zeros(capacity - n)]
+        )
@@ -0,0 +1,114 @@
+from typing import Callable, Final, Sequence
+
+from abstractions import Agent, RewardFunction, Action, DecayFunction, State, Effect
+from exploring_agents.commons.tile_coding import TileCoder, TiledQFunction
+from policies import QFunctionEpsilonGreedy
+from utils.policy import sample_action
+
+
+class TileCodingAgent(Agent):
+    def __init__(
+        self,
+        reward_function: RewardFunction,
+        actions: tuple[Action, ...],
+        gamma: float = 1,
+        alpha: float = 0.1,
+        epsilon: float = 0.1,
+        method: str = "q_learning",
+        n_tilings: int = 8,
+        tile_width: float = 4,
+        memory_size: int = 2**16,
+        features: Callable[[State], Sequence[float]] = None,
+        terminal_effects: tuple[Effect, ...] = (1,),
+        epsilon_decay: DecayFunction = None,
+        alpha_decay: DecayFunction = None,
+        q_0: float = 0,
+    ):
+        """
+        Agent learning a linear approximation of the Q function, over tile coded features of the
+        states(their coordinates by default). Values learned in a state generalize to the states
+        around it, so the agent doesn't need to visit every state of large worlds, and its memory
+        is fixed by memory_size instead of growing with the number of states.
+
+        :param reward_function: the reward function we are trying to maximize
+        :param actions: actions available to the agent
+        :param gamma: the gamma discount value to be used when calculating episode returns
+        :param alpha: learning rate
+        :param epsilon: exploration rate to be considered when building policies
+        :param method: how the agent learns, one of: q_learning, sarsa
+        :param n_tilings: number of tilings of the tile coder
+        :param tile_width: width of the tiles, the distance over which values generalize
+        :param memory_size: number of features tiles are hashed into
+        :param features: maps states into points to be tile coded, defaults to their coordinates
+        :param terminal_effects: effects that end episodes, we don't bootstrap from the states
+            these lead to, since unlike with tables their values would be generalized from others
+        :param epsilon_decay: a rule to decay the epsilon parameter.
+        :param alpha_decay: a rule to decay the alpha parameter.
+        :param q_0: initial estimate of state-action values
+        """
+        if method not in {"q_learning", "sarsa"}:
+            raise ValueError("method must be one of: q_learning, sarsa")
+
+        self.reward_function: Final = reward_function
+        self.actions: Final = actions
+        self.gamma = gamma
+        self.alpha = alpha
+        self.method: Final = method
+        self.terminal_effects: Final = terminal_effects
+        self.q: TiledQFunction = TiledQFunction(
+            actions, TileCoder(n_tilings, tile_width, memory_size), features, q_0
+        )
+        self.policy: QFunctionEpsilonGreedy = QFunctionEpsilonGreedy(
+            self.q.values, epsilon, actions, epsilon_decay
+        )
+        self.alpha_decay = alpha_decay if alpha_decay is not None else (lambda x: x)
+        self.next_action = None
+
+    def select_action(self, state: State, use_cached_action: bool = True) -> Action:
+        """
+        selects an action from a state based on the agent policy. When learning with sarsa
+        the next action is selected whenever we run an update, we can bypass this behaviour
+        with use_cached_action
+
+        :param state: the state to select the action from
+        :param use_cached_action: flag indicating whether we should use pre-selected action
+        :return: the selected action
+        """
+        return (
+            self.next_action
+            if self.next_action is not None and use_cached_action
+            else sample_action(self.policy, state, self.actions)
+        )
+
+    def run_update(
+        self, state: State, action: Action, effect: Effect, next_state: State
+    ) -> float:
+        reward = self.reward_function(effect)
+        if self.method == "sarsa":
+            self.next_action = sample_action(self.policy, next_state, self.actions)
+
+        # learn from what happened
+        if effect in self.terminal_effects:
+            target = reward
+        else:
+            next_values = self.q.values(next_state)
+            target = reward + self.gamma * (
+                next_values[self.q.action_index[self.next_action]]
+                if self.method == "sarsa"
+                else next_values.max()
+            )
+        active_features = self.q.active_features(state)
+        cur_q = self.q.weights[active_features, self.q.action_index[action]].sum()
+        self.q.add(active_features, action, self.alpha * (target - cur_q))
+
+        return reward
+
+    def finalize_episode(
+        self,
+        episode_states: list[State],
+        episode_returns: list[float],
+        episode_actions: list[Action],
+    ):
+        self.next_action = None
+        self.policy.decay()
+        self.alpha = self.alpha_decay(self.alpha)
@@ -0,0 +1,153 @@
+from typing import Final
+
+import numpy as np
+
+from abstractions import RewardFunction, Action, DecayFunction, State, Effect, Q
+from exploring_agents.commons.q_table_agent import QTableAgent
+from policies import EpsilonGreedy
+from utils.policy import get_best_action_from_q, sample_action
+from utils.q_table import QTable, as_q_table
+
+
+class TrueOnlineSarsaAgent(QTableAgent):
+    keeps_rows = True
+
+    def __init__(
+        self,
+        reward_function: RewardFunction,
+        actions: tuple[Action, ...],
+        gamma: float = 1,
+        alpha: float = 0.1,
+        epsilon: float = 0.1,
+        et_lambda: float = 0.9,
+        et_threshold: float = 1e-8,
+        epsilon_decay: DecayFunction = None,
+        alpha_decay: DecayFunction = None,
+        lambda_decay: DecayFunction = None,
+        q_0: Q = None,
+    ):
+        """
+        Agent implementing true online SARSA(lambda). Like SARSA(lambda) it uses eligibility
+        traces to update more state action pairs than the current one, but its updates match
+        exactly the forward view of lambda returns, using dutch traces.
+
+        Q values and traces are kept as (S, A) arrays, and only rows with active traces are
+        updated, so each step is a few vector operations over the active rows.
+
+        :param reward_function: the reward function we are trying to maximize
+        :param actions: actions available to the agent
+        :param gamma: the gamma discount value to be used when calculating episode returns
+        :param alpha: learning rate
+        :param epsilon: exploration rate to be considered when building policies
+        :param et_lambda: the lambda parameter of eligibility traces
+        :param et_threshold: rows whose traces are all smaller than this stop being updated
+        :param epsilon_decay: a rule to decay the epsilon parameter.
+        :param alpha_decay: a rule to decay the alpha parameter.
+        :param lambda_decay: a rule to decay the lambda parameter.
+        :param q_0: initial estimates of state-action values, will be considered as a constant 0 if not provided
+        """
+
+        self.reward_function: Final = reward_function
+        self.policy: EpsilonGreedy = EpsilonGreedy(epsilon, actions, epsilon_decay)
+        self.actions: Final = actions
+        self.gamma = gamma
+        self.alpha = alpha
+        self.et_lambda = et_lambda
+        self.et_threshold = et_threshold
+        self.q: QTable = as_q_table(q_0, actions)
+        self._track_evictions()
+        self.alpha_decay = alpha_decay if alpha_decay is not None else (lambda x: x)
+        self.lambda_decay = lambda_decay if lambda_decay is not None else (lambda x: x)
+        self.next_action: [None, Action] = None
+
+        # traces follow the rows of q, only active rows can have non zero traces
+        self.traces = np.zeros((self.q.capacity, len(actions)))
+        self.active_rows = np.zeros(0, dtype=np.int64)
+        self.q_old = 0.0
+
+        for state in self.q.states:
+            self.policy.update(
+                state, get_best_action_from_q(self.q, state, self.actions)
+            )
+
+    # overriding the method
+    def select_action(self, state: State, use_cached_action: bool = True) -> Action:
+        """
+        selects an action from a state based on the agent policy
+        during training we select the next action to be taken whenever we run an update
+        we can bypass this behaviour with use_cached_action
+
+        :param state: the state to select the action from
+        :param use_cached_action: flag indicating whether we should use pre-selected action
+        :return: the selected action
+        """
+
+        return (
+            self.next_action
+            if self.next_action is not None and use_cached_action
+            else sample_action(self.policy, state, self.actions)
+        )
+
+    def run_update(
+        self, state: State, action: Action, effect: Effect, next_state: State
+    ) -> float:
+        self.next_action = sample_action(self.policy, next_state, self.actions)
+        reward = self.reward_function(effect)
+
+        i, i_next = self.q.row(state), self.q.row(next_state)
+        j = self.q.action_index[action]
+        j_next = self.q.action_index[self.next_action]
+        if self.q.capacity > len(self.traces):
+            new_rows = self.q.capacity - len(self.traces)
+            self.traces = np.concatenate(
+                [self.traces, np.zeros((new_rows, len(self.actions)))]
+            )
+
+        # learn from what happened
+        q_values = self.q.array
+        cur_q, next_q = q_values[i, j], q_values[i_next, j_next]
+        delta = reward + self.gamma * next_q - cur_q
+
+        # dutch traces: z = gamma * lambda * z + (1 - alpha * gamma * lambda * z(s, a)) * x(s, a)
+        decay = self.gamma * self.et_lambda
+        cur_trace = self.traces[i, j]
+        if i not in self.active_rows:
+            self.active_rows = np.append(self.active_rows, i)
+        self.traces[self.active_rows] *= decay
+        self.traces[i, j] += 1 - self.alpha * decay * cur_trace
+
+        # w = w + alpha * (delta + Q - Q_old) * z - alpha * (Q - Q_old) * x(s, a)
+        deltas = (
+            self.alpha * (delta + cur_q - self.q_old) * self.traces[self.active_rows]
+        )
+        deltas[self.active_rows == i, j] -= self.alpha * (cur_q - self.q_old)
+        self.q.add_to_rows(self.active_rows, deltas)
+        self.q_old = next_q
+
+        # improve from what was learned
+        for row in self.active_rows.tolist():
+            cur_state = self.q.states[row]
+            self.policy.update(cur_state, self.q.best_action(cur_state))
+
+        # forget rows whose traces became negligible
+        negligible = (
+            np.abs(self.traces[self.active_rows]).max(axis=1) < self.et_threshold
+        )
+        self.traces[self.active_rows[negligible]] = 0
+        self.active_rows = self.active_rows[~negligible]
+
+        return reward
+
+    def finalize_episode(
+        self,
+        episode_states: list[State],
+        episode_returns: list[float],
+        episode_actions: list[Action],
+    ):
+        self.next_action = None
+        self.traces[self.active_rows] = 0
+        self.active_rows = np.zeros(0, dtype=np.int64)
+        self.q_old = 0.0
+        self.policy.decay()
+        self.alpha = self.alpha_decay(self.alpha)
+        self.et_lambda = self.lambda_decay(self.et_lambda)
@@ -1,2 +1,3 @@
+from exploring_agents.grid_world_agents.encoded_tag_agent import EncodedTagAgent
 from exploring_agents.grid_world_agents.odp_agent import ODPAgent
 from exploring_agents.grid_world_agents.q_explorer_agent import QExplorerAgent
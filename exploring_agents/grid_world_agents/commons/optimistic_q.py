@@ -0,0 +1,97 @@
+from collections import deque
+
+import numpy as np
+
+from abstractions import RewardFunction
+from exploring_agents.grid_world_agents.commons.world_map import WorldMap
+from grid_world.action import GWorldAction
+from grid_world.grid_world import GridWorld
+from utils.q_table import QTable
+
+
+def get_optimistic_q(
+    reward_function: RewardFunction,
+    actions: tuple[GWorldAction, ...],
+    world_shape: tuple[int, int],
+    terminal_coordinates: tuple[int, int],
+    world_map: WorldMap = None,
+    initial_coordinates: tuple[int, int] = (0, 0),
+    gamma: float = 1,
+) -> QTable:
+    """
+    Builds initial estimates of Q from the same optimistic world ODPAgent assumes: one where
+    everything outside the map is empty. Values come from the distance of each state to the
+    terminal state, found with a breadth first search over the world transitions, so unlike a
+    constant q_0 they point agents towards the goal from the first episode.
+
+    States that can't reach the terminal state are left out of the table.
+
+    :param reward_function: the reward function we are trying to maximize
+    :param actions: actions available to the agent
+    :param world_shape: shape of the optimistic world, it should contain the actual world
+    :param terminal_coordinates: coordinates of the terminal state
+    :param world_map: what is known about the world, walls and traps in it are avoided
+    :param initial_coordinates: coordinates of the initial state
+    :param gamma: the gamma discount value the agent will use
+    :return: a QTable to be used as q_0
+    """
+    known_states = world_map.world_states if world_map is not None else set()
+    world = GridWorld(
+        grid_shape=world_shape,
+        terminal_states_coordinates=(terminal_coordinates,),
+        initial_state_coordinates=initial_coordinates,
+        walls_coordinates={s.coordinates for s in known_states if s.kind == "wall"},
+        traps_coordinates={s.coordinates for s in known_states if s.kind == "trap"},
+    )
+    next_states, effects = world.get_transition_arrays(actions)
+    rewards = np.vectorize(reward_function, otypes=[float])(effects)
+    kinds = np.array([s.kind for s in world.states])
+    is_terminal, is_trap = kinds == "terminal", kinds == "trap"
+
+    # paths to the terminal state only move through empty states, search them backwards
+    sources, cols = np.nonzero(
+        (next_states != np.arange(len(world.states))[:, None])
+        & ~(is_terminal | is_trap)[:, None]
+    )
+    targets = next_states[sources, cols]
+    sources, targets = sources[~is_trap[targets]], targets[~is_trap[targets]]
+    order = np.argsort(targets, kind="stable")
+    predecessors = np.split(
+        sources[order], np.searchsorted(targets[order], np.arange(1, len(world.states)))
+    )
+
+    distances = np.full(len(world.states), -1)
+    queue = deque(np.flatnonzero(is_terminal).tolist())
+    distances[queue] = 0
+    while queue:
+        i = queue.popleft()
+        for j in predecessors[i].tolist():
+            if distances[j] == -1:
+                distances[j] = distances[i] + 1
+                queue.append(j)
+
+    # walk the shortest path: empty states, and then the terminal one
+    d = np.maximum(distances, 1)
+    step_reward, final_reward = reward_function(0), reward_function(1)
+    if gamma == 1:
+        v = (d - 1) * step_reward + final_reward
+    else:
+        v = (
+            step_reward * (1 - gamma ** (d - 1)) / (1 - gamma)
+            + gamma ** (d - 1) * final_reward
+        )
+    v = np.where(distances > 0, v, np.nan)
+    v[is_terminal] = 0
+    # from a trap we are sent to the initial state
+    traps = np.flatnonzero(is_trap)
+    v[traps] = rewards[traps, 0] + gamma * v[next_states[traps, 0]]
+
+    q = rewards + gamma * v[next_states]
+    rows = np.flatnonzero((distances > 0) | is_trap)
+    rows = rows[~np.isnan(q[rows]).any(axis=1)]
+    return QTable.from_arrays(
+        actions,
+        [world.states[i] for i in rows.tolist()],
+        q[rows],
+        np.ones((len(rows), len(actions)), dtype=bool),
+    )
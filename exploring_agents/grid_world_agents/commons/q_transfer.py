@@ -0,0 +1,118 @@
+from typing import Mapping, Sequence
+
+import numpy as np
+
+from abstractions import RewardFunction, State
+from grid_world.action import GWorldAction
+from grid_world.grid_world import GridWorld
+from grid_world.state import GWorldState
+from utils.q_table import QTable
+
+
+def transfer_q(
+    q: QTable,
+    world: GridWorld,
+    actions: tuple[GWorldAction, ...] = None,
+    unseen: float | QTable = 0,
+) -> QTable:
+    """
+    Carries Q values learned in one world over to another, by coordinates, the way ODPAgent
+    carries its values when the map changes. Agents can take the result as q_0, so a small
+    change to a map doesn't mean learning everything again.
+
+    Every state of the new world an agent can act from gets a row. Entries of states that
+    were in the table are copied, whatever their kind is now, while the others are filled
+    from unseen: either a constant, or another table(like get_optimistic_q), also read by
+    coordinates. A constant sets every entry that isn't copied, so the whole table is known,
+    while a table only fills the entries it knows.
+
+    :param q: the table to be transferred
+    :param world: the world the table will be used in
+    :param actions: actions available, defaults to the actions of q
+    :param unseen: values for entries that are not in q
+    :return: a QTable with a row for each state of world an agent can act from
+    """
+    actions = q.actions if actions is None else actions
+    states = [s for s in world.states if s.kind not in ("wall", "terminal")]
+    values = np.zeros((len(states), len(actions)))
+    known = np.zeros((len(states), len(actions)), dtype=bool)
+
+    # the constant first, then tables on top of it, known entries of the last one win
+    if not isinstance(unseen, QTable):
+        # unknown entries are stored as 0, so entries getting the constant are set
+        values[:] = unseen
+        known[:] = True
+        sources = [q]
+    else:
+        sources = [unseen, q]
+    for source in sources:
+        rows = _coordinate_rows(source.states, states, world.grid_shape)
+        found = rows >= 0
+        cols = source.columns(actions)
+        source_known = source.known[rows[found]][:, cols]
+        values[found] = np.where(
+            source_known, source.array[rows[found]][:, cols], values[found]
+        )
+        known[found] |= source_known
+
+    return QTable.from_arrays(actions, states, values, known)
+
+
+def transfer_v(
+    v: Mapping[State, float],
+    world: GridWorld,
+    reward_function: RewardFunction,
+    actions: tuple[GWorldAction, ...],
+    gamma: float = 1,
+    unseen: float = 0,
+) -> QTable:
+    """
+    Carries state values over to another world by coordinates, and turns them into Q values
+    with a one step lookahead on the new world, so changes to the map next to a state
+    already show in its values.
+
+    :param v: the state values to be transferred
+    :param world: the world the values will be used in
+    :param reward_function: the reward function we are trying to maximize
+    :param actions: actions available to the agent
+    :param gamma: the gamma discount value the agent will use
+    :param unseen: value of states that are not in v
+    :return: a QTable with a row for each state of world an agent can act from
+    """
+    source_states = list(v)
+    rows = _coordinate_rows(source_states, world.states, world.grid_shape)
+    source_values = np.fromiter((v[s] for s in source_states), float, len(v))
+    values = np.where(rows >= 0, source_values[rows], unseen)
+    kinds = np.array([s.kind for s in world.states])
+    values[kinds == "terminal"] = 0
+
+    next_states, effects = world.get_transition_arrays(actions)
+    rewards = np.vectorize(reward_function, otypes=[float])(effects)
+    q = rewards + gamma * values[next_states]
+    rows = np.flatnonzero((kinds != "wall") & (kinds != "terminal"))
+    return QTable.from_arrays(
+        actions,
+        [world.states[i] for i in rows.tolist()],
+        q[rows],
+        np.ones((len(rows), len(actions)), dtype=bool),
+    )
+
+
+def _coordinate_rows(
+    source: Sequence[GWorldState],
+    target: Sequence[GWorldState],
+    grid_shape: tuple[int, int],
+) -> np.ndarray:
+    """
+    Finds, for each target state, the position of the source state with its coordinates.
+
+    :return: array with the position in source of each target state, -1 where there is none
+    """
+    lookup = np.full(grid_shape, -1, dtype=np.int64)
+    if len(source):
+        coordinates = np.array([s.coordinates for s in source]).reshape(-1, 2)
+        inside = ((coordinates >= 0) & (coordinates < grid_shape)).all(axis=1)
+        lookup[tuple(coordinates[inside].T)] = np.flatnonzero(inside)
+    if not len(target):
+        return np.zeros(0, dtype=np.int64)
+    return lookup[tuple(np.array([s.coordinates for s in target]).T)]
@@ -0,0 +1,164 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Final
+
+from abstractions import State
+from grid_world.action import GWorldAction
+from grid_world.grid_world import GridWorld
+from grid_world.state import TagState
+
+# the dihedral group of the square, as integer matrices acting on (x, y)
+_DIHEDRAL_MATRICES: Final = (
+    ((1, 0), (0, 1)),
+    ((-1, 0), (0, -1)),
+    ((-1, 0), (0, 1)),
+    ((1, 0), (0, -1)),
+    ((0, 1), (1, 0)),
+    ((0, -1), (-1, 0)),
+    ((0, -1), (1, 0)),
+    ((0, 1), (-1, 0)),
+)
+
+_ACTIONS_BY_DIRECTION: Final = {a.direction: a for a in GWorldAction}
+
+
+@dataclass(frozen=True)
+class TagOffsetState(State):
+    """
+    State for the Tag problem, seen only through where agent 2 is relative to agent 1
+    """
+
+    offset: tuple[int, int]
+
+    def __str__(self):
+        return f"agent 2 at {self.offset} from agent 1"
+
+
+def _coordinates(x) -> tuple[int, int]:
+    return getattr(x, "coordinates", x)
+
+
+def _apply(matrix: tuple, v: tuple[int, int]) -> tuple[int, int]:
+    return (
+        matrix[0][0] * v[0] + matrix[0][1] * v[1],
+        matrix[1][0] * v[0] + matrix[1][1] * v[1],
+    )
+
+
+def _transpose(matrix: tuple) -> tuple:
+    return (matrix[0][0], matrix[1][0]), (matrix[0][1], matrix[1][1])
+
+
+class TagStateEncoder(ABC):
+    """
+    Maps tag states into smaller state spaces, where equivalent states share the same
+    encoding. When the encoding involves a transformation of the board, actions are transformed
+    as well, so encode_action and decode_action take the original state to know which
+    transformation applies.
+    """
+
+    def __init__(self, matrices: tuple = _DIHEDRAL_MATRICES[:1]):
+        """
+        :param matrices: the board transformations used by the encoding
+        """
+        self._matrices: Final = matrices
+        self._cache: dict[TagState, tuple[State, int]] = {}
+
+    @abstractmethod
+    def _encode(self, state: TagState) -> tuple[State, int]:
+        """
+        Computes the encoding of a state, and the index of the board transformation used.
+        """
+        raise NotImplementedError("_encode method not implemented")
+
+    def encode(self, state: TagState) -> State:
+        if (encoded := self._cache.get(state)) is None:
+            encoded = self._cache[state] = self._encode(state)
+        return encoded[0]
+
+    def encode_action(self, state: TagState, action: GWorldAction) -> GWorldAction:
+        """
+        Maps an action taken in a state into the frame of the encoded state.
+        """
+        self.encode(state)
+        matrix = self._matrices[self._cache[state][1]]
+        return _ACTIONS_BY_DIRECTION[_apply(matrix, action.direction)]
+
+    def decode_action(self, state: TagState, action: GWorldAction) -> GWorldAction:
+        """
+        Maps an action chosen for the encoded state back to the frame of the original state.
+        """
+        self.encode(state)
+        # dihedral matrices are orthogonal, so the inverse is the transpose
+        matrix = _transpose(self._matrices[self._cache[state][1]])
+        return _ACTIONS_BY_DIRECTION[_apply(matrix, action.direction)]
+
+
+class RelativeTagEncoder(TagStateEncoder):
+    def __init__(self, symmetric: bool = False):
+        """
+        Encodes tag states by the displacement between the agents. This is exact in an
+        unbounded open world, and a good approximation for wall free worlds, where the borders
+        are the only thing ignored. It brings the number of states from S^2 to about 4S.
+
+        :param symmetric: whether offsets equivalent under rotations and reflections should be
+            merged as well, this shrinks the table by about 8 more times
+        """
+        super().__init__(_DIHEDRAL_MATRICES if symmetric else _DIHEDRAL_MATRICES[:1])
+        self.symmetric: Final = symmetric
+
+    def _encode(self, state: TagState) -> tuple[TagOffsetState, int]:
+        x_1, y_1 = _coordinates(state.coordinates_1)
+        x_2, y_2 = _coordinates(state.coordinates_2)
+        offset = (x_2 - x_1, y_2 - y_1)
+        encoded, i = min((_apply(m, offset), i) for i, m in enumerate(self._matrices))
+        return TagOffsetState(encoded), i
+
+
+class SymmetricTagEncoder(TagStateEncoder):
+    def __init__(self, world: GridWorld):
+        """
+        Encodes tag states by a canonical representative under the symmetries of the world:
+        the rotations and reflections of the grid that keep walls, traps and terminal states in
+        place, as well as the initial state when there are traps sending agents back to it.
+        Equivalent states share their values, with actions rotated or reflected accordingly.
+        Unlike RelativeTagEncoder this is exact in any world.
+
+        :param world: the world where tag is played
+        """
+        self.world: Final = world
+        super().__init__(tuple(m for m in _DIHEDRAL_MATRICES if self._is_symmetry(m)))
+
+    def _transform(self, matrix: tuple, coordinates: tuple[int, int]) -> tuple:
+        # work with doubled coordinates centered on the grid, so everything stays integer
+        w, h = self.world.grid_shape[0] - 1, self.world.grid_shape[1] - 1
+        x, y = _apply(matrix, (2 * coordinates[0] - w, 2 * coordinates[1] - h))
+        return (x + w) // 2, (y + h) // 2
+
+    def _is_symmetry(self, matrix: tuple) -> bool:
+        if self.world.wind is not None:
+            return matrix == _DIHEDRAL_MATRICES[0]
+        if matrix[0][0] == 0 and self.world.grid_shape[0] != self.world.grid_shape[1]:
+            # swapping the axes of a rectangular grid doesn't keep it in place
+            return False
+        invariant_cells = [
+            self.world.walls_coordinates,
+            self.world.traps_coordinates,
+            self.world.terminal_states_coordinates,
+        ]
+        if self.world.traps_coordinates:
+            # traps send agents back to the initial state, so it has to stay in place too
+            invariant_cells.append((self.world.initial_state.coordinates,))
+        return all(
+            {self._transform(matrix, c) for c in cells} == set(cells)
+            for cells in invariant_cells
+        )
+
+    def _encode(self, state: TagState) -> tuple[TagState, int]:
+        c_1 = _coordinates(state.coordinates_1)
+        c_2 = _coordinates(state.coordinates_2)
+        encoded, i = min(
+            ((self._transform(m, c_1), self._transform(m, c_2)), i)
+            for i, m in enumerate(self._matrices)
+        )
+        return TagState(*encoded), i
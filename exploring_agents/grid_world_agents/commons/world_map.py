@@ -12,43 +12,77 @@ class WorldMap:
         actions: tuple[GWorldAction],
         world_states: set[GWorldState] = None,
     ):
-        self.world_states: set[GWorldState] = (
-            world_states if world_states is not None else set()
-        )
+        """
+        Partial map of a grid world, built from what an agent observes. Besides the known states
+        it keeps track of the cells that should be avoided(walls and traps), and of the actions
+        that are reasonable on each known state.
+
+        The map is updated incrementally: discovering a wall or trap only changes the reasonable
+        actions of its neighbours, so each update costs O(A) regardless of the map size, and
+        reports which states were affected.
+
+        :param actions: actions available to the agent
+        :param world_states: states known upfront
+        """
         self.actions: Final = actions
-        self.no_go_coordinates: list[tuple[int, int]] = self._get_no_go_coordinates()
-        self.reasonable_actions: dict[
-            GWorldState, list[GWorldAction]
-        ] = self._get_reasonable_actions()
+        self.world_states: set[GWorldState] = set()
+        self.no_go_coordinates: set[tuple[int, int]] = set()
+        self.reasonable_actions: dict[GWorldState, list[GWorldAction]] = {}
+        self._states_at: dict[tuple[int, int], set[GWorldState]] = {}
+
+        for s in world_states if world_states is not None else set():
+            self._add_state(s)
 
     def update_map(
         self, state: GWorldState, action: GWorldAction, new_state: GWorldState
-    ) -> bool:
+    ) -> set[GWorldState]:
         """
         Updates map based given a State, Action, State sequence.
         :param state: the original state
         :param action: the action taken
         :param new_state: the final state
 
-        :return: flag indicating whether we added a trap or wall to the map
+        :return: the states whose reasonable actions changed, together with the trap or wall
+            that was hit. This is empty whenever we did not hit a trap or wall
         """
-        meaningful_update = False
         if (new_state == state) and (state.kind != "terminal"):
-            self.world_states.add(
-                GWorldState(add_tuples(state.coordinates, action.direction), "wall")
-            )
-            meaningful_update = True
-        else:
-            self.world_states.add(new_state)
-        self.no_go_coordinates = self._get_no_go_coordinates()
-        self.reasonable_actions = self._get_reasonable_actions()
-        return True if new_state.kind == "trap" else meaningful_update
+            wall = GWorldState(add_tuples(state.coordinates, action.direction), "wall")
+            return self._add_state(wall) | {wall}
+        changed_states = self._add_state(new_state)
+        return (
+            changed_states | {new_state} if new_state.kind == "trap" else changed_states
+        )
+
+    def _add_state(self, s: GWorldState) -> set[GWorldState]:
+        """
+        Adds a state to the map, updating the reasonable actions of the states it affects.
+
+        :param s: the state to be added
+        :return: the states that had their reasonable actions changed, besides s itself
+        """
+        changed_states = set()
+        if s in self.world_states:
+            return changed_states
+        self.world_states.add(s)
+        self._states_at.setdefault(s.coordinates, set()).add(s)
 
-    def _get_no_go_coordinates(self) -> list[tuple[int, int]]:
-        return [s.coordinates for s in self.world_states if s.kind in {"trap", "wall"}]
+        if s.kind in {"trap", "wall"} and s.coordinates not in self.no_go_coordinates:
+            self.no_go_coordinates.add(s.coordinates)
+            # only states next to the new cell may have actions leading to it
+            for a in self.actions:
+                origin = (
+                    s.coordinates[0] - a.direction[0],
+                    s.coordinates[1] - a.direction[1],
+                )
+                for neighbour in self._states_at.get(origin, ()):
+                    self.reasonable_actions[neighbour] = self._get_actions_for_state(
+                        neighbour
+                    )
+                    changed_states.add(neighbour)
 
-    def _get_reasonable_actions(self) -> dict[GWorldState, list[GWorldAction]]:
-        return {s: self._get_actions_for_state(s) for s in self.world_states}
+        self.reasonable_actions[s] = self._get_actions_for_state(s)
+        changed_states.discard(s)
+        return changed_states
 
     def _get_actions_for_state(self, s: GWorldState) -> list[GWorldAction]:
         """
@@ -0,0 +1,76 @@
+from typing import Final
+
+from abstractions import Agent, Action, Effect, Policy
+from exploring_agents.grid_world_agents.commons.tag_encoders import TagStateEncoder
+from grid_world.action import GWorldAction
+from grid_world.state import TagState
+
+
+class EncodedTagAgent(Agent):
+    def __init__(self, agent: Agent, encoder: TagStateEncoder):
+        """
+        Wraps an agent so it plays tag on encoded states. The wrapped agent only ever sees
+        encoded states and actions, so equivalent states share a single entry in its Q function,
+        which makes it smaller and lets experience from one state generalize to the others.
+
+        :param agent: the agent making decisions, usually a tabular agent like QAgent
+        :param encoder: how states should be encoded, see tag_encoders
+        """
+        self.agent: Final = agent
+        self.encoder: Final = encoder
+        # the episode as seen by run_update, see finalize_episode
+        self.episode_states: list[TagState] = []
+        self.episode_actions: list[GWorldAction] = []
+
+    @property
+    def gamma(self) -> float:
+        return self.agent.gamma
+
+    @property
+    def actions(self) -> tuple[GWorldAction, ...]:
+        return self.agent.actions
+
+    @property
+    def policy(self) -> Policy:
+        return self.agent.policy
+
+    def select_action(self, state: TagState) -> GWorldAction:
+        action = self.agent.select_action(self.encoder.encode(state))
+        return self.encoder.decode_action(state, action)
+
+    def run_update(
+        self,
+        state: TagState,
+        action: GWorldAction,
+        effect: Effect,
+        next_state: TagState,
+    ) -> float:
+        if not self.episode_states:
+            self.episode_states.append(state)
+        self.episode_states.append(next_state)
+        self.episode_actions.append(action)
+        return self.agent.run_update(
+            self.encoder.encode(state),
+            self.encoder.encode_action(state, action),
+            effect,
+            self.encoder.encode(next_state),
+        )
+
+    def finalize_episode(
+        self,
+        episode_states: list,
+        episode_returns: list[float],
+        episode_actions: list[Action],
+    ):
+        """
+        Forwards the end of the episode to the wrapped agent, with encoded states and actions.
+        Tag training loops only pass the positions of each agent here, so the episode is
+        rebuilt from the tag states run_update got.
+        """
+        states, actions = self.episode_states, self.episode_actions
+        self.episode_states, self.episode_actions = [], []
+        self.agent.finalize_episode(
+            [self.encoder.encode(s) for s in states],
+            episode_returns,
+            [self.encoder.encode_action(s, a) for s, a in zip(states, actions)],
+        )
@@ -1,7 +1,8 @@
 from typing import Final
 
 from abstractions import Agent, RewardFunction, Action, State, Effect, StateEvalDict
-from dynamic_programing.policy_improvement import dynamic_programing_gpi
+from dynamic_programing.grid_world_solver import solve_grid_world
+from dynamic_programing.solution_cache import SolutionCache
 from exploring_agents.grid_world_agents.commons.world_map import WorldMap
 from grid_world.action import GWorldAction
 from grid_world.grid_world import GridWorld
@@ -18,6 +19,7 @@ class ODPAgent(Agent):
         actions: tuple[GWorldAction],
         terminal_coordinates: tuple[int, int] = None,
         gamma: float = 1,
+        solution_cache: SolutionCache = None,
     ):
         """
         Agent implementing a solution based on dynamic programing.
@@ -39,6 +41,7 @@ class ODPAgent(Agent):
         :param actions: actions available to the agent
         :param terminal_coordinates: optional terminal coordinates to help agent build policy
         :param gamma: the gamma discount value to be used when calculating episode returns
+        :param solution_cache: optional cache of DP solutions, avoids solving the same optimistic world twice
         """
         self.reward_function: Final = reward_function
         self.actions: Final[tuple[GWorldAction]] = actions
@@ -57,6 +60,7 @@ class ODPAgent(Agent):
         self.perfect_run = True
         self.v_pi: StateEvalDict | None = None
         self.policy = RandomPolicy(self.actions)
+        self.solution_cache = solution_cache
 
         if self.final_state_known:
             self._update_odp_policy()
@@ -124,28 +128,18 @@ class ODPAgent(Agent):
             )
         )
 
-    @staticmethod
-    def _get_world_model(world):
-        return lambda s, a: lambda x: 1 if x == world.take_action(s, a)[0] else 0
-
     def _update_odp_policy(self):
         world = self.build_opt_world()
-        world_model = self._get_world_model(world)
         if self.v_pi is not None:
             self._update_v_pi(world)
 
         # assumes everything is deterministic
-        rewards_dict = {
-            (s, a): self.reward_function(world.take_action(s, a)[1])
-            for s in world.states
-            for a in self.actions
-        }
-
-        self.policy, self.v_pi = dynamic_programing_gpi(
-            world_model=world_model,
-            reward_function=lambda x, y: rewards_dict[(x, y)],
+        self.policy, self.v_pi = solve_grid_world(
+            world=world,
+            reward_function=self.reward_function,
             actions=self.actions,
-            states=world.states,
+            gamma=self.gamma,
+            cache=self.solution_cache,
         )
 
     def _update_v_pi(self, world: GridWorld) -> None:
@@ -1,15 +1,16 @@
 from typing import Final
 
-from abstractions import Agent, RewardFunction, DecayFunction, Effect, Q
+from abstractions import RewardFunction, DecayFunction, Effect, Q
+from exploring_agents.commons.q_table_agent import QTableAgent
 from exploring_agents.grid_world_agents.commons.world_map import WorldMap
-from policies import EpsilonExplorer
+from policies import EpsilonExplorer, FrozenGreedyPolicy
 from grid_world.action import GWorldAction
 from grid_world.state import GWorldState
-from utils.evaluators import best_q_value
-from utils.policy import get_best_action_from_q, sample_action
+from utils.policy import sample_action
+from utils.q_table import QTable, as_q_table
 
 
-class QExplorerAgent(Agent):
+class QExplorerAgent(QTableAgent):
     def __init__(
         self,
         reward_function: RewardFunction,
@@ -45,12 +46,18 @@ class QExplorerAgent(Agent):
         self.actions: tuple[GWorldAction] = actions
         self.gamma = gamma
         self.alpha = alpha
-        self.q: Q = q_0 if q_0 is not None else {}
+        self.q: QTable = as_q_table(q_0, actions)
         self.alpha_decay = alpha_decay if alpha_decay is not None else (lambda x: x)
         self.world_map: WorldMap = WorldMap(
-            world_states=set(x for (x, a) in self.q.keys()), actions=self.actions
+            world_states=set(self.q.states), actions=self.actions
         )
 
+        for state in self.q.states:
+            valid_actions = self.world_map.reasonable_actions.get(state, self.actions)
+            self.policy.update(
+                state, self.q.best_action(state, valid_actions), valid_actions
+            )
+
     def select_action(self, state: GWorldState) -> GWorldAction:
         return sample_action(self.policy, state, self.actions)
 
@@ -64,7 +71,7 @@ class QExplorerAgent(Agent):
         reward = self.reward_function(effect)
 
         # update our map based on what happened
-        meaningful_update = self.world_map.update_map(state, action, next_state)
+        changed_states = self.world_map.update_map(state, action, next_state)
 
         # learn from what happened
         next_valid_actions = self.world_map.reasonable_actions.get(
@@ -73,36 +80,45 @@ class QExplorerAgent(Agent):
         cur_q = self.q.get((state, action), 0)
         self.q[state, action] = cur_q + self.alpha * (
             reward
-            + self.gamma * best_q_value(self.q, next_state, next_valid_actions)
+            + self.gamma * self.q.best_value(next_state, next_valid_actions)
             - cur_q
         )
 
-        # improve from what was learned
-        if meaningful_update:
-            # if we added a trap or wall a lot of states may change
-            for cur_state in self.world_map.world_states:
-                cur_valid_actions = self.world_map.reasonable_actions.get(
-                    cur_state, self.actions
-                )
-                self.policy.update(
-                    cur_state,
-                    get_best_action_from_q(self.q, cur_state, cur_valid_actions),
-                    cur_valid_actions,
-                )
-        else:
-            # otherwise we only need to worry about the current and next states
-            for cur_state in [state, next_state]:
-                cur_valid_actions = self.world_map.reasonable_actions.get(
-                    cur_state, self.actions
-                )
-                self.policy.update(
-                    cur_state,
-                    get_best_action_from_q(self.q, cur_state, cur_valid_actions),
-                    cur_valid_actions,
-                )
+        # improve from what was learned, a new trap or wall only changes the states next to it
+        for cur_state in changed_states | {state, next_state}:
+            cur_valid_actions = self.world_map.reasonable_actions.get(
+                cur_state, self.actions
+            )
+            self.policy.update(
+                cur_state,
+                self.q.best_action(cur_state, cur_valid_actions),
+                cur_valid_actions,
+            )
 
         return reward
 
+    def freeze(self, states: list[GWorldState] = None) -> FrozenGreedyPolicy:
+        """
+        compiles the greedy policy of the agent into a read only policy, only reasonable actions
+        are considered on each state
+
+        :param states: states to be covered by the policy, defaults to every state the agent knows
+        :return: a FrozenGreedyPolicy
+        """
+        states = list(self.q.states) if states is None else list(states)
+        return FrozenGreedyPolicy(
+            self.actions,
+            states,
+            [
+                self.q.action_index[
+                    self.q.best_action(
+                        s, self.world_map.reasonable_actions.get(s, self.actions)
+                    )
+                ]
+                for s in states
+            ],
+        )
+
     def finalize_episode(
         self,
         episode_states: list[GWorldState],
@@ -1,3 +1,5 @@
+from .population_train import train_population
+from .shared_train import run_shared_episode, train_shared
 from .tag_train import run_tag_episode, train_tag_agents
 from .train import train_agent
 from .train import run_episode
@@ -0,0 +1,122 @@
+import numpy as np
+
+from abstractions import DecayFunction, RewardFunction
+from grid_world.action import GWorldAction
+from grid_world.grid_world import GridWorld
+
+
+def _sample_actions(
+    q: np.ndarray,
+    known: np.ndarray,
+    replicas: np.ndarray,
+    states: np.ndarray,
+    epsilon: float,
+    rng,
+) -> np.ndarray:
+    """
+    Samples actions for some replicas following their epsilon greedy policies, the same way
+    EpsilonGreedy does. States a replica never updated get uniformly random actions.
+    """
+    n, n_actions = len(replicas), q.shape[2]
+    if n_actions == 1:
+        return np.zeros(n, dtype=np.int64)
+
+    best = q[replicas, states].argmax(axis=1)
+    other = (rng.uniform(size=n) * (n_actions - 1)).astype(np.int64)
+    other += other >= best
+    greedy = rng.uniform(size=n) >= epsilon
+    uniform = (rng.uniform(size=n) * n_actions).astype(np.int64)
+    return np.where(
+        known[replicas, states], np.where(greedy, best, other), uniform
+    ).astype(np.int64)
+
+
+def train_population(
+    world: GridWorld,
+    reward_function: RewardFunction,
+    actions: tuple[GWorldAction, ...],
+    replicas: int,
+    episodes: int = 100,
+    method: str = "q_learning",
+    gamma: float = 1,
+    alpha: float = 0.1,
+    epsilon: float = 0.1,
+    epsilon_decay: DecayFunction = None,
+    alpha_decay: DecayFunction = None,
+    rng: np.random.Generator = None,
+) -> tuple[list[list[int]], list[list[float]]]:
+    """
+    Trains many independent tabular agents at once in a grid world. This is equivalent to training
+    replicas of QAgent or SarsaAgent with train_agent, but the Q functions of all replicas are
+    kept in a single (K, S, A) array, and every step of all replicas is done with a few
+    vectorized operations over the world transition arrays.
+
+    :param world: the world where this will take place
+    :param reward_function: the reward function we are trying to maximize
+    :param actions: actions available to the agents
+    :param replicas: number of agents to be trained
+    :param episodes: how many episodes to run
+    :param method: how agents learn, one of: q_learning, sarsa
+    :param gamma: the gamma discount value to be used when calculating episode returns
+    :param alpha: learning rate
+    :param epsilon: exploration rate to be considered when building policies
+    :param epsilon_decay: a rule to decay the epsilon parameter.
+    :param alpha_decay: a rule to decay the alpha parameter.
+    :param rng: random generator to be used, defaults to numpy global random state
+    :return: for each replica, respectively: episode_lengths, episode_total_returns
+    """
+    if method not in {"q_learning", "sarsa"}:
+        raise ValueError("method must be one of: q_learning, sarsa")
+    rng = np.random if rng is None else rng
+    epsilon_decay = epsilon_decay if epsilon_decay is not None else (lambda x: x)
+    alpha_decay = alpha_decay if alpha_decay is not None else (lambda x: x)
+
+    next_states, effects = world.get_transition_arrays(actions)
+    rewards = np.array(
+        [[reward_function(e) for e in row] for row in effects.tolist()], dtype=float
+    )
+    initial_state = world.state_index[world.initial_state]
+
+    q = np.zeros((replicas, len(world.states), len(actions)))
+    # states where each replica already has a greedy action
+    known = np.zeros((replicas, len(world.states)), dtype=bool)
+    lengths = np.zeros((replicas, episodes), dtype=np.int64)
+    returns = np.zeros((replicas, episodes))
+
+    for episode in range(episodes):
+        states = np.full(replicas, initial_state)
+        discounts = np.ones(replicas)
+        active = np.arange(replicas)
+        if method == "sarsa":
+            cur_actions = _sample_actions(q, known, active, states, epsilon, rng)
+        lengths[:, episode] = 1
+
+        while active.size:
+            s = states[active]
+            a = (
+                cur_actions[active]
+                if method == "sarsa"
+                else _sample_actions(q, known, active, s, epsilon, rng)
+            )
+            s_next, r = next_states[s, a], rewards[s, a]
+
+            # learn from what happened
+            if method == "sarsa":
+                a_next = _sample_actions(q, known, active, s_next, epsilon, rng)
+                target = r + gamma * q[active, s_next, a_next]
+                cur_actions[active] = a_next
+            else:
+                target = r + gamma * q[active, s_next].max(axis=1)
+            q[active, s, a] += alpha * (target - q[active, s, a])
+            known[active, s] = True
+
+            returns[active, episode] += discounts[active] * r
+            discounts[active] *= gamma
+            lengths[active, episode] += 1
+            states[active] = s_next
+            active = active[effects[s, a] != 1]
+
+        epsilon = epsilon_decay(epsilon)
+        alpha = alpha_decay(alpha)
+
+    return lengths.tolist(), returns.tolist()
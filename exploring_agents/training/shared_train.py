@@ -0,0 +1,89 @@
+from abstractions import Agent, World
+from abstractions.type_vars import StateTypeVar, ActionTypeVar
+from exploring_agents.commons.transition_batch import TransitionBatch
+from utils.returns import returns_from_reward
+
+
+def run_shared_episode(
+    behaviour: Agent[ActionTypeVar, StateTypeVar],
+    learners: list[Agent],
+    world: World,
+    initial_state: StateTypeVar = None,
+) -> tuple[list[StateTypeVar], list[float], list[StateTypeVar]]:
+    """
+    Runs an episode with a behaviour agent, and then lets many off-policy agents learn from the
+    transitions it generated. The world is only simulated once, regardless of the number of
+    learners.
+
+    :param behaviour: the agent choosing actions, it learns as usual during the episode
+    :param learners: agents learning from the transitions of the behaviour agent
+    :param world: the world where this will take place
+    :param initial_state: state where the behaviour agent starts
+    :return: for the behaviour agent, respectively: episode_states, episode_returns,
+        episode_actions
+    """
+    state = initial_state if initial_state is not None else world.initial_state
+
+    episode_states = [state]
+    episode_rewards = []
+    episode_actions = []
+    episode_effects = []
+
+    effect = 0
+    while effect != 1:
+        action = behaviour.select_action(state)
+        next_state, effect = world.take_action(state, action)
+
+        reward = behaviour.run_update(state, action, effect, next_state)
+
+        state = next_state
+
+        episode_states.append(state)
+        episode_rewards.append(reward)
+        episode_actions.append(action)
+        episode_effects.append(effect)
+
+    episode_returns = returns_from_reward(episode_rewards, behaviour.gamma)
+    behaviour.finalize_episode(episode_states, episode_returns, episode_actions)
+
+    batch = TransitionBatch.from_episode(
+        episode_states, episode_actions, episode_effects, behaviour.actions
+    )
+    for learner in learners:
+        learner_rewards = learner.learn_from_batch(batch)
+        learner.finalize_episode(
+            episode_states,
+            returns_from_reward(learner_rewards.tolist(), learner.gamma),
+            episode_actions,
+        )
+
+    return episode_states, episode_returns, episode_actions
+
+
+def train_shared(
+    behaviour: Agent,
+    learners: list[Agent],
+    world: World,
+    episodes: int = 100,
+) -> tuple[list[int], list[float]]:
+    """
+    Trains many off-policy agents from the experience of a single behaviour agent. This is
+    useful for comparing learners, like the ones of a hyperparameter grid, without simulating
+    episodes for each of them.
+
+    :param behaviour: the agent choosing actions
+    :param learners: agents learning from the transitions of the behaviour agent
+    :param world: the world where this will take place
+    :param episodes: how many episodes to run
+    :return: for the behaviour agent, respectively: episode_lengths, episode_total_returns
+    """
+    episode_lengths = []
+    episode_total_returns = []
+    for episode in range(episodes):
+        episode_states, episode_returns, _ = run_shared_episode(
+            behaviour, learners, world
+        )
+        episode_lengths.append(len(episode_states))
+        episode_total_returns.append(episode_returns[0])
+
+    return episode_lengths, episode_total_returns
@@ -1,5 +1,8 @@
+import hashlib
 from typing import Final, Collection, Callable
 
+import numpy as np
+
 from grid_world.action import GWorldAction
 from grid_world.state import GWorldState
 from abstractions import Effect
@@ -77,6 +80,11 @@ class GridWorld:
             ]
         )
         self.state_effect: Final[dict[GWorldState, int]] = self._get_state_effect()
+        self.state_index: Final[dict[GWorldState, int]] = {
+            s: i for i, s in enumerate(self.states)
+        }
+        # stable identifier of the world dynamics, useful to cache things computed from it
+        self.fingerprint: Final[str] = self._get_fingerprint()
 
     def _get_state_effect(self) -> dict[GWorldState, int]:
         state_effect = {}
@@ -90,6 +98,44 @@ class GridWorld:
 
         return state_effect
 
+    def _get_fingerprint(self) -> str:
+        wind_table = (
+            tuple((s.coordinates, self.wind(s).name) for s in self.states)
+            if self.wind is not None
+            else None
+        )
+        description = (
+            tuple(self.grid_shape),
+            tuple(sorted(set(self.walls_coordinates))),
+            tuple(sorted(set(self.traps_coordinates))),
+            tuple(sorted(set(self.terminal_states_coordinates))),
+            self.initial_state.coordinates,
+            self.initial_state_2.coordinates,
+            wind_table,
+        )
+        return hashlib.sha256(repr(description).encode()).hexdigest()
+
+    def get_transition_arrays(
+        self, actions: tuple[GWorldAction, ...]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Builds the dynamics of the world as arrays indexed by the position of states in
+        self.states and of actions in the actions tuple.
+
+        :param actions: the actions to be considered
+        :return: a (S, A) array with the index of the resulting state, and a (S, A) array
+            with the resulting effect
+        """
+        next_states = np.empty((len(self.states), len(actions)), dtype=np.int64)
+        effects = np.empty((len(self.states), len(actions)), dtype=np.int64)
+        for i, s in enumerate(self.states):
+            for j, a in enumerate(actions):
+                next_state, effect = self.take_action(s, a)
+                next_states[i, j] = self.state_index[next_state]
+                effects[i, j] = effect
+
+        return next_states, effects
+
     def take_action(
         self, state: GWorldState, action: GWorldAction
     ) -> [GWorldState, Effect]:
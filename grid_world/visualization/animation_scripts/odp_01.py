@@ -2,8 +2,10 @@ import sys
 import os
 
 path = os.path.dirname(os.path.abspath(__file__))
-sys.path.append("/" + os.path.join(*path.split("/")[:-3]))
+base_path = "/" + os.path.join(*path.split("/")[:-3])
+sys.path.append(base_path)
 
+from dynamic_programing.solution_cache import SolutionCache
 from grid_world.visualization.curses_utils import animate_episodes
 from notebooks.utils.basics import basic_reward, basic_actions
 from notebooks.utils.worlds import small_world_01
@@ -21,6 +23,7 @@ if __name__ == "__main__":
         actions=basic_actions,
         world_shape=world.grid_shape,
         terminal_coordinates=world.terminal_states_coordinates[0],
+        solution_cache=SolutionCache(f"{base_path}/persistence/dp_cache"),
     )
 
     states_history = []
@@ -5,7 +5,7 @@ import numpy as np
 import pandas as pd
 
 from abstractions import Agent, World
-from exploring_agents.training import train_agent
+from exploring_agents.training import train_agent, train_population
 
 
 def print_summary(results):
@@ -65,6 +65,24 @@ def get_results(
     return returns, lengths
 
 
+def get_population_results(
+    world,
+    reward_function,
+    actions,
+    training_rounds,
+    episodes,
+    **kwargs,
+) -> tuple[list[list[float]], list[list[int]]]:
+    """
+    Same as get_results for q-learning or sarsa agents, but all rounds are trained together in a
+    single process with train_population. Extra arguments are passed to train_population.
+    """
+    lengths, returns = train_population(
+        world, reward_function, actions, training_rounds, episodes, **kwargs
+    )
+    return returns, lengths
+
+
 def get_exp_results(
     base_agent: type[Agent],
     world: World,
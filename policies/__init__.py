@@ -1,4 +1,11 @@
+from policies.count_based_policies import (
+    CountBasedPolicy,
+    CountBonusPolicy,
+    UCBPolicy,
+)
 from policies.epsilon_explorer import EpsilonExplorer
 from policies.epsilon_greedy import EpsilonGreedy
+from policies.frozen_greedy_policy import FrozenGreedyPolicy
 from policies.greedy_policy import GreedyPolicy
+from policies.q_function_epsilon_greedy import QFunctionEpsilonGreedy
 from policies.random_policy import RandomPolicy
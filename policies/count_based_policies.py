@@ -0,0 +1,149 @@
+from abc import abstractmethod
+from typing import Any
+
+import numpy as np
+
+from abstractions import Action, State, Policy
+from utils.q_table import QTable
+
+
+class CountBasedPolicy(Policy):
+    def __init__(self, actions: tuple[Action, ...], q: QTable = None):
+        """
+        A policy that explores by optimism instead of chance: it is greedy with respect to the
+        values of a Q table plus a bonus for actions that were tried few times. The bonus is
+        computed in closed form from an (S, A) array counting how many times each action was
+        sampled in each state, so picking an action is a single argmax.
+
+        Counts are updated whenever an action is sampled, and values are read from the Q table
+        as they change, so there is nothing to be updated by agents.
+
+        :param actions: actions available to select from
+        :param q: the Q table to be followed, agents set their own one when this is not provided
+        """
+        self.actions = actions
+        self.action_index = {a: i for i, a in enumerate(actions)}
+        self.q = q
+        self.state_index: dict[State, int] = {}
+        self.counts = np.zeros((64, len(actions)), dtype=np.int64)
+        self.state_counts = np.zeros(64, dtype=np.int64)
+        # rows of removed states, reused before new ones
+        self.free_rows: list[int] = []
+
+    @abstractmethod
+    def bonus(self, counts: np.ndarray, state_count: int) -> np.ndarray:
+        """
+        Computes the exploration bonus of the actions of a state.
+
+        :param counts: how many times each action was sampled in the state
+        :param state_count: how many times the state was visited
+        :return: the bonus of each action
+        """
+        raise NotImplementedError("bonus method not implemented")
+
+    def scores(self, state: State) -> np.ndarray:
+        """
+        Gets the optimistic value of each action in a state: its value plus its bonus.
+        """
+        values = (
+            np.zeros(len(self.actions))
+            if self.q is None
+            else self.q.action_values(state, self.actions)
+        )
+        if (i := self.state_index.get(state)) is None:
+            return values + self.bonus(np.zeros(len(self.actions), dtype=np.int64), 0)
+        return values + self.bonus(self.counts[i], int(self.state_counts[i]))
+
+    def best_action(self, state: State) -> Action:
+        return self.actions[int(np.argmax(self.scores(state)))]
+
+    def __call__(self, state: State, action: Action) -> float:
+        if action not in self.actions:
+            raise ValueError(f"action {action} is not part of policy")
+        return 1 if action == self.best_action(state) else 0
+
+    def sample(self, state: State, rng: np.random.Generator = None) -> Action:
+        action = self.best_action(state)
+        self.count(state, action)
+        return action
+
+    def count(self, state: State, action: Action) -> None:
+        """
+        Counts a visit to a state-action pair.
+        """
+        if (i := self.state_index.get(state)) is None:
+            i = self.free_rows.pop() if self.free_rows else len(self.state_index)
+            self.state_index[state] = i
+            if i == len(self.state_counts):
+                self.counts = np.concatenate([self.counts, np.zeros_like(self.counts)])
+                self.state_counts = np.concatenate(
+                    [self.state_counts, np.zeros_like(self.state_counts)]
+                )
+        self.counts[i, self.action_index[action]] += 1
+        self.state_counts[i] += 1
+
+    def update(self, *args: Any) -> None:
+        """
+        Nothing to do, values are read from the Q table and counts are kept while sampling
+        """
+
+    def bind(self, q: QTable) -> None:
+        """
+        Follows the Q table of the agent, unless the policy was given one
+        """
+        if self.q is None:
+            self.q = q
+
+    def remove(self, state: State) -> None:
+        """
+        Forgets the counts of a state, its row is reused by the next new state
+        """
+        if (i := self.state_index.pop(state, None)) is not None:
+            self.counts[i] = 0
+            self.state_counts[i] = 0
+            self.free_rows.append(i)
+
+    def decay(self) -> None:
+        """
+        Nothing to do, exploration fades as counts grow
+        """
+
+
+class UCBPolicy(CountBasedPolicy):
+    def __init__(self, actions: tuple[Action, ...], q: QTable = None, c: float = 1):
+        """
+        Upper confidence bound(UCB1) exploration: the bonus of an action is
+        c * sqrt(ln(N) / n), where N is the number of visits to the state, and n the number of
+        times the action was taken there. Actions never taken in a state are taken first.
+
+        :param actions: actions available to select from
+        :param q: the Q table to be followed, agents set their own one when this is not provided
+        :param c: scale of the bonus, it should be about the scale of the differences of values
+        """
+        super().__init__(actions, q)
+        self.c = c
+
+    def bonus(self, counts: np.ndarray, state_count: int) -> np.ndarray:
+        return np.where(
+            counts > 0,
+            self.c * np.sqrt(np.log(max(state_count, 1)) / np.maximum(counts, 1)),
+            np.inf,
+        )
+
+
+class CountBonusPolicy(CountBasedPolicy):
+    def __init__(self, actions: tuple[Action, ...], q: QTable = None, beta: float = 1):
+        """
+        Count based optimism: the bonus of an action is beta / sqrt(n + 1), where n is the
+        number of times it was taken in the state. Unlike UCB the bonus of an action only
+        depends on its own count, so it fades away even if the others are never tried.
+
+        :param actions: actions available to select from
+        :param q: the Q table to be followed, agents set their own one when this is not provided
+        :param beta: scale of the bonus
+        """
+        super().__init__(actions, q)
+        self.beta = beta
+
+    def bonus(self, counts: np.ndarray, state_count: int) -> np.ndarray:
+        return self.beta / np.sqrt(counts + 1)
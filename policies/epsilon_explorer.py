@@ -1,3 +1,5 @@
+import numpy as np
+
 from grid_world.action import GWorldAction
 from grid_world.state import GWorldState
 from abstractions import DecayFunction, Policy
@@ -12,7 +14,9 @@ class EpsilonExplorer(Policy):
     ):
         """
         Similar to epsilon greedy, except for each state it maintains a set of reasonable
-        actions, giving any action outside this set probability 0.
+        actions, giving any action outside this set probability 0. Only the best action and
+        the reasonable actions of each state are stored, probabilities are computed from the
+        current epsilon whenever they are needed, so changing epsilon is O(1).
 
         :param epsilon: the epsilon parameter
         :param actions: actions available to select from
@@ -20,7 +24,6 @@ class EpsilonExplorer(Policy):
         whenever the decay method is called
 
         """
-        self.policy_map = {}
         self.best_action = {}
         self._epsilon = epsilon
         self.actions = actions
@@ -34,13 +37,6 @@ class EpsilonExplorer(Policy):
     @epsilon.setter
     def epsilon(self, new_epsilon):
         self._epsilon = new_epsilon
-        for state in {x for (x, _) in self.policy_map.keys()}:
-            self.update(
-                state,
-                self.best_action[state],
-                self.reasonable_actions[state],
-                force_update=True,
-            )
 
     def __call__(self, state: GWorldState, action: GWorldAction) -> float:
         valid_actions = self.reasonable_actions.get(state, self.actions)
@@ -48,8 +44,26 @@ class EpsilonExplorer(Policy):
             return 0
         elif len(valid_actions) == 1:
             return 1
+        elif (best_action := self.best_action.get(state)) is None:
+            return 1 / len(valid_actions)
+        elif action == best_action:
+            return 1 - self._epsilon
         else:
-            return self.policy_map.get((state, action), 1 / len(valid_actions))
+            return self._epsilon / (len(valid_actions) - 1)
+
+    def sample(
+        self, state: GWorldState, rng: np.random.Generator = None
+    ) -> GWorldAction:
+        rng = np.random if rng is None else rng
+        valid_actions = self.reasonable_actions.get(state, self.actions)
+        if (best_action := self.best_action.get(state)) is None:
+            return valid_actions[int(rng.uniform() * len(valid_actions))]
+        elif len(valid_actions) == 1 or rng.uniform() >= self._epsilon:
+            return best_action
+
+        # explore: pick uniformly among the other valid actions
+        i = int(rng.uniform() * (len(valid_actions) - 1))
+        return valid_actions[i + (i >= valid_actions.index(best_action))]
 
     def update(
         self,
@@ -65,23 +79,10 @@ class EpsilonExplorer(Policy):
         :param state: state to be updated
         :param best_action: the best action for this state
         :param valid_actions: the set for which actions should be chosen for this state
-        :param force_update: whether we should apply update, even if the best
-        action didn't change
+        :param force_update: kept for compatibility, updates are always applied
         """
-        if (
-            self.best_action.get(state) != best_action
-            or self.reasonable_actions.get(state) != valid_actions
-            or force_update
-        ):
-            # only need to update if best action, or valid actions changed for the state
-            self.reasonable_actions[state] = valid_actions
-            self.best_action[state] = best_action
-            for cur_a in valid_actions:
-                self.policy_map[state, cur_a] = (
-                    1 - self.epsilon
-                    if cur_a == best_action
-                    else self.epsilon / (len(valid_actions) - 1)
-                )
+        self.reasonable_actions[state] = valid_actions
+        self.best_action[state] = best_action
 
     def decay(self) -> None:
         """
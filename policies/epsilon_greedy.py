@@ -1,3 +1,5 @@
+import numpy as np
+
 from abstractions import Action, State, DecayFunction, Policy
 
 
@@ -10,14 +12,14 @@ class EpsilonGreedy(Policy):
     ):
         """
         An epsilon greedy policy, which tells the probability of taking an action
-        in a state
+        in a state. Only the best action of each state is stored, probabilities are computed
+        from the current epsilon whenever they are needed, so changing epsilon is O(1).
 
         :param epsilon: the epsilon parameter
         :param actions: actions available to select from
         :param epsilon_decay: a decaying function that will be applied to epsilon
         whenever the decay method is called
         """
-        self.policy_map = {}
         self.best_action = {}
         self._epsilon = epsilon
         self.actions = actions
@@ -30,14 +32,27 @@ class EpsilonGreedy(Policy):
     @epsilon.setter
     def epsilon(self, new_epsilon):
         self._epsilon = new_epsilon
-        for state in {x for (x, _) in self.policy_map.keys()}:
-            self.update(state, self.best_action[state], force_update=True)
 
     def __call__(self, state: State, action: Action) -> float:
-        if action in self.actions:
-            return self.policy_map.get((state, action), 1 / len(self.actions))
-        else:
+        if action not in self.actions:
             raise ValueError(f"action {action} is not part of policy")
+        elif (best_action := self.best_action.get(state)) is None:
+            return 1 / len(self.actions)
+        elif action == best_action:
+            return 1 - self._epsilon
+        else:
+            return self._epsilon / (len(self.actions) - 1)
+
+    def sample(self, state: State, rng: np.random.Generator = None) -> Action:
+        rng = np.random if rng is None else rng
+        if (best_action := self.best_action.get(state)) is None:
+            return self.actions[int(rng.uniform() * len(self.actions))]
+        elif len(self.actions) == 1 or rng.uniform() >= self._epsilon:
+            return best_action
+
+        # explore: pick uniformly among the other actions
+        i = int(rng.uniform() * (len(self.actions) - 1))
+        return self.actions[i + (i >= self.actions.index(best_action))]
 
     def update(
         self, state: State, best_action: Action, force_update: bool = False
@@ -48,17 +63,17 @@ class EpsilonGreedy(Policy):
 
         :param state: state to be updated
         :param best_action: the best action for this state
-        :param force_update: whether we should apply update, even if the best
-        action didn't change
+        :param force_update: kept for compatibility, updates are always applied
+        """
+        self.best_action[state] = best_action
+
+    def remove(self, state: State) -> None:
+        """
+        Forgets the best action of a state, the policy goes back to being uniform on it
+
+        :param state: state to be removed
         """
-        if (self.best_action.get(state) != best_action) or force_update:
-            self.best_action[state] = best_action
-            for cur_a in self.actions:
-                self.policy_map[state, cur_a] = (
-                    1 - self.epsilon
-                    if cur_a == best_action
-                    else self.epsilon / (len(self.actions) - 1)
-                )
+        self.best_action.pop(state, None)
 
     def decay(self) -> None:
         """
@@ -0,0 +1,115 @@
+import json
+import os
+import shutil
+import tempfile
+from typing import Any, Iterable
+
+import numpy as np
+
+from abstractions import Action, Policy, State
+from utils.state_codec import decode_states, decode_value, encode_states, encode_value
+
+
+class FrozenGreedyPolicy(Policy):
+    def __init__(
+        self,
+        actions: tuple[Action, ...],
+        states: Iterable[State],
+        action_indexes: np.ndarray,
+    ):
+        """
+        A read only greedy policy, meant for using trained agents. The action of each state is
+        stored as an int8 index in an array following the order of states, so it is cheap to
+        store, and actions of many states can be looked up at once.
+
+        :param actions: actions available to select from
+        :param states: states covered by the policy, these define the state index
+        :param action_indexes: for each state, the index of its action
+        """
+        if len(actions) > np.iinfo(np.int8).max:
+            raise ValueError("frozen policies support at most 127 actions")
+        self.actions = tuple(actions)
+        self.states = list(states)
+        self.state_index: dict[State, int] = {s: i for i, s in enumerate(self.states)}
+        self.action_indexes = np.asarray(action_indexes, dtype=np.int8)
+        if self.action_indexes.shape != (len(self.states),):
+            raise ValueError("there must be one action index for each state")
+
+    def __call__(self, state: State, action: Action) -> float:
+        if action not in self.actions:
+            raise ValueError(f"action {action} is not part of policy")
+        if (i := self.state_index.get(state)) is None:
+            return 0
+        return 1 if self.actions[self.action_indexes[i]] == action else 0
+
+    def act(self, state: State) -> Action:
+        """
+        Gets the action for a state.
+
+        :param state: the state to select the action for
+        :return: the greedy action
+        """
+        if (i := self.state_index.get(state)) is None:
+            raise ValueError(f"policy has no action for state: {state}")
+        return self.actions[self.action_indexes[i]]
+
+    def act_many(self, indexes: np.ndarray) -> np.ndarray:
+        """
+        Gets the actions of many states at once.
+
+        :param indexes: positions of the states in the state index
+        :return: indexes of the actions for each state
+        """
+        return self.action_indexes[indexes]
+
+    def sample(self, state: State, rng: np.random.Generator = None) -> Action:
+        return self.act(state)
+
+    def update(self, *args: Any) -> None:
+        raise TypeError("frozen policies can't be updated")
+
+    def dump(self, filename: str) -> None:
+        """
+        Saves the policy as a directory, with a JSON header holding the actions, and the states
+        and action indexes as NumPy arrays.
+
+        :param filename: the path where the policy will be saved
+        """
+        states, state_arrays = encode_states(self.states)
+        header = {"actions": encode_value(self.actions), "states": states}
+
+        directory = f"{filename}.policy"
+        tmp_directory = tempfile.mkdtemp(
+            prefix=".", dir=os.path.dirname(os.path.abspath(directory))
+        )
+        with open(os.path.join(tmp_directory, "header.json"), "w") as handle:
+            json.dump(header, handle)
+        np.save(os.path.join(tmp_directory, "action_indexes.npy"), self.action_indexes)
+        for name, array in state_arrays.items():
+            np.save(os.path.join(tmp_directory, f"_states.{name}.npy"), array)
+        shutil.rmtree(directory, ignore_errors=True)
+        os.replace(tmp_directory, directory)
+
+    @staticmethod
+    def load(filename: str, mmap: bool = True) -> "FrozenGreedyPolicy":
+        """
+        Loads a policy saved with dump.
+
+        :param filename: the path to the policy
+        :param mmap: whether the action indexes should be memory mapped
+        :return: the loaded policy
+        """
+        directory = f"{filename}.policy"
+        with open(os.path.join(directory, "header.json")) as handle:
+            header = json.load(handle)
+
+        def load_array(name: str) -> np.ndarray:
+            return np.load(
+                os.path.join(directory, f"{name}.npy"), mmap_mode="r" if mmap else None
+            )
+
+        return FrozenGreedyPolicy(
+            decode_value(header["actions"]),
+            decode_states(header["states"], lambda name: load_array(f"_states.{name}")),
+            load_array("action_indexes"),
+        )
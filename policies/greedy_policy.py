@@ -1,3 +1,5 @@
+import numpy as np
+
 from abstractions import Policy, Action, State
 
 
@@ -23,6 +25,11 @@ class GreedyPolicy(Policy):
         else:
             raise ValueError(f"action {action} is not part of policy")
 
+    def sample(self, state: State, rng: np.random.Generator = None) -> Action:
+        if (action := self.policy_map.get(state)) is None:
+            raise ValueError(f"policy has no action for state: {state}")
+        return action
+
     def update(self, state: State, best_action: Action) -> None:
         """
         Updates the best action for a state
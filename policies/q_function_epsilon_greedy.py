@@ -0,0 +1,63 @@
+from typing import Any, Callable
+
+import numpy as np
+
+from abstractions import Action, State, DecayFunction, Policy
+
+
+class QFunctionEpsilonGreedy(Policy):
+    def __init__(
+        self,
+        q_values: Callable[[State], np.ndarray],
+        epsilon: float = 0.1,
+        actions: tuple[Action, ...] = None,
+        epsilon_decay: DecayFunction = None,
+    ):
+        """
+        An epsilon greedy policy over a Q function that can be evaluated at any state, like a
+        function approximation. Nothing is stored per state: the best action is computed from the
+        Q function whenever it is needed, so the policy always follows its latest values.
+
+        :param q_values: gives the values of all actions in a state, following actions order
+        :param epsilon: the epsilon parameter
+        :param actions: actions available to select from
+        :param epsilon_decay: a decaying function that will be applied to epsilon
+        whenever the decay method is called
+        """
+        self.q_values = q_values
+        self.epsilon = epsilon
+        self.actions = actions
+        self.epsilon_decay = epsilon_decay
+
+    def best_action(self, state: State) -> Action:
+        return self.actions[int(np.argmax(self.q_values(state)))]
+
+    def __call__(self, state: State, action: Action) -> float:
+        if action not in self.actions:
+            raise ValueError(f"action {action} is not part of policy")
+        elif action == self.best_action(state):
+            return 1 - self.epsilon
+        else:
+            return self.epsilon / (len(self.actions) - 1)
+
+    def sample(self, state: State, rng: np.random.Generator = None) -> Action:
+        rng = np.random if rng is None else rng
+        best_i = int(np.argmax(self.q_values(state)))
+        if len(self.actions) == 1 or rng.uniform() >= self.epsilon:
+            return self.actions[best_i]
+
+        # explore: pick uniformly among the other actions
+        i = int(rng.uniform() * (len(self.actions) - 1))
+        return self.actions[i + (i >= best_i)]
+
+    def update(self, *args: Any) -> None:
+        """
+        Nothing to do, the policy follows the Q function as it changes
+        """
+
+    def decay(self) -> None:
+        """
+        Decay the value of epsilon
+        """
+        if self.epsilon_decay is not None:
+            self.epsilon = self.epsilon_decay(self.epsilon)
@@ -1,3 +1,5 @@
+import numpy as np
+
 from abstractions import Action, State, Policy
 
 
@@ -19,6 +21,10 @@ class RandomPolicy(Policy):
         else:
             raise ValueError(f"action {action} is not part of policy")
 
+    def sample(self, state: State, rng: np.random.Generator = None) -> Action:
+        rng = np.random if rng is None else rng
+        return self.actions[int(rng.uniform() * len(self.actions))]
+
     def update(self) -> None:
         """
         Do nothing at all
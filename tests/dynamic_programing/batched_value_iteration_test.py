@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from dynamic_programing.batched_value_iteration import batched_value_iteration
+from dynamic_programing.grid_world_solver import solve_grid_world
+from grid_world.grid_world import GridWorld
+from notebooks.utils.basics import basic_reward, basic_actions
+from notebooks.utils.worlds import small_world_02
+from tests.constants.grid_worlds import test_world_01
+
+
+class TestBatchedValueIteration:
+    @staticmethod
+    def test_batched_value_iteration():
+        worlds = [
+            test_world_01,
+            GridWorld(
+                grid_shape=(4, 5),
+                terminal_states_coordinates=((3, 4),),
+                walls_coordinates=((0, 1), (1, 1), (2, 3)),
+                traps_coordinates=((1, 3), (2, 2)),
+            ),
+            GridWorld(grid_shape=(4, 5), terminal_states_coordinates=((2, 2),)),
+        ]
+        results = batched_value_iteration(worlds, basic_reward, basic_actions)
+        assert len(results) == len(worlds)
+
+        for world, (pi, v) in zip(worlds, results):
+            _, expected_v = solve_grid_world(world, basic_reward, basic_actions)
+            assert v.keys() == expected_v.keys()
+            assert all(np.isclose(v[s], expected_v[s], atol=0.1) for s in v)
+
+            # following the policy from the start reaches the goal
+            state, effect, steps = world.initial_state, 0, 0
+            while effect != 1 and steps < world.grid_size:
+                action = next(a for a in basic_actions if pi(state, a) == 1)
+                state, effect = world.take_action(state, action)
+                steps += 1
+            assert effect == 1
+
+    @staticmethod
+    def test_different_shapes():
+        with pytest.raises(ValueError):
+            batched_value_iteration(
+                [test_world_01, small_world_02], basic_reward, basic_actions
+            )
@@ -0,0 +1,47 @@
+import os
+
+import numpy as np
+
+from dynamic_programing.grid_world_solver import solve_grid_world
+from dynamic_programing.solution_cache import SolutionCache
+from notebooks.utils.basics import basic_reward, basic_actions
+from tests.constants.grid_worlds import test_world_01
+
+
+class TestGridWorldSolver:
+    @staticmethod
+    def test_solve_grid_world():
+        pi, v = solve_grid_world(test_world_01, basic_reward, basic_actions)
+        s00 = test_world_01.get_state((0, 0))
+        s03 = test_world_01.get_state((0, 3))
+
+        # shortest path from the start goes around the walls
+        assert np.isclose(v[s00], -7)
+        assert np.isclose(v[s03], 0)
+        assert pi(s03, basic_actions[0]) == 1
+
+    @staticmethod
+    def test_cached_solution(tmp_path):
+        cache = SolutionCache(str(tmp_path))
+        pi_0, v_0 = solve_grid_world(
+            test_world_01, basic_reward, basic_actions, cache=cache
+        )
+        assert len(os.listdir(tmp_path)) == 1
+
+        pi_1, v_1 = solve_grid_world(
+            test_world_01, basic_reward, basic_actions, cache=cache
+        )
+        assert len(os.listdir(tmp_path)) == 1
+        assert pi_0.policy_map == pi_1.policy_map
+        assert all(np.isclose(v_0[s], v_1[s]) for s in test_world_01.states)
+
+        # a different reward or gamma generates a new entry
+        solve_grid_world(test_world_01, basic_reward, basic_actions, 0.9, cache=cache)
+        assert len(os.listdir(tmp_path)) == 2
+
+    @staticmethod
+    def test_cache_eviction(tmp_path):
+        cache = SolutionCache(str(tmp_path), max_bytes=0)
+        cache.store("a", np.zeros(3, dtype=np.int8), np.zeros(3))
+        assert cache.load("a") is None
+        assert len(os.listdir(tmp_path)) == 0
@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from exploring_agents.commons.eligibility_trace import EligibilityTrace
+from tests.constants.actions import a0, a1
+from tests.constants.states import s0, s1
+
+
+class TestEligibilityTrace:
+    @staticmethod
+    def test_accumulating_trace():
+        et = EligibilityTrace(kind="accumulating", et_lambda=0.5, gamma=0.8)
+        et.visited_arguments_update(s0, a0)
+        assert et(s0, a0) == 1
+        assert et(s1, a0) == 0
+
+        et.update()
+        et.visited_arguments_update(s1, a1)
+        assert np.isclose(et(s0, a0), 0.4)
+        assert et(s1, a1) == 1
+
+        et.update()
+        et.visited_arguments_update(s0, a0)
+        # visited traces get decayed one more time before being incremented
+        assert np.isclose(et(s0, a0), 0.4 * 0.4 * 0.4 + 1)
+        assert np.isclose(et(s1, a1), 0.4)
+        assert dict(et.items()).keys() == {(s0, a0), (s1, a1)}
+
+        # decaying everything except one argument
+        et.update(s1, a1)
+        assert np.isclose(et(s0, a0), 0.4 * (0.4 * 0.4 * 0.4 + 1))
+        assert np.isclose(et(s1, a1), 0.4)
+
+        et.reset()
+        assert et(s0, a0) == 0
+        assert et.get_relevant_arguments() == []
+
+    @staticmethod
+    def test_replacing_and_dutch_traces():
+        et = EligibilityTrace(kind="replacing", et_lambda=0.5, gamma=1)
+        et.visited_arguments_update(s0, a0)
+        et.update()
+        et.visited_arguments_update(s0, a0)
+        assert et(s0, a0) == 1
+
+        et = EligibilityTrace(kind="dutch", et_lambda=0.5, gamma=1, alpha=0.1)
+        et.visited_arguments_update(s0, a0)
+        et.update()
+        et.visited_arguments_update(s0, a0)
+        assert np.isclose(et(s0, a0), 0.9 * 0.5 * 0.5 + 1)
+
+        with pytest.raises(ValueError):
+            EligibilityTrace(kind="other").visited_arguments_update(s0, a0)
+
+    @staticmethod
+    def test_pruning():
+        et = EligibilityTrace(et_lambda=0.5, gamma=1, threshold=1e-3)
+        for i in range(1000):
+            et.visited_arguments_update(i)
+            et.update()
+
+        # only traces above the threshold are kept
+        assert len(et.get_relevant_arguments()) == 9
+        assert np.isclose(et(999), 0.5)
+        assert et(0) == 0
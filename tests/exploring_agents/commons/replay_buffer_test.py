@@ -0,0 +1,111 @@
+import numpy as np
+
+from exploring_agents.commons.replay_buffer import ReplayBuffer, batch_q_update
+from tests.constants.actions import a0, a1
+from tests.constants.states import s0, s1, s2
+from utils.q_table import QTable
+
+
+class TestReplayBuffer:
+    @staticmethod
+    def test_ring_storage():
+        buffer = ReplayBuffer(capacity=3)
+        for i in range(5):
+            buffer.add(i, 0, float(i), i + 1)
+        assert len(buffer) == 3
+        assert sorted(buffer.rows.tolist()) == [2, 3, 4]
+        assert set(buffer.sample(100).tolist()) == {0, 1, 2}
+
+    @staticmethod
+    def test_remove_row():
+        buffer = ReplayBuffer(capacity=4)
+        for i in range(6):
+            buffer.add(i % 3, 0, float(i), i % 3 + 1)
+        # rewards 2, 3, 4, 5 are left, from rows 2, 0, 1, 2
+        buffer.remove_row(1)
+        assert len(buffer) == 2
+        assert buffer.rewards[:2].tolist() == [2, 5]
+        buffer.add(0, 0, 6.0, 1)
+        assert buffer.rewards[:3].tolist() == [2, 5, 6]
+        assert set(buffer.sample(100).tolist()) == {0, 1, 2}
+
+    @staticmethod
+    def test_prioritized_sampling():
+        buffer = ReplayBuffer(capacity=10, prioritized=True, priority_exponent=1)
+        for i in range(4):
+            buffer.add(i, 0, 0, i)
+        buffer.update_priorities(np.arange(4), np.array([0, 0, 3, -1]))
+        samples = buffer.sample(10000)
+        assert np.isclose((samples == 2).mean(), 3 / 4, atol=2e-2)
+        assert np.isclose((samples == 0).mean(), 1e-3 / 4, atol=1e-3)
+
+        # new transitions get the highest priority
+        buffer.add(4, 0, 0, 4)
+        assert buffer.priorities[4] == 3
+
+    @staticmethod
+    def test_batch_q_update():
+        q = QTable((a0, a1), {(s1, a0): 1, (s1, a1): 2})
+        buffer = ReplayBuffer()
+        buffer.add(q.row(s0), 0, -1, q.row(s1))
+        buffer.add(q.row(s1), 1, 0, q.row(s2))
+
+        td_errors = batch_q_update(q, buffer, np.array([0, 1, 0]), alpha=0.5, gamma=1)
+        assert td_errors.tolist() == [1, -2, 1]
+        assert q[s0, a0] == 0.5
+        assert q[s1, a1] == 1
+        assert q.best_action(s1) == a0 and q.best_value(s0) == 0.5
+
+    @staticmethod
+    def test_importance_weights():
+        buffer = ReplayBuffer(
+            capacity=10,
+            prioritized=True,
+            priority_exponent=1,
+            importance_exponent=0.5,
+            importance_exponent_increment=0.25,
+        )
+        for i in range(2):
+            buffer.add(i, 0, 0, i)
+        buffer.update_priorities(np.arange(2), np.array([1, 3]))
+
+        # (N * P(i)) ** -0.5 is 2 ** -0.5 and (2 / 3) ** -0.5, scaled to the largest one
+        weights = buffer.importance_weights(np.array([0, 1]))
+        assert np.allclose(weights, [1, np.sqrt(1 / 3)])
+
+        # the exponent grows with every sample, up to 1
+        for _ in range(3):
+            buffer.sample(1)
+        assert buffer.importance_exponent == 1
+        weights = buffer.importance_weights(np.array([0, 1]))
+        assert np.allclose(weights, [1, 1 / 3])
+        assert ReplayBuffer().importance_weights(np.array([0, 0])).tolist() == [1, 1]
+
+    @staticmethod
+    def test_weights_correct_sampling_bias():
+        np.random.seed(0)
+        buffer = ReplayBuffer(
+            prioritized=True, priority_exponent=1, importance_exponent=1
+        )
+        td_errors = np.array([1.0, 2, 3, 10])
+        for i in range(4):
+            buffer.add(i, 0, 0, i)
+        buffer.update_priorities(np.arange(4), td_errors)
+
+        # sampled td errors lean towards the largest ones, weighted ones match the uniform mean
+        indexes = buffer.sample(100000)
+        weights = buffer.importance_weights(indexes)
+        assert td_errors[indexes].mean() > 7
+        weighted_mean = (weights * td_errors[indexes]).mean() / weights.mean()
+        assert np.isclose(weighted_mean, td_errors.mean(), rtol=2e-2)
+
+    @staticmethod
+    def test_weighted_batch_q_update():
+        q = QTable((a0, a1))
+        buffer = ReplayBuffer()
+        buffer.add(q.row(s0), 0, -1, q.row(s1))
+        buffer.add(q.row(s1), 1, 2, q.row(s2))
+
+        batch_q_update(q, buffer, np.array([0, 1]), 1, 1, np.array([0.5, 0.25]))
+        assert q[s0, a0] == -0.5
+        assert q[s1, a1] == 0.5
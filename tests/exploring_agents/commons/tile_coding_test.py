@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from exploring_agents.commons.tile_coding import (
+    TileCoder,
+    TiledQFunction,
+    coordinate_features,
+)
+from grid_world.state import GWorldState, TagState
+from tests.constants.actions import a0, a1
+
+
+class TestTileCoder:
+    @staticmethod
+    def test_active_features():
+        coder = TileCoder(n_tilings=8, tile_width=4, memory_size=1024)
+        features = coder((10, 20))
+        assert features.shape == (8,)
+        assert ((features >= 0) & (features < 1024)).all()
+        assert (coder((10, 20)) == features).all()
+
+        # nearby points share more tiles than distant ones
+        shared = [
+            len(np.intersect1d(features, coder((10 + d, 20)))) for d in (1, 2, 3, 8)
+        ]
+        assert shared == sorted(shared, reverse=True)
+        assert shared[0] == 6 and shared[-1] == 0
+
+        with pytest.raises(ValueError):
+            coder(tuple(range(6)))
+
+    @staticmethod
+    def test_coordinate_features():
+        assert coordinate_features(GWorldState((1, 2))) == (1, 2)
+        assert coordinate_features(TagState((1, 2), (3, 4))) == (1, 2, 3, 4)
+        assert coordinate_features(
+            TagState(GWorldState((1, 2)), GWorldState((3, 4)))
+        ) == (1, 2, 3, 4)
+
+
+class TestTiledQFunction:
+    @staticmethod
+    def test_values():
+        q = TiledQFunction((a0, a1), TileCoder(4, 2, 256), q_0=1)
+        s0, s1 = GWorldState((0, 0)), GWorldState((50, 50))
+        assert np.allclose(q.values(s0), [1, 1])
+
+        q.add(q.active_features(s0), a1, 2)
+        assert np.allclose(q.values(s0), [1, 3])
+        assert np.allclose(q.values(s1), [1, 1])
+        assert q.weights.shape == (256, 2)
@@ -0,0 +1,27 @@
+from exploring_agents.commons.transition_batch import TransitionBatch
+from tests.constants.actions import a0, a1
+from tests.constants.states import s0, s1, s2
+
+
+class TestTransitionBatch:
+    @staticmethod
+    def test_from_episode():
+        batch = TransitionBatch.from_episode(
+            [s0, s1, s0, s2], [a1, a0, a1], [0, -1, 1], (a0, a1)
+        )
+        assert len(batch) == 3
+        assert batch.states == (s0, s1, s2)
+        assert batch.state_ids.tolist() == [0, 1, 0]
+        assert batch.next_state_ids.tolist() == [1, 0, 2]
+        assert batch.action_ids.tolist() == [1, 0, 1]
+
+        # reward functions get effects as they are, once for each of them
+        effects = []
+
+        def reward_function(effect):
+            effects.append(effect)
+            return {0: -1, -1: -100, 1: 0}[effect]
+
+        assert batch.rewards(reward_function).tolist() == [-1, -100, 0]
+        assert sorted(effects) == [-1, 0, 1]
+        assert all(type(e) is int for e in effects)
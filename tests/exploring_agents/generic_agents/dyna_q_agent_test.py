@@ -0,0 +1,27 @@
+from exploring_agents import DynaQAgent
+from notebooks.utils.basics import basic_reward
+from tests.constants.actions import a0, a1
+from tests.constants.states import s0, s1, s2
+
+
+class TestDynaQAgent:
+    @staticmethod
+    def test_planning():
+        for planning_steps, expected_q in [(0, -0.5), (10, -0.75)]:
+            agent = DynaQAgent(
+                reward_function=basic_reward,
+                actions=(a0, a1),
+                alpha=0.5,
+                epsilon=0,
+                planning_steps=planning_steps,
+            )
+            assert agent.run_update(s0, a0, 0, s1) == basic_reward(0)
+            assert agent.model[s0, a0] == (s1, 0)
+            assert agent.q[s0, a0] == -0.5
+
+            # learning about s1 changes what we expect from s0, planning propagates it backwards
+            agent.run_update(s1, a0, 0, s2)
+            assert agent.predecessors[s1] == {(s0, a0)}
+            assert agent.q[s1, a0] == -0.5
+            assert agent.q[s0, a0] == expected_q
+            assert len(agent._queue) == (1 if planning_steps == 0 else 0)
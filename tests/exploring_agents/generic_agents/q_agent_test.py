@@ -1,6 +1,7 @@
 import numpy as np
 
 from exploring_agents import QAgent
+from exploring_agents.commons.replay_buffer import ReplayBuffer
 from notebooks.utils.basics import basic_reward
 from tests.constants.actions import a0, a1, a2, a3
 from tests.constants.states import s0, s1
@@ -71,3 +72,20 @@ class TestQAgent:
         assert agent1.q[(s0, a1)] == alpha * (
             basic_reward(1) + gamma * agent1.q[(s1, a0)]
         )
+
+    @staticmethod
+    def test_replay():
+        agent = QAgent(
+            reward_function=basic_reward,
+            actions=(a0, a1),
+            alpha=0.5,
+            epsilon=0,
+            replay_buffer=ReplayBuffer(capacity=10),
+            replay_batch_size=4,
+        )
+        agent.run_update(s0, a1, 0, s1)
+        assert len(agent.replay_buffer) == 1
+
+        # the only transition is seen once by the update, and again from the buffer
+        assert agent.q[s0, a1] == 0.75 * basic_reward(0)
+        assert agent.select_action(s0) == a0
@@ -0,0 +1,75 @@
+import numpy as np
+
+from abstractions import Agent
+
+from exploring_agents import SuccessorRepresentationAgent
+from exploring_agents.training import run_episode, train_agent
+from grid_world.action import GWorldAction
+from grid_world.grid_world import GridWorld
+from notebooks.utils.basics import basic_actions, basic_reward
+from notebooks.utils.worlds import small_world_03
+
+
+class TestSuccessorRepresentationAgent:
+    @staticmethod
+    def test_train():
+        np.random.seed(0)
+        agent = SuccessorRepresentationAgent(
+            basic_reward,
+            basic_actions,
+            alpha=0.5,
+            epsilon_decay=lambda x: 0.9 * x,
+        )
+        train_agent(agent, small_world_03, 200)
+
+        agent.policy.epsilon = 0
+        episode_states, _, _ = run_episode(agent, small_world_03)
+        assert len(episode_states) < 20
+        assert agent.m.shape[:2] == (agent.q.capacity, len(basic_actions))
+
+    @staticmethod
+    def test_set_reward_function():
+        np.random.seed(0)
+        agent = SuccessorRepresentationAgent(basic_reward, basic_actions, alpha=0.5)
+        train_agent(agent, small_world_03, 50)
+        q = agent.q.copy()
+
+        # q is linear on rewards, so scaling them scales q without any training
+        agent.set_reward_function(lambda effect: 2 * basic_reward(effect))
+        assert len(agent.q) == len(q)
+        for state, action in q:
+            assert np.isclose(agent.q[state, action], 2 * q[state, action])
+            assert agent.policy.best_action[state] == agent.q.best_action(state)
+
+    @staticmethod
+    def test_set_reward_function_changes_policy():
+        np.random.seed(0)
+        world = GridWorld(
+            grid_shape=(4, 4),
+            terminal_states_coordinates=((3, 3),),
+            traps_coordinates=((1, 0),),
+        )
+        agent = SuccessorRepresentationAgent(basic_reward, basic_actions, alpha=0.5)
+        train_agent(agent, world, 100)
+        # the trap is right of the initial state, both ways to the terminal are as long
+        assert agent.q.best_action(world.initial_state) == GWorldAction.up
+
+        # once the trap pays, it is worth stepping into it over and over
+        agent.set_reward_function(
+            lambda effect: 10 if effect == -1 else basic_reward(effect)
+        )
+        assert agent.q.best_action(world.initial_state) == GWorldAction.right
+        assert agent.policy.best_action[world.initial_state] == GWorldAction.right
+
+    @staticmethod
+    def test_load_and_train(tmp_path):
+        np.random.seed(0)
+        agent = SuccessorRepresentationAgent(basic_reward, basic_actions, alpha=0.5)
+        train_agent(agent, small_world_03, 5)
+        agent.dump(f"{tmp_path}/agent")
+        loaded = Agent.load(f"{tmp_path}/agent")
+        # q of the loaded agent is just large enough for its states, smaller than its arrays
+        n = len(loaded.q.states)
+        assert loaded.q.capacity == n < loaded.m.shape[0]
+        train_agent(loaded, small_world_03, 20)
+        assert n < len(loaded.q.states) <= loaded.m.shape[0]
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from exploring_agents import TileCodingAgent
+from exploring_agents.training import run_episode, run_tag_episode, train_agent
+from grid_world.grid_world import GridWorld
+from notebooks.utils.basics import basic_actions, basic_reward, basic_tag_reward
+from notebooks.utils.worlds import tagging_world_00
+
+
+class TestTileCodingAgent:
+    @staticmethod
+    @pytest.mark.parametrize("method", ["q_learning", "sarsa"])
+    def test_train(method):
+        np.random.seed(0)
+        world = GridWorld(grid_shape=(30, 30), terminal_states_coordinates=((29, 29),))
+        agent = TileCodingAgent(
+            basic_reward,
+            basic_actions,
+            alpha=0.5,
+            epsilon=0.1,
+            method=method,
+            tile_width=8,
+            memory_size=1024,
+            epsilon_decay=lambda x: 0.9 * x,
+        )
+        train_agent(agent, world, 50)
+
+        # values generalize, so the greedy path is close to the shortest one(58 steps)
+        agent.policy.epsilon = 0
+        episode_states, _, _ = run_episode(agent, world)
+        assert len(episode_states) < 90
+        assert agent.q.weights.shape == (1024, 4)
+
+    @staticmethod
+    def test_tag():
+        np.random.seed(0)
+        agents = [
+            TileCodingAgent(basic_tag_reward, basic_actions, method="sarsa"),
+            TileCodingAgent(basic_tag_reward, basic_actions, terminal_effects=(1, -1)),
+        ]
+        states_1, _, actions_1, states_2, _, _ = run_tag_episode(
+            *agents, tagging_world_00, episode_max_length=20
+        )
+        assert len(states_1) == len(actions_1) + 1 <= 21
+        assert agents[0].next_action is None
+
+    @staticmethod
+    def test_invalid_method():
+        with pytest.raises(ValueError):
+            TileCodingAgent(basic_reward, basic_actions, method="td")
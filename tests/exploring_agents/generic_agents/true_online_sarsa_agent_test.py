@@ -0,0 +1,86 @@
+import numpy as np
+
+from exploring_agents import TrueOnlineSarsaAgent
+from notebooks.utils.basics import basic_reward
+from tests.constants.actions import a0, a1, a2
+from tests.constants.states import s0, s1, s2
+
+
+class TestTrueOnlineSarsaAgent:
+    @staticmethod
+    def _reference_updates(transitions, gamma, alpha, et_lambda, actions, q_0):
+        """
+        Straightforward implementation of true online SARSA(lambda) over dicts
+        """
+        q = dict(q_0)
+        z = {}
+        q_old = 0
+        for state, action, effect, next_state, next_action in transitions:
+            cur_q = q.get((state, action), 0)
+            next_q = q.get((next_state, next_action), 0)
+            delta = basic_reward(effect) + gamma * next_q - cur_q
+            cur_trace = z.get((state, action), 0)
+            z = {k: gamma * et_lambda * v for k, v in z.items()}
+            z[state, action] = (
+                z.get((state, action), 0) + 1 - alpha * gamma * et_lambda * cur_trace
+            )
+            for k, v in z.items():
+                q[k] = q.get(k, 0) + alpha * (delta + cur_q - q_old) * v
+            q[state, action] -= alpha * (cur_q - q_old)
+            q_old = next_q
+        return {k: v for k, v in q.items() if v != 0}
+
+    @staticmethod
+    def test_run_update():
+        actions = (a0, a1, a2)
+        q_0 = {(s1, a0): 1, (s2, a2): -1}
+        gamma, alpha, et_lambda = 0.9, 0.3, 0.8
+        agent = TrueOnlineSarsaAgent(
+            reward_function=basic_reward,
+            actions=actions,
+            gamma=gamma,
+            alpha=alpha,
+            epsilon=0,
+            et_lambda=et_lambda,
+            q_0=q_0,
+        )
+
+        transitions = []
+        for state, action, effect, next_state in [
+            (s0, a1, 0, s1),
+            (s1, a0, 0, s2),
+            (s2, a2, 1, s0),
+            (s0, a1, 0, s1),
+        ]:
+            assert agent.run_update(state, action, effect, next_state) == basic_reward(
+                effect
+            )
+            transitions.append((state, action, effect, next_state, agent.next_action))
+
+        expected = TestTrueOnlineSarsaAgent._reference_updates(
+            transitions, gamma, alpha, et_lambda, actions, q_0
+        )
+        q = {k: v for k, v in agent.q.items() if v != 0}
+        assert q.keys() == expected.keys()
+        assert all(np.isclose(q[k], expected[k]) for k in expected)
+
+        # greedy policy follows the learned values
+        for s in (s0, s1, s2):
+            assert agent.select_action(
+                s, use_cached_action=False
+            ) == agent.q.best_action(s)
+
+    @staticmethod
+    def test_finalize_episode():
+        agent = TrueOnlineSarsaAgent(
+            reward_function=basic_reward, actions=(a0, a1), et_lambda=0.5
+        )
+        agent.run_update(s0, a0, 0, s1)
+        agent.run_update(s1, a1, 0, s2)
+        assert len(agent.active_rows) == 2
+
+        agent.finalize_episode([], [], [])
+        assert agent.next_action is None
+        assert len(agent.active_rows) == 0
+        assert not agent.traces.any()
+        assert agent.q_old == 0
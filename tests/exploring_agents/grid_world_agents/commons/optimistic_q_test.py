@@ -0,0 +1,43 @@
+import numpy as np
+
+from exploring_agents import QAgent
+from exploring_agents.grid_world_agents.commons.optimistic_q import get_optimistic_q
+from exploring_agents.grid_world_agents.commons.world_map import WorldMap
+from exploring_agents.training import run_episode
+from grid_world.action import GWorldAction
+from grid_world.state import GWorldState
+from notebooks.utils.basics import basic_actions, basic_reward
+from notebooks.utils.worlds import small_world_01
+
+
+class TestGetOptimisticQ:
+    @staticmethod
+    def test_empty_map():
+        q = get_optimistic_q(basic_reward, basic_actions, (4, 5), (0, 4), gamma=0.5)
+        assert len(q.states) == 4 * 5 - 1
+
+        # 4 steps to the terminal state, and moving away takes 2 more
+        initial = GWorldState((0, 0), "initial")
+        assert np.isclose(q.best_value(initial), -(1 - 0.5**3) / 0.5)
+        assert q.best_action(initial) == GWorldAction.up
+        assert np.isclose(q[initial, GWorldAction.right], -(1 - 0.5**5) / 0.5)
+        assert q.best_value(GWorldState((0, 3))) == 0
+
+    @staticmethod
+    def test_known_map():
+        walls = {GWorldState(c, "wall") for c in small_world_01.walls_coordinates}
+        world_map = WorldMap(basic_actions, set(small_world_01.states) | walls)
+        q = get_optimistic_q(
+            basic_reward, basic_actions, (4, 5), (0, 4), world_map=world_map
+        )
+
+        # with the whole map known the values are the optimal ones
+        initial = small_world_01.initial_state
+        assert q.best_value(initial) == -7
+        trap = GWorldState((1, 3), "trap")
+        assert q[trap, GWorldAction.up] == -1 - 7
+        assert q[GWorldState((1, 2)), GWorldAction.up] == -100 - 8
+
+        agent = QAgent(basic_reward, basic_actions, epsilon=0, q_0=q)
+        episode_states, _, _ = run_episode(agent, small_world_01)
+        assert len(episode_states) == 9
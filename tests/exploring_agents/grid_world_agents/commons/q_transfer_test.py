@@ -0,0 +1,84 @@
+import numpy as np
+
+from exploring_agents import QAgent
+from exploring_agents.grid_world_agents.commons.q_transfer import (
+    transfer_q,
+    transfer_v,
+)
+from grid_world.action import GWorldAction
+from grid_world.grid_world import GridWorld
+from grid_world.state import GWorldState
+from notebooks.utils.basics import basic_actions, basic_reward
+from utils.q_table import QTable
+
+# small_world_01 without the wall at (2, 3), and with a new one at (3, 0)
+moved_wall_world = GridWorld(
+    grid_shape=(4, 5),
+    terminal_states_coordinates=((0, 4),),
+    walls_coordinates=((0, 1), (1, 1), (3, 0)),
+    traps_coordinates=((1, 3),),
+)
+
+
+class TestTransferQ:
+    @staticmethod
+    def test_transfer():
+        q = QTable(basic_actions)
+        q[GWorldState((0, 0), "initial"), GWorldAction.up] = -3
+        q[GWorldState((2, 3), "empty"), GWorldAction.left] = -2
+        q[GWorldState((3, 0), "empty"), GWorldAction.up] = -5
+
+        transferred = transfer_q(q, moved_wall_world, unseen=-1)
+        assert len(transferred.states) == 4 * 5 - 3 - 1
+        assert transferred[moved_wall_world.initial_state, GWorldAction.up] == -3
+
+        # the wall is gone, so its values are there
+        assert transferred[GWorldState((2, 3)), GWorldAction.left] == -2
+        assert GWorldState((3, 0), "wall") not in transferred.state_index
+
+        # the constant sets everything else
+        assert len(transferred) == len(transferred.states) * len(basic_actions)
+        assert transferred[moved_wall_world.initial_state, GWorldAction.down] == -1
+        assert transferred[GWorldState((2, 3)), GWorldAction.up] == -1
+        assert transferred[GWorldState((2, 2)), GWorldAction.right] == -1
+
+    @staticmethod
+    def test_constant_agrees_with_updates():
+        transferred = transfer_q(QTable(basic_actions), moved_wall_world, unseen=-50)
+        state, action = moved_wall_world.initial_state, GWorldAction.up
+        assert transferred.get((state, action), 0) == -50
+        assert transferred.best_value(state) == -50
+
+        # an update starts from the constant, and bootstraps from it
+        agent = QAgent(basic_reward, basic_actions, alpha=0.5, q_0=transferred)
+        next_state, effect = moved_wall_world.take_action(state, action)
+        agent.run_update(state, action, effect, next_state)
+        assert agent.q[state, action] == -50 + 0.5 * (-1 - 50 + 50)
+
+    @staticmethod
+    def test_unseen_table():
+        q = QTable(basic_actions)
+        q[GWorldState((2, 3)), GWorldAction.left] = -2
+        unseen = QTable(basic_actions)
+        unseen[GWorldState((2, 2)), GWorldAction.left] = -7
+        unseen[GWorldState((2, 3)), GWorldAction.right] = -7
+
+        transferred = transfer_q(q, moved_wall_world, unseen=unseen)
+        assert transferred[GWorldState((2, 2)), GWorldAction.left] == -7
+        assert (GWorldState((2, 2)), GWorldAction.up) not in transferred
+        assert transferred[GWorldState((2, 3)), GWorldAction.left] == -2
+        assert transferred[GWorldState((2, 3)), GWorldAction.right] == -7
+        assert len(transferred) == 3
+
+
+class TestTransferV:
+    @staticmethod
+    def test_transfer():
+        v = {GWorldState((2, 4)): -2, GWorldState((3, 3)): -3}
+        q = transfer_v(v, moved_wall_world, basic_reward, basic_actions, unseen=-10)
+        assert len(q) == (4 * 5 - 3 - 1) * len(basic_actions)
+        assert q[GWorldState((2, 3)), GWorldAction.up] == -1 - 2
+        assert q[GWorldState((2, 3)), GWorldAction.right] == -1 - 3
+        assert q[GWorldState((1, 4)), GWorldAction.left] == 0
+        assert q[GWorldState((0, 0), "initial"), GWorldAction.down] == -1 - 10
+        assert np.isclose(q.best_value(GWorldState((1, 2))), -1 - 10)
@@ -0,0 +1,153 @@
+import itertools
+
+import numpy as np
+
+from exploring_agents import MonteCarloAgent, QAgent
+from exploring_agents.grid_world_agents import EncodedTagAgent
+from exploring_agents.grid_world_agents.commons.tag_encoders import (
+    RelativeTagEncoder,
+    SymmetricTagEncoder,
+    TagOffsetState,
+)
+from grid_world.action import GWorldAction
+from grid_world.grid_world import GridWorld
+from grid_world.state import TagState
+from notebooks.utils.basics import basic_actions, basic_tag_reward
+from notebooks.utils.worlds import tagging_world_00, tagging_world_02
+from exploring_agents.training import run_tag_episode
+
+
+class TestRelativeTagEncoder:
+    @staticmethod
+    def test_encode():
+        encoder = RelativeTagEncoder()
+        assert encoder.encode(TagState((0, 0), (1, 2))) == TagOffsetState((1, 2))
+        assert encoder.encode(TagState((3, 1), (4, 3))) == TagOffsetState((1, 2))
+        assert encoder.encode(TagState((0, 0), (2, 1))) == TagOffsetState((2, 1))
+        assert encoder.encode_action(TagState((0, 0), (2, 1)), GWorldAction.up) == (
+            GWorldAction.up
+        )
+
+    @staticmethod
+    def test_symmetric_encode():
+        encoder = RelativeTagEncoder(symmetric=True)
+        offsets = [(1, 2), (2, 1), (-1, 2), (2, -1), (-2, -1), (1, -2)]
+        states = [TagState((3, 3), (3 + x, 3 + y)) for x, y in offsets]
+        assert len({encoder.encode(s) for s in states}) == 1
+
+        # moving towards the other agent is the same encoded action everywhere
+        towards = [
+            encoder.encode_action(s, a)
+            for s, a in zip(
+                states,
+                [
+                    GWorldAction.up,
+                    GWorldAction.right,
+                    GWorldAction.up,
+                    GWorldAction.right,
+                    GWorldAction.left,
+                    GWorldAction.down,
+                ],
+            )
+        ]
+        assert len(set(towards)) == 1
+        for s, a in itertools.product(states, GWorldAction):
+            assert encoder.decode_action(s, encoder.encode_action(s, a)) == a
+
+
+class TestSymmetricTagEncoder:
+    @staticmethod
+    def test_symmetries():
+        assert len(SymmetricTagEncoder(tagging_world_00)._matrices) == 8
+        assert len(SymmetricTagEncoder(tagging_world_02)._matrices) == 1
+        # a rectangular world can only be reflected or turned around
+        assert len(SymmetricTagEncoder(GridWorld(grid_shape=(3, 5)))._matrices) == 4
+        assert (
+            len(
+                SymmetricTagEncoder(
+                    GridWorld(grid_shape=(3, 3), walls_coordinates=((0, 1),))
+                )._matrices
+            )
+            == 2
+        )
+
+    @staticmethod
+    def test_traps_keep_initial_state():
+        # agents falling in the trap are sent to the initial state, which only the swap of
+        # axes leaves in place
+        world = GridWorld(
+            grid_shape=(5, 5),
+            initial_state_coordinates=(0, 0),
+            traps_coordinates=((2, 2),),
+        )
+        encoder = SymmetricTagEncoder(world)
+        assert len(encoder._matrices) == 2
+        for matrix in encoder._matrices:
+            assert encoder._transform(matrix, (0, 0)) == (0, 0)
+
+    @staticmethod
+    def test_encoding_commutes_with_dynamics():
+        world = GridWorld(grid_shape=(4, 4), walls_coordinates=((1, 1), (2, 2)))
+        encoder = SymmetricTagEncoder(world)
+        assert len(encoder._matrices) == 4
+
+        for s_1, s_2 in itertools.product(world.states, repeat=2):
+            state = TagState(s_1.coordinates, s_2.coordinates)
+            encoded = encoder.encode(state)
+            for action in basic_actions:
+                # moving agent 1 and then encoding is the same as moving in the encoded world
+                next_1, _ = world.take_action(s_1, action)
+                next_encoded = encoder.encode(
+                    TagState(next_1.coordinates, s_2.coordinates)
+                )
+
+                encoded_action = encoder.encode_action(state, action)
+                moved, _ = world.take_action(
+                    world.get_state(encoded.coordinates_1), encoded_action
+                )
+                assert next_encoded == encoder.encode(
+                    TagState(moved.coordinates, encoded.coordinates_2)
+                )
+                assert encoder.decode_action(state, encoded_action) == action
+
+
+class TestEncodedTagAgent:
+    @staticmethod
+    def test_shrinks_q():
+        np.random.seed(0)
+        agents = [
+            EncodedTagAgent(
+                QAgent(basic_tag_reward, basic_actions),
+                SymmetricTagEncoder(tagging_world_00),
+            ),
+            QAgent(basic_tag_reward, basic_actions),
+        ]
+        for _ in range(20):
+            run_tag_episode(*agents, tagging_world_00, episode_max_length=50)
+
+        encoded_states = agents[0].agent.q.states
+        assert len(encoded_states) > 0
+        assert len(encoded_states) <= len(tagging_world_00.states) ** 2 / 8 + len(
+            tagging_world_00.states
+        )
+        assert agents[0].gamma == 1 and agents[0].actions == basic_actions
+
+    @staticmethod
+    def test_finalize_episode_encodes():
+        np.random.seed(0)
+        agent = EncodedTagAgent(
+            MonteCarloAgent(basic_tag_reward, basic_actions), RelativeTagEncoder()
+        )
+        for _ in range(5):
+            run_tag_episode(
+                agent,
+                QAgent(basic_tag_reward, basic_actions),
+                tagging_world_00,
+                episode_max_length=20,
+            )
+            assert agent.episode_states == [] and agent.episode_actions == []
+
+        # Monte Carlo agents only learn when episodes end
+        states = agent.agent.q.states
+        assert len(states) > 0
+        assert all(isinstance(s, TagOffsetState) for s in states)
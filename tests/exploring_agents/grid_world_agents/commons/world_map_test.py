@@ -0,0 +1,72 @@
+import numpy as np
+
+from exploring_agents.grid_world_agents.commons.world_map import WorldMap
+from grid_world.action import GWorldAction
+from grid_world.state import GWorldState
+from notebooks.utils.basics import basic_actions
+from utils.operations import add_tuples
+
+
+def _expected_reasonable_actions(world_map: WorldMap):
+    no_go = {
+        s.coordinates for s in world_map.world_states if s.kind in {"trap", "wall"}
+    }
+    return {
+        s: [
+            a
+            for a in basic_actions
+            if add_tuples(s.coordinates, a.direction) not in no_go
+        ]
+        for s in world_map.world_states
+    }
+
+
+class TestWorldMap:
+    @staticmethod
+    def test_update_map():
+        terminal = GWorldState((3, 3), "terminal")
+        world_map = WorldMap(basic_actions, {terminal})
+        assert world_map.reasonable_actions == {terminal: list(basic_actions)}
+
+        s0, s1, s2 = GWorldState((0, 0)), GWorldState((0, 1)), GWorldState((1, 2))
+        assert world_map.update_map(s0, GWorldAction.up, s1) == set()
+        assert world_map.update_map(GWorldState((1, 1)), GWorldAction.up, s2) == set()
+
+        # bumping into something adds a wall, and the state loses the action leading to it
+        wall = GWorldState((0, 2), "wall")
+        assert world_map.update_map(s1, GWorldAction.up, s1) == {wall, s1, s2}
+        assert wall in world_map.world_states
+        assert GWorldAction.up not in world_map.reasonable_actions[s1]
+        assert GWorldAction.left not in world_map.reasonable_actions[s2]
+        assert GWorldAction.up in world_map.reasonable_actions[s2]
+
+        # traps are always meaningful
+        trap = GWorldState((1, 0), "trap")
+        assert world_map.update_map(s0, GWorldAction.right, trap) == {trap}
+        assert world_map.update_map(s0, GWorldAction.right, trap) == {trap}
+        assert world_map.no_go_coordinates == {(0, 2), (1, 0)}
+        assert world_map.reasonable_actions == _expected_reasonable_actions(world_map)
+
+    @staticmethod
+    def test_matches_full_recomputation():
+        rng = np.random.default_rng(0)
+        kinds = ["empty", "empty", "empty", "wall", "trap"]
+        world_map = WorldMap(basic_actions)
+        for _ in range(300):
+            state = GWorldState(tuple(rng.integers(0, 6, 2).tolist()))
+            action = basic_actions[rng.integers(len(basic_actions))]
+            if rng.uniform() < 0.2:
+                next_state = state
+            else:
+                next_state = GWorldState(
+                    add_tuples(state.coordinates, action.direction),
+                    kinds[rng.integers(len(kinds))],
+                )
+            previous = dict(world_map.reasonable_actions)
+            changed_states = world_map.update_map(state, action, next_state)
+            assert world_map.reasonable_actions == _expected_reasonable_actions(
+                world_map
+            )
+            assert {
+                s for s in previous if previous[s] != world_map.reasonable_actions[s]
+            } <= changed_states
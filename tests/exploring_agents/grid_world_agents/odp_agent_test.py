@@ -0,0 +1,23 @@
+import numpy as np
+import pytest
+
+from exploring_agents.grid_world_agents import ODPAgent
+from notebooks.utils.basics import basic_actions, basic_reward
+
+
+class TestODPAgent:
+    @staticmethod
+    @pytest.mark.parametrize(
+        "gamma, expected", [(1, [-1, -2, -3]), (0.5, [-1, -1.5, -1.75])]
+    )
+    def test_discounted_values(gamma, expected):
+        agent = ODPAgent(
+            basic_reward,
+            (3, 3),
+            basic_actions,
+            terminal_coordinates=(2, 2),
+            gamma=gamma,
+        )
+        v = {s.coordinates: value for s, value in agent.v_pi.items()}
+        # states 2, 3 and 4 steps away from the terminal, each step costs 1
+        assert np.allclose([v[(1, 1)], v[(0, 1)], v[(0, 0)]], expected)
@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from exploring_agents.training import train_population
+from notebooks.utils.basics import basic_reward, basic_actions
+from notebooks.utils.worlds import small_world_01
+
+
+class TestTrainPopulation:
+    @staticmethod
+    @pytest.mark.parametrize("method, max_length", [("q_learning", 9), ("sarsa", 11)])
+    def test_train_population(method, max_length):
+        lengths, returns = train_population(
+            small_world_01,
+            basic_reward,
+            basic_actions,
+            replicas=20,
+            episodes=200,
+            method=method,
+            alpha=0.5,
+            epsilon=0.5,
+            epsilon_decay=lambda x: 0.95 * x if x > 0.01 else 0,
+            rng=np.random.default_rng(0),
+        )
+
+        assert len(lengths) == len(returns) == 20
+        assert all(len(x) == 200 for x in lengths + returns)
+        # once exploration is over every replica follows a fixed path to the terminal state, the
+        # shortest takes 8 steps, and sarsa may prefer a longer one that keeps away from the trap
+        assert all(x[-1] == x[-2] <= max_length for x in lengths)
+        assert all(r[-1] == 2 - n[-1] for n, r in zip(lengths, returns))
+        # returns only count the steps of each episode
+        assert all(
+            r >= -100 * (n - 1) for x, y in zip(lengths, returns) for n, r in zip(x, y)
+        )
+
+    @staticmethod
+    def test_invalid_method():
+        with pytest.raises(ValueError):
+            train_population(small_world_01, basic_reward, basic_actions, 2, 1, "td")
@@ -0,0 +1,57 @@
+import numpy as np
+
+from exploring_agents import LambdaQAgent, QAgent
+from exploring_agents.training import run_episode, train_shared
+from notebooks.utils.basics import basic_reward, basic_actions
+from notebooks.utils.worlds import small_world_01
+
+
+class TestTrainShared:
+    @staticmethod
+    def test_learners_match_run_update():
+        np.random.seed(0)
+        behaviour = QAgent(basic_reward, basic_actions, epsilon=0.5)
+        learners = [
+            QAgent(basic_reward, basic_actions, gamma=gamma, alpha=alpha)
+            for gamma in (0.9, 1)
+            for alpha in (0.1, 0.5)
+        ]
+        references = [
+            QAgent(basic_reward, basic_actions, gamma=x.gamma, alpha=x.alpha)
+            for x in learners
+        ]
+
+        train_shared(behaviour, learners, small_world_01, episodes=5)
+
+        # replay the same episodes through run_update
+        np.random.seed(0)
+        behaviour = QAgent(basic_reward, basic_actions, epsilon=0.5)
+        for _ in range(5):
+            states, _, actions = run_episode(behaviour, small_world_01)
+            for agent in references:
+                for state, action, next_state in zip(states, actions, states[1:]):
+                    _, effect = small_world_01.take_action(state, action)
+                    agent.run_update(state, action, effect, next_state)
+
+        for learner, reference in zip(learners, references):
+            assert learner.q.keys() == reference.q.keys()
+            for key in reference.q:
+                assert np.isclose(learner.q[key], reference.q[key])
+            assert learner.policy.best_action == reference.policy.best_action
+
+    @staticmethod
+    def test_off_policy_learning():
+        np.random.seed(1)
+        # an agent that keeps exploring generates the experience
+        behaviour = QAgent(basic_reward, basic_actions, epsilon=0.5)
+        learners = [
+            QAgent(basic_reward, basic_actions, alpha=0.5, epsilon=0),
+            LambdaQAgent(basic_reward, basic_actions, alpha=0.5, epsilon=0),
+        ]
+        lengths, returns = train_shared(behaviour, learners, small_world_01, 100)
+
+        assert len(lengths) == len(returns) == 100
+        for learner in learners:
+            # following the greedy policy leads to the terminal state through the shortest path
+            episode_states, _, _ = run_episode(learner, small_world_01)
+            assert len(episode_states) == 9
@@ -1,4 +1,5 @@
 from grid_world.action import GWorldAction
+from grid_world.grid_world import GridWorld
 from tests.constants.grid_worlds import test_world_01
 
 
@@ -70,3 +71,40 @@ class TestGridWorld:
         assert test_world_01.take_action(s13, GWorldAction.down_right) == (s00, 0)
         assert test_world_01.take_action(s13, GWorldAction.down_left) == (s00, 0)
         assert test_world_01.take_action(s13, GWorldAction.wait) == (s00, 0)
+
+    @staticmethod
+    def test_fingerprint():
+        same_world = GridWorld(
+            grid_shape=(4, 5),
+            terminal_states_coordinates=((0, 4),),
+            walls_coordinates=((2, 3), (1, 1), (0, 1)),
+            traps_coordinates=((1, 3),),
+        )
+        other_world = GridWorld(
+            grid_shape=(4, 5),
+            terminal_states_coordinates=((0, 4),),
+            walls_coordinates=((0, 1), (1, 1), (2, 3)),
+            traps_coordinates=((1, 2),),
+        )
+        windy_world = GridWorld(
+            grid_shape=(4, 5),
+            terminal_states_coordinates=((0, 4),),
+            walls_coordinates=((0, 1), (1, 1), (2, 3)),
+            traps_coordinates=((1, 3),),
+            wind=lambda s: GWorldAction.up,
+        )
+        assert same_world.fingerprint == test_world_01.fingerprint
+        assert other_world.fingerprint != test_world_01.fingerprint
+        assert windy_world.fingerprint != test_world_01.fingerprint
+
+    @staticmethod
+    def test_get_transition_arrays():
+        actions = (GWorldAction.up, GWorldAction.right)
+        next_states, effects = test_world_01.get_transition_arrays(actions)
+        assert next_states.shape == effects.shape == (len(test_world_01.states), 2)
+        for s in test_world_01.states:
+            for j, a in enumerate(actions):
+                next_state, effect = test_world_01.take_action(s, a)
+                i = test_world_01.state_index[s]
+                assert test_world_01.states[next_states[i, j]] == next_state
+                assert effects[i, j] == effect
@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+
+from exploring_agents import QAgent, SarsaAgent
+from exploring_agents.training import train_agent
+from notebooks.utils.basics import basic_actions, basic_reward
+from notebooks.utils.worlds import small_world_01
+from policies import CountBonusPolicy, UCBPolicy
+from tests.constants.actions import a0, a1, a2, a3
+from tests.constants.states import s0, s1
+from utils.bounded_q_table import BoundedQTable
+from utils.q_table import QTable
+
+actions0 = (a0, a1, a2)
+
+
+class TestUCBPolicy:
+    @staticmethod
+    def test_sample():
+        q = QTable(actions0, {(s0, a0): 1, (s0, a1): 0.5, (s0, a2): -1})
+        policy = UCBPolicy(actions0, q, c=1)
+
+        # every action is tried once, then the bonus fades with the number of visits
+        assert [policy.sample(s0) for _ in range(3)] == [a0, a1, a2]
+        assert policy.counts[policy.state_index[s0]].tolist() == [1, 1, 1]
+        assert np.allclose(policy.scores(s0), [1, 0.5, -1] + np.sqrt(np.log(3)))
+        assert policy.best_action(s0) == a0 and policy(s0, a0) == 1
+        assert policy(s0, a1) == 0
+        with pytest.raises(ValueError):
+            policy(s0, a3)
+
+        for _ in range(10):
+            policy.sample(s0)
+        assert policy.state_counts[policy.state_index[s0]] == 13
+        assert policy.counts[policy.state_index[s0]].sum() == 13
+
+        # states with no counts or values start with the first action
+        assert policy.sample(s1) == a0
+
+        policy.remove(s0)
+        assert policy.sample(s0) == a0 and policy.sample(s0) == a1
+
+
+class TestCountBonusPolicy:
+    @staticmethod
+    def test_sample():
+        q = QTable(actions0, {(s0, a0): 1, (s0, a1): 0.5})
+        policy = CountBonusPolicy(actions0, q, beta=2)
+        assert np.allclose(policy.scores(s0), [3, 2.5, 2])
+        assert policy.sample(s0) == a0
+        assert np.allclose(policy.scores(s0), [1 + np.sqrt(2), 2.5, 2])
+        assert policy.sample(s0) == a1
+
+        # the counts array grows as states are added
+        for i in range(100):
+            policy.count((i,), a2)
+        assert policy.counts.shape[0] >= 101
+
+    @staticmethod
+    def test_remove_reuses_rows():
+        policy = CountBonusPolicy(actions0)
+        for i in range(64):
+            policy.count((i,), a0)
+        for i in range(64):
+            policy.remove((i,))
+        for i in range(64, 128):
+            policy.count((i,), a1)
+        assert policy.counts.shape[0] == 64
+        assert policy.counts[:, 0].sum() == 0 and policy.counts[:, 1].sum() == 64
+
+
+class TestCountBasedAgents:
+    @staticmethod
+    @pytest.mark.parametrize("agent_type", [QAgent, SarsaAgent])
+    def test_agents(agent_type):
+        np.random.seed(0)
+        agent = agent_type(
+            basic_reward, basic_actions, alpha=0.5, policy=UCBPolicy(basic_actions)
+        )
+        assert agent.policy.q is agent.q
+        lengths, _ = train_agent(agent, small_world_01, 30)
+        # the shortest path takes 8 steps, by now exploration happens only now and then
+        assert np.mean(lengths[-10:]) < 11
+
+    @staticmethod
+    def test_bounded_agent():
+        agent = QAgent(
+            basic_reward,
+            basic_actions,
+            q_0=BoundedQTable(basic_actions, max_states=10),
+            policy=UCBPolicy(basic_actions),
+        )
+        # a chain of states, each one is sampled and then dropped from the Q table
+        for i in range(200):
+            agent.run_update((i,), agent.select_action((i,)), 0, (i + 1,))
+        # counts of evicted states are dropped, so they don't outgrow the Q table
+        assert len(agent.policy.state_index) <= 10
+        assert agent.policy.counts.shape[0] == 64
@@ -0,0 +1,59 @@
+import numpy as np
+
+from exploring_agents.commons.dacaying_functions import ExpDecay
+from policies import EpsilonExplorer
+from tests.constants.actions import a0, a1, a2, a3
+from tests.constants.states import s0, s1, s2
+
+
+class TestEpsilonExplorer:
+    @staticmethod
+    def test_call_update_and_decay():
+        epsilon = 0.1
+        decay_func = ExpDecay()
+        test_policy = EpsilonExplorer(
+            epsilon=epsilon, actions=(a0, a1, a2, a3), epsilon_decay=decay_func
+        )
+
+        # test on empty states
+        assert np.isclose(test_policy(s0, a0), 1 / 4)
+        assert np.isclose(test_policy(s0, a3), 1 / 4)
+
+        # update a state with some reasonable actions
+        test_policy.update(s0, a1, [a0, a1, a2])
+        assert np.isclose(test_policy(s0, a0), epsilon / 2)
+        assert np.isclose(test_policy(s0, a1), 1 - epsilon)
+        assert np.isclose(test_policy(s0, a2), epsilon / 2)
+        assert test_policy(s0, a3) == 0
+
+        # a single reasonable action is always taken
+        test_policy.update(s1, a2, [a2])
+        assert test_policy(s1, a2) == 1
+        assert test_policy(s1, a0) == 0
+
+        # decay only changes epsilon
+        test_policy.decay()
+        decayed_epsilon = decay_func(epsilon)
+        assert np.isclose(test_policy(s0, a0), decayed_epsilon / 2)
+        assert np.isclose(test_policy(s0, a1), 1 - decayed_epsilon)
+        assert test_policy(s0, a3) == 0
+        assert test_policy(s1, a2) == 1
+        assert np.isclose(test_policy(s2, a0), 1 / 4)
+
+    @staticmethod
+    def test_sample():
+        # This is a stochastic test, which is subject to random failure, although very unlikely
+        epsilon = 0.2
+        iterations = 100000
+        rng = np.random.default_rng(0)
+        test_policy = EpsilonExplorer(epsilon=epsilon, actions=(a0, a1, a2, a3))
+        test_policy.update(s0, a2, [a0, a2, a3])
+
+        for state in [s0, s1]:
+            samples = [test_policy.sample(state, rng) for _ in range(iterations)]
+            for a in (a0, a1, a2, a3):
+                assert np.isclose(
+                    np.sum([x == a for x in samples]) / iterations,
+                    test_policy(state, a),
+                    atol=1e-2,
+                )
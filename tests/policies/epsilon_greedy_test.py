@@ -68,3 +68,21 @@ class TestEpsilonGreedy:
         assert np.isclose(test_policy(s0, a2), 1 - new_epsilon)
         assert np.isclose(test_policy(s1, a0), 1 - new_epsilon)
         assert np.isclose(test_policy(s2, a0), 1 / 3)
+
+    @staticmethod
+    def test_sample():
+        # This is a stochastic test, which is subject to random failure, although very unlikely
+        epsilon = 0.2
+        iterations = 100000
+        rng = np.random.default_rng(0)
+        test_policy = EpsilonGreedy(epsilon=epsilon, actions=(a0, a1, a2))
+        test_policy.update(s0, a1)
+
+        for state in [s0, s1]:
+            samples = [test_policy.sample(state, rng) for _ in range(iterations)]
+            for a in (a0, a1, a2):
+                assert np.isclose(
+                    np.sum([x == a for x in samples]) / iterations,
+                    test_policy(state, a),
+                    atol=1e-2,
+                )
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from exploring_agents import QAgent, RandomAgent
+from notebooks.utils.basics import basic_reward
+from policies import FrozenGreedyPolicy
+from tests.constants.actions import a0, a1, a2, a3
+from tests.constants.states import s0, s1, s2, s3
+from utils.q_table import QTable
+
+actions0 = (a0, a1, a2)
+
+
+class TestFrozenGreedyPolicy:
+    @staticmethod
+    def test_call_and_act(q_0):
+        policy = QTable(actions0, q_0).freeze()
+        assert policy.states == [s0, s1, s2]
+        assert policy.action_indexes.dtype == np.int8
+        assert policy.act(s0) == a0 and policy.act(s2) == a2
+        assert policy.sample(s1) == a0
+        assert policy(s2, a2) == 1 and policy(s2, a0) == 0 and policy(s3, a0) == 0
+        assert policy.act_many(np.array([2, 0, 2])).tolist() == [2, 0, 2]
+        with pytest.raises(ValueError):
+            policy.act(s3)
+        with pytest.raises(ValueError):
+            policy(s0, a3)
+        with pytest.raises(TypeError):
+            policy.update(s0, a1)
+
+        # states can be given, unknown ones get the first action
+        policy = QTable(actions0, q_0).freeze([s3, s2])
+        assert policy.act_many(np.arange(2)).tolist() == [0, 2]
+
+    @staticmethod
+    def test_agent_freeze_dump_and_load(tmp_path):
+        agent = QAgent(reward_function=basic_reward, actions=actions0, alpha=1)
+        agent.run_update(s0, a0, 0, s1)
+        agent.run_update(s1, a0, -1, s2)
+        policy = agent.freeze()
+        assert isinstance(policy, FrozenGreedyPolicy)
+        assert policy.act(s0) == a1 and policy.act(s1) == a1
+
+        policy.dump(f"{tmp_path}/frozen")
+        loaded = FrozenGreedyPolicy.load(f"{tmp_path}/frozen")
+        assert loaded.actions == policy.actions
+        assert loaded.states == policy.states
+        assert np.array_equal(loaded.action_indexes, policy.action_indexes)
+
+    @staticmethod
+    def test_freeze_needs_q_table():
+        agent = RandomAgent(basic_reward, actions0)
+        with pytest.raises(NotImplementedError):
+            agent.freeze()
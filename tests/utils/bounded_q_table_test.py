@@ -0,0 +1,170 @@
+import numpy as np
+import pytest
+
+from abstractions import Agent
+from exploring_agents import (
+    DynaQAgent,
+    LambdaQAgent,
+    LambdaSarsaAgent,
+    MonteCarloAgent,
+    QAgent,
+    TrueOnlineSarsaAgent,
+)
+from exploring_agents.commons.replay_buffer import ReplayBuffer
+from exploring_agents.training import train_tag_agents
+from notebooks.utils.basics import basic_actions, basic_tag_reward
+from notebooks.utils.worlds import tagging_world_00
+from tests.constants.actions import a0, a1
+from tests.constants.states import s0, s1, s2, s3
+from utils.bounded_q_table import BoundedQTable
+
+
+class TestBoundedQTable:
+    @staticmethod
+    @pytest.mark.parametrize(
+        "eviction, evicted", [("lru", s1), ("lfu", s2), ("zero", s0)]
+    )
+    def test_eviction(eviction, evicted):
+        evictions = []
+        q = BoundedQTable((a0, a1), max_states=3, eviction=eviction)
+        q.add_eviction_listener(lambda state, row: evictions.append((state, row)))
+
+        q[s0, a0] = 0.001
+        q[s1, a0] = 1
+        q[s1, a1] = 2
+        q[s2, a0] = -1
+        q[s0, a1] = 0.002
+        q[s0, a0] = 0.001
+        assert len(q.states) == 3
+
+        q[s3, a1] = 5
+        assert len(q.states) == 3
+        assert evictions == [(evicted, q.state_index[s3])]
+        assert evicted not in q.state_index
+        assert q.get((evicted, a0)) is None
+        assert q.best_value(evicted) == 0
+        assert q.best_action(s3) == a1
+
+        stats = q.stats()
+        assert stats.states == 3
+        assert stats.evictions == 1
+        assert stats.entries == len(q) == len(list(q))
+        assert stats.capacity == 3
+
+    @staticmethod
+    @pytest.mark.parametrize("eviction", ["lru", "lfu"])
+    def test_rows_are_kept_together(eviction):
+        q = BoundedQTable((a0, a1), max_states=2, eviction=eviction)
+        q[s0, a0] = 1
+        q[s0, a0] = 2
+        q[s1, a0] = 1
+        # s1 is the least used and least recently updated state, but is asked for with s2
+        rows = q.rows((s1, s2))
+        assert q.states[rows[0]] == s1 and q.states[rows[1]] == s2
+        assert s0 not in q.state_index
+        with pytest.raises(ValueError):
+            q.rows((s1, s2, s3))
+
+    @staticmethod
+    @pytest.mark.parametrize("eviction", ["lru", "lfu"])
+    def test_replay_buffer_rows(eviction):
+        np.random.seed(0)
+        agent = QAgent(
+            lambda effect: -1,
+            (a0, a1),
+            alpha=0.5,
+            q_0=BoundedQTable((a0, a1), max_states=2, eviction=eviction),
+            replay_buffer=ReplayBuffer(10),
+            replay_batch_size=4,
+        )
+        # a chain, where every state leads to the next one
+        for state in range(8):
+            agent.run_update(state, a0, 0, state + 1)
+            buffer = agent.replay_buffer
+            transitions = [
+                (agent.q.states[i], agent.q.states[k])
+                for i, k in zip(
+                    buffer.rows[: len(buffer)].tolist(),
+                    buffer.next_rows[: len(buffer)].tolist(),
+                )
+            ]
+            assert (state, state + 1) in transitions
+            # rows of evicted states don't point to the states taking them over
+            assert all(k == i + 1 for i, k in transitions)
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "agent_class",
+        [
+            DynaQAgent,
+            LambdaQAgent,
+            LambdaSarsaAgent,
+            MonteCarloAgent,
+            TrueOnlineSarsaAgent,
+        ],
+    )
+    def test_agents_keeping_rows(agent_class):
+        with pytest.raises(TypeError):
+            agent_class(
+                basic_tag_reward,
+                basic_actions,
+                q_0=BoundedQTable(basic_actions, max_states=10),
+            )
+
+    @staticmethod
+    @pytest.mark.parametrize("eviction", ["lru", "lfu", "zero"])
+    def test_eviction_order(eviction):
+        np.random.seed(0)
+        q = BoundedQTable((a0, a1), max_states=20, eviction=eviction)
+
+        def check_victim(state, row):
+            # the row is the one a scan of the whole table would pick
+            n = len(q.states)
+            if eviction == "lru":
+                keys = (q._last_update[:n],)
+            elif eviction == "lfu":
+                keys = (q._last_update[:n], q._updates[:n])
+            else:
+                keys = (q._last_update[:n], np.abs(q.array).max(axis=1))
+            assert row == np.lexsort(keys)[0]
+
+        q.add_eviction_listener(check_victim)
+        for _ in range(2000):
+            state, action = np.random.randint(40), (a0, a1)[np.random.randint(2)]
+            if np.random.uniform() < 0.5:
+                q[state, action] = np.random.normal()
+            else:
+                rows = np.array([q.row(state), q.row(np.random.randint(40))])
+                q.add_at(rows, np.zeros(2, dtype=np.int64), np.ones(2))
+        assert q.stats().evictions > 100
+
+    @staticmethod
+    def test_invalid_arguments():
+        with pytest.raises(ValueError):
+            BoundedQTable((a0, a1), max_states=3, eviction="random")
+        with pytest.raises(ValueError):
+            BoundedQTable((a0, a1), max_states=0)
+
+    @staticmethod
+    def test_bounded_agent(tmp_path):
+        np.random.seed(0)
+        agent_1 = QAgent(
+            basic_tag_reward,
+            basic_actions,
+            q_0=BoundedQTable(basic_actions, max_states=200),
+        )
+        agent_2 = QAgent(basic_tag_reward, basic_actions)
+        train_tag_agents(agent_1, agent_2, tagging_world_00, 20, 100, True)
+
+        assert len(agent_1.q.states) == 200
+        assert agent_1.q.stats().evictions > 0
+        # the agent forgets about evicted states
+        assert set(agent_1.policy.best_action) <= set(agent_1.q.states)
+
+        agent_1.dump(str(tmp_path / "agent"))
+        loaded = Agent.load(str(tmp_path / "agent"))
+        assert isinstance(loaded.q, BoundedQTable)
+        assert loaded.q.stats() == agent_1.q.stats()
+        assert loaded.q.listeners == [loaded._forget]
+        train_tag_agents(loaded, agent_2, tagging_world_00, 5, 100, True)
+        assert len(loaded.q.states) == 200
@@ -0,0 +1,142 @@
+import os
+
+import numpy as np
+import pytest
+
+from abstractions import Agent
+from exploring_agents import (
+    DynaQAgent,
+    LambdaQAgent,
+    LambdaSarsaAgent,
+    MonteCarloAgent,
+    QAgent,
+    RandomAgent,
+    SarsaAgent,
+    SuccessorRepresentationAgent,
+    TileCodingAgent,
+    TrueOnlineSarsaAgent,
+)
+from exploring_agents.commons.dacaying_functions import ExpDecay
+from exploring_agents.grid_world_agents import (
+    EncodedTagAgent,
+    ODPAgent,
+    QExplorerAgent,
+)
+from exploring_agents.grid_world_agents.commons.tag_encoders import RelativeTagEncoder
+from exploring_agents.training import run_tag_episode, train_agent
+from notebooks.utils.basics import basic_reward, basic_actions, basic_tag_reward
+from notebooks.utils.worlds import small_world_01, tagging_world_00
+from tests.constants.actions import a0, a1
+from tests.constants.states import s0, s1
+from utils.checkpoint import load_checkpoint, save_checkpoint
+
+
+class TestCheckpoint:
+    @staticmethod
+    def test_save_and_load(tmp_path):
+        np.random.seed(0)
+        agent = QExplorerAgent(
+            reward_function=basic_reward,
+            actions=basic_actions,
+            alpha=0.5,
+            epsilon_decay=ExpDecay(decay_lambda=0.1),
+        )
+        train_agent(agent, small_world_01, 10)
+        save_checkpoint(agent, f"{tmp_path}/agent")
+        assert "q.values.npy" in os.listdir(f"{tmp_path}/agent")
+
+        loaded = load_checkpoint(f"{tmp_path}/agent")
+        assert isinstance(loaded.q.array, np.memmap)
+        assert loaded.q.states == agent.q.states
+        assert dict(loaded.q) == dict(agent.q)
+        assert loaded.policy.best_action == agent.policy.best_action
+        assert loaded.policy.reasonable_actions == agent.policy.reasonable_actions
+        assert loaded.world_map.world_states == agent.world_map.world_states
+        assert loaded.policy.epsilon == agent.policy.epsilon
+
+        # both agents keep learning the same way, without changing the checkpoint
+        np.random.seed(1)
+        lengths, _ = train_agent(agent, small_world_01, 5)
+        np.random.seed(1)
+        assert train_agent(loaded, small_world_01, 5)[0] == lengths
+        assert dict(load_checkpoint(f"{tmp_path}/agent").q) != dict(loaded.q)
+
+    @staticmethod
+    def test_agent_dump_and_load(tmp_path):
+        agent = QAgent(reward_function=basic_reward, actions=(a0, a1))
+        agent.run_update(s0, a1, 0, s1)
+        agent.dump(f"{tmp_path}/q")
+        assert os.path.isdir(f"{tmp_path}/q.agent")
+        assert dict(Agent.load(f"{tmp_path}/q").q) == dict(agent.q)
+
+        # states that can't be encoded are pickled instead
+        agent.run_update(frozenset({1}), a1, 0, s1)
+        agent.dump(f"{tmp_path}/q")
+        assert os.path.isfile(f"{tmp_path}/q.agent")
+        assert dict(Agent.load(f"{tmp_path}/q", mmap=False).q) == dict(agent.q)
+
+    @staticmethod
+    @pytest.mark.parametrize(
+        "agent_class",
+        [
+            DynaQAgent,
+            LambdaQAgent,
+            LambdaSarsaAgent,
+            MonteCarloAgent,
+            QAgent,
+            QExplorerAgent,
+            RandomAgent,
+            SarsaAgent,
+            SuccessorRepresentationAgent,
+            TileCodingAgent,
+            TrueOnlineSarsaAgent,
+        ],
+    )
+    def test_dump_and_load_agents(tmp_path, agent_class):
+        np.random.seed(0)
+        agent = agent_class(basic_reward, basic_actions)
+        train_agent(agent, small_world_01, 5)
+        agent.dump(f"{tmp_path}/agent")
+        loaded = Agent.load(f"{tmp_path}/agent")
+        assert type(loaded) is agent_class
+
+        # the loaded agent keeps learning just like the original one
+        np.random.seed(1)
+        lengths, _ = train_agent(agent, small_world_01, 5)
+        np.random.seed(1)
+        assert train_agent(loaded, small_world_01, 5)[0] == lengths
+
+    @staticmethod
+    def test_dump_and_load_tag_agents(tmp_path):
+        np.random.seed(0)
+        agent = EncodedTagAgent(
+            QAgent(basic_tag_reward, basic_actions), RelativeTagEncoder()
+        )
+        opponent = QAgent(basic_tag_reward, basic_actions)
+        for _ in range(5):
+            run_tag_episode(agent, opponent, tagging_world_00, episode_max_length=20)
+        agent.dump(f"{tmp_path}/agent")
+        loaded = Agent.load(f"{tmp_path}/agent")
+        assert dict(loaded.agent.q) == dict(agent.agent.q)
+
+        odp_agent = ODPAgent(
+            basic_reward, (4, 4), basic_actions, terminal_coordinates=(3, 3)
+        )
+        odp_agent.dump(f"{tmp_path}/odp")
+        loaded = Agent.load(f"{tmp_path}/odp")
+        assert loaded.v_pi == odp_agent.v_pi
+        assert all(
+            loaded.select_action(s) == odp_agent.select_action(s) for s in loaded.v_pi
+        )
+
+    @staticmethod
+    def test_dump_does_not_hide_errors(tmp_path, monkeypatch):
+        def encode_states(states):
+            raise TypeError("a bug in the encoder")
+
+        # only unsupported states fall back to dill, errors of the encoder get through
+        monkeypatch.setattr("utils.checkpoint.encode_states", encode_states)
+        agent = QAgent(reward_function=basic_reward, actions=(a0, a1))
+        with pytest.raises(TypeError):
+            agent.dump(f"{tmp_path}/q")
+        assert not os.path.exists(f"{tmp_path}/q.agent")
@@ -1,10 +1,17 @@
+import itertools
+
 import numpy as np
 
-from policies import EpsilonGreedy
+from policies import EpsilonExplorer, EpsilonGreedy
 from tests.constants.actions import a0, a1, a2, a3
 from tests.constants.states import s0, s1, s2, s3
 from tests.constants.worlds import RandomWorld
-from utils.policy import get_best_action_from_q, get_random_policy, get_policy_rec
+from utils.policy import (
+    get_best_action_from_q,
+    get_random_policy,
+    get_policy_rec,
+    sample_action_and_exploration,
+)
 
 states0 = (s0, s1, s2)
 actions0 = (a0, a1, a2)
@@ -50,3 +57,57 @@ class TestPolicy:
         assert police_rec_0[s0] == a0
         assert police_rec_0[s1] == a2
         assert police_rec_0[s2] in actions0
+
+    @staticmethod
+    def test_sample_action_and_exploration():
+        # This is a stochastic test, which is subject to random failure, although very unlikely
+        epsilon = 0.3
+        iterations = 100000
+        test_policy = EpsilonGreedy(epsilon=epsilon, actions=actions0)
+        test_policy.update(s0, a2)
+
+        samples = [
+            sample_action_and_exploration(test_policy, s0, actions0)
+            for _ in range(iterations)
+        ]
+        for a in actions0:
+            assert np.isclose(
+                np.sum([x == a for x, _ in samples]) / iterations,
+                test_policy(s0, a),
+                atol=1e-2,
+            )
+        assert all(explored == (x != a2) for x, explored in samples)
+
+        # works with any callable policy
+        action, explored = sample_action_and_exploration(
+            lambda s, a: 1 if a == a1 else 0, s0, actions0
+        )
+        assert action == a1 and not explored
+
+    @staticmethod
+    def test_epsilon_greedy_fast_path():
+        greedy = EpsilonGreedy(epsilon=0.3, actions=actions0)
+        greedy.update(s0, a1)
+        explorer = EpsilonExplorer(epsilon=0.3, actions=actions0)
+        explorer.update(s0, a2, [a0, a2])
+        explorer.update(s1, a0, [a0, a1, a2])
+        explorer.update(s2, a1, [a1])
+
+        # reading the policy directly draws the same samples as going through each action
+        for policy, state in itertools.product(
+            [greedy, explorer, EpsilonGreedy(epsilon=0.9, actions=actions0)],
+            [s0, s1, s2, s3],
+        ):
+            np.random.seed(0)
+            fast = [
+                sample_action_and_exploration(policy, state, actions0)
+                for _ in range(200)
+            ]
+            np.random.seed(0)
+            generic = [
+                sample_action_and_exploration(
+                    lambda s, a: policy(s, a), state, actions0
+                )
+                for _ in range(200)
+            ]
+            assert fast == generic
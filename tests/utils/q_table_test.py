@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+
+from tests.constants.actions import a0, a1, a2, a3
+from tests.constants.states import s0, s1, s2, s3
+from utils.q_table import QTable, as_q_table
+
+actions0 = (a0, a1, a2)
+
+
+class TestQTable:
+    @staticmethod
+    def test_mapping_interface(q_0):
+        q = QTable(actions0, q_0)
+        assert dict(q) == q_0
+        assert len(q) == len(q_0)
+        assert q[s0, a1] == 4
+        assert q.get((s1, a1), 0) == 0
+        assert q.get((s3, a0)) is None
+        assert (s1, a1) not in q
+        with pytest.raises(KeyError):
+            _ = q[s1, a1]
+        with pytest.raises(KeyError):
+            q[s0, a3] = 1
+
+        q[s1, a1] = 2
+        q[s3, a0] = -1
+        assert q[s1, a1] == 2 and q[s3, a0] == -1
+        assert len(q) == len(q_0) + 2
+
+        del q[s1, a1]
+        assert (s1, a1) not in q
+        assert len(q) == len(q_0) + 1
+
+    @staticmethod
+    def test_growth():
+        q = QTable(actions0, initial_capacity=1)
+        for i in range(100):
+            q[i, a1] = i
+        assert q.capacity >= 100
+        assert q.array.shape == (100, 3)
+        assert np.array_equal(q.array[:, 1], np.arange(100))
+        assert all(q[i, a1] == i for i in range(100))
+
+    @staticmethod
+    def test_best_value_and_action(q_0, q_2):
+        q = QTable(actions0, q_0)
+        assert q.best_value(s0) == 5
+        assert q.best_action(s0) == a0
+        assert q.best_action(s2) == a2
+        assert q.best_value(s3) == 0
+        assert q.best_action(s3) == a0
+
+        q = QTable(actions0, q_2)
+        assert q.best_value(s0) == 0
+        assert q.best_action(s0) == a2
+        assert q.best_value(s0, (a0, a1)) == -5
+        assert q.best_action(s0, (a0, a1)) == a1
+
+    @staticmethod
+    def test_as_q_table(q_0):
+        q = as_q_table(q_0, actions0)
+        assert isinstance(q, QTable) and dict(q) == q_0
+        assert as_q_table(q, actions0) is q
+        assert len(as_q_table(None, actions0)) == 0
+
+    @staticmethod
+    def test_states_order():
+        q = QTable(actions0, states=(s2, s0))
+        assert q.states == [s2, s0]
+        assert list(q.rows([s0, s1])) == [1, 2]
+        assert len(q) == 0
+
+    @staticmethod
+    def test_best_is_kept_up_to_date():
+        rng = np.random.default_rng(0)
+        q = QTable(actions0, initial_capacity=2)
+        states = list(range(10))
+        for _ in range(2000):
+            s = states[rng.integers(10)]
+            a = actions0[rng.integers(3)]
+            if rng.uniform() < 0.1 and (s, a) in q:
+                del q[s, a]
+            else:
+                q[s, a] = float(rng.integers(-3, 3))
+            for x in states:
+                values = [q.get((x, b), 0) for b in actions0]
+                assert q.best_value(x) == max(values)
+                assert q.best_action(x) == actions0[int(np.argmax(values))]
+                assert (
+                    q.best_action(x, (a0, a2)) == (a0, a2)[int(np.argmax(values[::2]))]
+                )
+                assert q.best_value(x, (a2, a1)) == max(values[2], values[1])
+
+        q.add_to_rows(np.array([0, 1]), np.array([[0, 0, 10], [-10, -10, -10]]))
+        assert q.best_action(0) == a2
+        assert q.best_value(1) == max(q.get((1, b), 0) for b in actions0)
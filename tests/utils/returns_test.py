@@ -2,7 +2,11 @@ import numpy as np
 
 from tests.constants.actions import a0, a1
 from tests.constants.states import s0, s1
-from utils.returns import returns_from_reward, first_visit_return
+from utils.returns import (
+    returns_from_reward,
+    first_visit_return,
+    first_visit_indexes,
+)
 
 
 class TestReturns:
@@ -32,3 +36,8 @@ class TestReturns:
         assert fvr[s1, a1] == 2
         assert fvr[s1, a0] == 1
         assert len(fvr) == 3
+
+    @staticmethod
+    def test_first_visit_indexes():
+        keys = np.array([3, 1, 3, 0, 1, 2])
+        assert first_visit_indexes(keys).tolist() == [0, 1, 3, 5]
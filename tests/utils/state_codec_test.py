@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from grid_world.action import GWorldAction
+from grid_world.state import GWorldState, TagState
+from tests.constants.actions import a0
+from tests.constants.states import s0, s1
+from utils.state_codec import (
+    UnsupportedCheckpointError,
+    decode_states,
+    decode_value,
+    encode_states,
+    encode_value,
+)
+
+
+class TestStateCodec:
+    @staticmethod
+    def test_value_codec():
+        for x in [
+            GWorldState((1, 2), "trap"),
+            TagState((0, 1), (2, 3)),
+            GWorldAction.up,
+            s0,
+            (a0, (1, "x"), None),
+            1.5,
+        ]:
+            assert decode_value(encode_value(x)) == x
+        with pytest.raises(UnsupportedCheckpointError):
+            encode_value(frozenset({1}))
+
+    @staticmethod
+    def test_states_codec():
+        states = [GWorldState((1, 2)), TagState((0, 1), (2, 3)), s1, (1, 2), "s"]
+        states.append(GWorldState((3, 4), "trap"))
+        spec, arrays = encode_states(states)
+        assert decode_states(spec, arrays.__getitem__) == states
+
+        # grid world states become a coordinates array and kind codes
+        assert spec["types"][0]["fields"][1]["values"] == ["empty", "trap"]
+        assert arrays["0.0"].tolist() == [[1, 2], [3, 4]]
+        assert arrays["0.1"].tolist() == [0, 1]
+        assert arrays["types"].tolist() == [0, 1, 2, -1, -1, 0]
+        assert [i for i, _ in spec["others"]] == [3, 4]
+
+    @staticmethod
+    def test_unsupported_states():
+        with pytest.raises(UnsupportedCheckpointError):
+            encode_states([GWorldState((0, 0)), frozenset({1})])
+
+        # fields that can't be columns fall back to per state encoding
+        states = [TagState((0, 1), (2, "x")), TagState((0, 1), (2, 3))]
+        spec, arrays = encode_states(states)
+        assert len(spec["others"]) == 2
+        assert decode_states(spec, arrays.__getitem__) == states
+        assert np.all(arrays["types"] == -1)
@@ -0,0 +1,207 @@
+from typing import Callable, Collection, Final, Iterable, Iterator, Mapping
+
+import numpy as np
+
+from abstractions import Action, State
+from utils.q_table import QTable, QTableStats
+
+EVICTION_POLICIES: Final = ("lru", "lfu", "zero")
+
+
+class BoundedQTable(QTable):
+    def __init__(
+        self,
+        actions: tuple[Action, ...],
+        max_states: int,
+        eviction: str = "lru",
+        q_0: Mapping[tuple[State, Action], float] = None,
+        states: Iterable[State] = None,
+    ):
+        """
+        A QTable with a hard bound on the number of states it keeps. Once it is full, adding a
+        state drops all values of another one, whose row is then reused, so memory never goes
+        beyond max_states rows.
+
+        The state to be dropped is chosen by the eviction policy:
+            lru: the least recently updated state
+            lfu: the state with the fewest updates, ties go to the least recently updated
+            zero: the state whose values are closest to the default 0, so dropping it changes
+                the least, ties go to the least recently updated
+        lru and lfu keep their order as rows are updated, so evictions don't depend on the size
+        of the table, while zero looks at the values of every state.
+
+        Rows are reused, so row indexes kept outside the table(like the ones in a ReplayBuffer)
+        may end up pointing to other states. Listeners can be added to be told whenever a state
+        is dropped. States whose rows are gotten together with rows are never dropped to make
+        room for each other.
+
+        :param actions: actions available, these define the columns of the table
+        :param max_states: max number of states kept
+        :param eviction: the eviction policy, one of: lru, lfu, zero
+        :param q_0: initial values for the table
+        :param states: states to register upfront, rows will follow this order
+        """
+        if eviction not in EVICTION_POLICIES:
+            raise ValueError(f"eviction must be one of: {', '.join(EVICTION_POLICIES)}")
+        if max_states < 1:
+            raise ValueError("max_states must be positive")
+
+        capacity = min(64, max_states)
+        self.max_states: Final = max_states
+        self.eviction: Final = eviction
+        self.evictions = 0
+        self.listeners: list[Callable[[State, int], None]] = []
+        self._last_update = np.zeros(capacity, dtype=np.int64)
+        self._updates = np.zeros(capacity, dtype=np.int64)
+        self._clock = 0
+        # eviction order, kept up to date as rows are updated so finding a victim doesn't scan
+        # the table. Rows from least to most recently updated for lru, and grouped by their
+        # number of updates for lfu, each group from least to most recently updated
+        self._order: dict[int, None] = {}
+        self._groups: dict[int, dict[int, None]] = {}
+        self._min_updates = 0
+        super().__init__(actions, q_0, states, initial_capacity=capacity)
+
+    def add_eviction_listener(self, listener: Callable[[State, int], None]) -> None:
+        """
+        Adds a function to be called with the state and row of every evicted state, right
+        before the row is reused.
+
+        :param listener: the function to be called
+        """
+        self.listeners.append(listener)
+
+    def row(self, state: State) -> int:
+        return self._row(state, ())
+
+    def rows(self, states: Iterable[State]) -> np.ndarray:
+        """
+        Gets the rows for a collection of states, adding them to the table if needed. The
+        states are kept together, none of them is evicted to make room for another one.
+
+        :raises ValueError: whenever there are more states than the table can keep
+        """
+        rows = []
+        for s in states:
+            rows.append(self._row(s, rows))
+        return np.array(rows, dtype=np.int64)
+
+    def _row(self, state: State, reserved: Collection[int]) -> int:
+        if (i := self.state_index.get(state)) is not None:
+            return i
+        if len(self.states) < self.max_states:
+            i = super().row(state)
+        else:
+            i = self._select_victim(reserved)
+            self._evict(i)
+            self.states[i] = state
+            self.state_index[state] = i
+
+        # a new state counts as updated, so it isn't the next one to go
+        self._touch(i, added=True)
+        return i
+
+    def refresh_best(self, rows: np.ndarray) -> None:
+        super().refresh_best(rows)
+        for i in dict.fromkeys(np.asarray(rows).ravel().tolist()):
+            self._touch(i)
+
+    def copy(self) -> "BoundedQTable":
+        q = super().copy()
+        q.listeners = []
+        q._last_update = self._last_update.copy()
+        q._updates = self._updates.copy()
+        q._order = dict(self._order)
+        q._groups = {n: dict(group) for n, group in self._groups.items()}
+        return q
+
+    def stats(self) -> QTableStats:
+        return QTableStats(
+            states=len(self.states),
+            entries=self._size,
+            capacity=self.capacity,
+            evictions=self.evictions,
+            nbytes=self._nbytes() + self._last_update.nbytes + self._updates.nbytes,
+        )
+
+    def _set_value(self, i: int, j: int, value: float) -> None:
+        super()._set_value(i, j, value)
+        self._touch(i)
+
+    def _touch(self, i: int, added: bool = False) -> None:
+        """
+        Records an update of a row, or the addition of a state to it, in O(1).
+        """
+        self._clock += 1
+        self._last_update[i] = self._clock
+        updates = 0 if added else int(self._updates[i]) + 1
+        if self.eviction == "lru":
+            self._order.pop(i, None)
+            self._order[i] = None
+        elif self.eviction == "lfu":
+            if not added:
+                self._leave_group(i)
+            self._groups.setdefault(updates, {})[i] = None
+            if added or self._min_updates not in self._groups:
+                self._min_updates = updates
+        self._updates[i] = updates
+
+    def _leave_group(self, i: int) -> None:
+        n = int(self._updates[i])
+        del self._groups[n][i]
+        if not self._groups[n]:
+            del self._groups[n]
+
+    def _select_victim(self, reserved: Collection[int] = ()) -> int:
+        if self.eviction == "lru":
+            candidates = self._order
+        elif self.eviction == "lfu":
+            candidates = self._lfu_order()
+        else:
+            # values keep changing, so this one has to look at all of them
+            n = len(self.states)
+            distance = np.abs(self._values[:n]).max(axis=1)
+            candidates = np.lexsort((self._last_update[:n], distance)).tolist()
+
+        for i in candidates:
+            if i not in reserved:
+                return i
+        raise ValueError(
+            f"max_states is too small to keep {len(self.states) + 1} states together"
+        )
+
+    def _lfu_order(self) -> Iterator[int]:
+        yield from self._groups[self._min_updates]
+        # only reached when every row with the fewest updates is reserved
+        for n in sorted(self._groups):
+            if n != self._min_updates:
+                yield from self._groups[n]
+
+    def _evict(self, i: int) -> None:
+        state = self.states[i]
+        for listener in self.listeners:
+            listener(state, i)
+        if self.eviction == "lfu":
+            self._leave_group(i)
+
+        del self.state_index[state]
+        self._size -= int(self._known[i].sum())
+        self._known[i] = False
+        self._values[i] = 0
+        self._best_index[i] = 0
+        self._best_value[i] = 0
+        self.evictions += 1
+
+    def _grow(self, capacity: int = None) -> None:
+        capacity = min(
+            2 * self.capacity if capacity is None else capacity, self.max_states
+        )
+        self._last_update = _resize(self._last_update, capacity)
+        self._updates = _resize(self._updates, capacity)
+        super()._grow(capacity)
+
+
+def _resize(x: np.ndarray, size: int) -> np.ndarray:
+    resized = np.zeros(size, dtype=x.dtype)
+    resized[: min(len(x), size)] = x[:size]
+    return resized
@@ -0,0 +1,274 @@
+import json
+import os
+import shutil
+import tempfile
+from typing import Any, Final, Hashable
+
+import dill
+import numpy as np
+
+from abstractions import Action, Policy, State
+from utils.q_table import QTable
+from utils.state_codec import (
+    UnsupportedCheckpointError,
+    decode_states,
+    decode_value,
+    encode_states,
+    encode_value,
+    get_path,
+    import_path,
+)
+
+CHECKPOINT_VERSION: Final = 2
+
+_Q_TABLE_ATTRIBUTES: Final = frozenset(vars(QTable(())))
+
+
+class _CheckpointWriter:
+    def __init__(self, root: Any):
+        self.root = root
+        self.states: list[State] = []
+        self.state_ids: dict[State, int] = {}
+        self.state_types: set[type] = set()
+        self.arrays: dict[str, np.ndarray] = {}
+        self.objects: dict[str, Any] = {}
+
+    def get_state_ids(self, states) -> np.ndarray:
+        ids = []
+        for s in states:
+            if (i := self.state_ids.get(s)) is None:
+                # fail early on types that can't be encoded, states are encoded at the end
+                if type(s) not in self.state_types:
+                    encode_value(s)
+                    self.state_types.add(type(s))
+                i = self.state_ids[s] = len(self.states)
+                self.states.append(s)
+            ids.append(i)
+        return np.array(ids, dtype=np.int32)
+
+    def add_array(self, name: str, array: np.ndarray) -> str:
+        self.arrays[name] = np.asarray(array)
+        return name
+
+    def encode_attributes(self, obj: Any, prefix: str) -> dict[str, dict]:
+        actions = getattr(obj, "actions", ())
+        return {
+            name: self.encode_attribute(value, f"{prefix}{name}", actions)
+            for name, value in vars(obj).items()
+        }
+
+    def encode_attribute(
+        self, value: Any, name: str, actions: tuple[Action, ...]
+    ) -> dict:
+        """
+        Encodes an attribute, large collections become arrays, and anything that can't be
+        encoded is pickled.
+        """
+        if isinstance(value, QTable):
+            # subclasses may keep more attributes, like the counters of a BoundedQTable
+            extra = {
+                k: self.encode_attribute(v, f"{name}.{k}", actions)
+                for k, v in vars(value).items()
+                if k not in _Q_TABLE_ATTRIBUTES
+            }
+            return {
+                "kind": "q_table",
+                "class": get_path(type(value)),
+                "actions": encode_value(value.actions),
+                "states": self.add_array(
+                    f"{name}.states", self.get_state_ids(value.states)
+                ),
+                "values": self.add_array(f"{name}.values", value.array),
+                "known": self.add_array(f"{name}.known", value.known),
+                "attributes": extra,
+            }
+        elif isinstance(value, np.ndarray):
+            return {"kind": "array", "array": self.add_array(name, value)}
+        elif isinstance(value, Policy):
+            return {
+                "kind": "policy",
+                "class": get_path(type(value)),
+                "attributes": self.encode_attributes(value, f"{name}."),
+            }
+
+        if (
+            isinstance(value, list)
+            and value
+            and all(getattr(v, "__self__", None) is self.root for v in value)
+        ):
+            # methods of the agent itself, like eviction listeners, are bound again on load
+            return {"kind": "methods", "names": [v.__name__ for v in value]}
+
+        action_index = {a: i for i, a in enumerate(actions)}
+        try:
+            if isinstance(value, (set, frozenset)):
+                return {
+                    "kind": "states",
+                    "states": self.add_array(name, self.get_state_ids(value)),
+                }
+            elif isinstance(value, dict) and all(
+                isinstance(v, Hashable) and v in action_index for v in value.values()
+            ):
+                return {
+                    "kind": "state_action_map",
+                    "states": self.add_array(
+                        f"{name}.states", self.get_state_ids(value)
+                    ),
+                    "actions": self.add_array(
+                        f"{name}.actions",
+                        np.array([action_index[v] for v in value.values()], np.int16),
+                    ),
+                }
+            elif isinstance(value, dict) and all(
+                isinstance(v, list)
+                and all(isinstance(a, Hashable) and a in action_index for a in v)
+                for v in value.values()
+            ):
+                mask = np.zeros((len(value), len(actions)), dtype=bool)
+                for i, v in enumerate(value.values()):
+                    mask[i, [action_index[a] for a in v]] = True
+                return {
+                    "kind": "state_actions_map",
+                    "states": self.add_array(
+                        f"{name}.states", self.get_state_ids(value)
+                    ),
+                    "mask": self.add_array(f"{name}.mask", mask),
+                }
+            elif not isinstance(value, (set, dict, list)):
+                return {"kind": "value", "value": encode_value(value)}
+        except UnsupportedCheckpointError:
+            pass
+
+        self.objects[name] = value
+        return {"kind": "object", "name": name}
+
+
+def save_checkpoint(agent: Any, directory: str) -> None:
+    """
+    Saves an agent as a checkpoint: a directory with a JSON header and NumPy arrays. Q tables,
+    visit counts, policy maps and sets of states become arrays, and so do the states
+    themselves(see encode_states), so loading doesn't go through parsing them. Hyperparameters
+    and actions go into the header, and whatever is left(like reward and decay functions) is
+    pickled with dill.
+
+    :param agent: the agent to be saved
+    :param directory: where the checkpoint will be written, replacing what is there
+    :raises UnsupportedCheckpointError: whenever the states of the agent can't be encoded
+    """
+    writer = _CheckpointWriter(agent)
+    header = {
+        "version": CHECKPOINT_VERSION,
+        "class": get_path(type(agent)),
+        "attributes": writer.encode_attributes(agent, ""),
+    }
+    header["states"], state_arrays = encode_states(writer.states)
+    for name, array in state_arrays.items():
+        writer.add_array(f"_states.{name}", array)
+
+    # write to a temporary dir first, so a failed save doesn't destroy the previous one
+    parent = os.path.dirname(os.path.abspath(directory))
+    tmp_directory = tempfile.mkdtemp(prefix=".", dir=parent)
+    with open(os.path.join(tmp_directory, "header.json"), "w") as handle:
+        json.dump(header, handle)
+    for name, array in writer.arrays.items():
+        np.save(os.path.join(tmp_directory, f"{name}.npy"), array)
+    if writer.objects:
+        with open(os.path.join(tmp_directory, "objects.dill"), "wb") as handle:
+            dill.dump(writer.objects, handle)
+
+    if os.path.isdir(directory):
+        shutil.rmtree(directory)
+    elif os.path.exists(directory):
+        os.remove(directory)
+    os.replace(tmp_directory, directory)
+
+
+def load_checkpoint(directory: str, mmap: bool = True) -> Any:
+    """
+    Loads an agent from a checkpoint.
+
+    :param directory: where the checkpoint is
+    :param mmap: whether arrays should be memory mapped. Mapped arrays are copy on write, so the
+        agent can keep learning without changing the checkpoint
+    :return: the loaded agent
+    """
+    with open(os.path.join(directory, "header.json")) as handle:
+        header = json.load(handle)
+    if header["version"] != CHECKPOINT_VERSION:
+        raise ValueError(f"unsupported checkpoint version: {header['version']}")
+
+    objects = {}
+    if os.path.exists(objects_path := os.path.join(directory, "objects.dill")):
+        with open(objects_path, "rb") as handle:
+            objects = dill.load(handle)
+
+    def load_array(name: str) -> np.ndarray:
+        return np.load(
+            os.path.join(directory, f"{name}.npy"), mmap_mode="c" if mmap else None
+        )
+
+    states = decode_states(header["states"], lambda name: load_array(f"_states.{name}"))
+
+    def get_states(name: str) -> list[State]:
+        return [states[i] for i in load_array(name).tolist()]
+
+    def decode_attribute(spec: dict, actions: tuple[Action, ...]) -> Any:
+        kind = spec["kind"]
+        if kind == "value":
+            return decode_value(spec["value"])
+        elif kind == "object":
+            return objects[spec["name"]]
+        elif kind == "array":
+            return load_array(spec["array"])
+        elif kind == "states":
+            return set(get_states(spec["states"]))
+        elif kind == "state_action_map":
+            return dict(
+                zip(
+                    get_states(spec["states"]),
+                    (actions[i] for i in load_array(spec["actions"]).tolist()),
+                )
+            )
+        elif kind == "state_actions_map":
+            return {
+                s: [a for a, allowed in zip(actions, row) if allowed]
+                for s, row in zip(
+                    get_states(spec["states"]), load_array(spec["mask"]).tolist()
+                )
+            }
+        elif kind == "methods":
+            methods = []
+            pending_methods.append((methods, spec["names"]))
+            return methods
+        elif kind == "q_table":
+            table = QTable.from_arrays(
+                decode_value(spec["actions"]),
+                get_states(spec["states"]),
+                load_array(spec["values"]),
+                load_array(spec["known"]),
+            )
+            if (path := spec.get("class")) is None or import_path(path) is QTable:
+                return table
+            cls = import_path(path)
+            obj = cls.__new__(cls)
+            vars(obj).update(vars(table))
+            for name, attribute in spec["attributes"].items():
+                setattr(obj, name, decode_attribute(attribute, table.actions))
+            return obj
+        return build(spec["class"], spec["attributes"])
+
+    def build(path: str, attributes: dict[str, dict]) -> Any:
+        cls = import_path(path)
+        obj = cls.__new__(cls)
+        # actions are needed to decode maps, so they go first
+        if "actions" in attributes:
+            obj.actions = decode_attribute(attributes["actions"], ())
+        for name, spec in attributes.items():
+            setattr(obj, name, decode_attribute(spec, getattr(obj, "actions", ())))
+        return obj
+
+    pending_methods: list[tuple[list, list[str]]] = []
+    agent = build(header["class"], header["attributes"])
+    for methods, names in pending_methods:
+        methods.extend(getattr(agent, name) for name in names)
+    return agent
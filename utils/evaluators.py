@@ -1,7 +1,11 @@
 from abstractions import Action, State, Q
+from utils.q_table import QTable
 
 
 def best_q_value(q: Q, state: State, actions: tuple[Action, ...]) -> float:
+    if isinstance(q, QTable):
+        return q.best_value(state, actions)
+
     ans = float("-inf")
     for a in actions:
         if (qa := q.get((state, a), 0)) > ans:
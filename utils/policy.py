@@ -4,7 +4,7 @@ import numpy as np
 
 from abstractions import Action, State, World, PolicyRec, Q, Policy
 from abstractions.type_vars import ActionTypeVar
-from utils.operations import order_callable
+from utils.q_table import QTable
 
 
 def get_policy_rec(pi: Policy, world: World, actions: Iterable[Action]) -> PolicyRec:
@@ -19,6 +19,12 @@ def get_policy_rec(pi: Policy, world: World, actions: Iterable[Action]) -> Polic
     one it recommends the agent to take more often)
     """
 
+    # imported here, utils shouldn't depend on policies at import time
+    from policies.frozen_greedy_policy import FrozenGreedyPolicy
+
+    if isinstance(pi, FrozenGreedyPolicy) and set(actions) == set(pi.actions):
+        return {s: pi.act(s) for s in world.states if s in pi.state_index}
+
     pi_rec = {}
     for s in world.states:
         best_score = 0
@@ -45,13 +51,17 @@ def sample_action(
     policy: Policy, state: State, actions: tuple[ActionTypeVar, ...]
 ) -> ActionTypeVar:
     """
-    Selects an action to a certain state following a policy.
+    Selects an action to a certain state following a policy. Uses the policy own sampling
+    whenever the options are the policy actions.
 
     :param policy: the policy we will consider
     :param state: a state to select the action from
     :param actions: a list of actions to be considered as options
     :returns: the selected action
     """
+    if isinstance(policy, Policy) and policy.actions == actions:
+        return policy.sample(state)
+
     cum_sum = 0
     n0 = np.random.uniform()
     for action in actions:
@@ -70,7 +80,9 @@ def sample_action_and_exploration(
     """
     Selects an action to a certain state following a policy.
     Also returns information on weather this was an exploration or not.
-    It considers any action different than the most likely as an exploration
+    It considers any action different than the most likely as an exploration.
+    This runs in O(len(actions)) with a single random draw, or in O(1) for epsilon greedy
+    policies, whose best action and epsilon are read directly.
 
     :param policy: the policy we will consider
     :param state: a state to select the action from
@@ -78,20 +90,62 @@ def sample_action_and_exploration(
     :returns: the selected action, and a flag indicating whether this was the most probable or not
 
     """
-    n0 = np.random.uniform()
-    ordered_policy = order_callable(lambda a: policy(state, a), actions)
+    # imported here, utils shouldn't depend on policies at import time
+    from policies import EpsilonExplorer, EpsilonGreedy
 
-    cum_sum = 0
-    for action, p_value in ordered_policy:
-        cum_sum += p_value
-        if n0 <= cum_sum:
-            return action, n0 > ordered_policy[0][1]
+    n0 = np.random.uniform()
+    if (
+        isinstance(policy, (EpsilonGreedy, EpsilonExplorer))
+        and policy.actions == actions
+    ):
+        if (sample := _sample_epsilon_greedy(policy, state, n0)) is not None:
+            return sample
+
+    probabilities = [policy(state, action) for action in actions]
+    greedy_index = max(range(len(actions)), key=probabilities.__getitem__)
+
+    # the most likely action takes the first slice of the cumulative distribution
+    cum_sum = probabilities[greedy_index]
+    if n0 <= cum_sum:
+        return actions[greedy_index], False
+
+    for i, p_value in enumerate(probabilities):
+        if i != greedy_index:
+            cum_sum += p_value
+            if n0 <= cum_sum:
+                return actions[i], True
 
     raise ValueError(
         f"policy adds to: {cum_sum:.5f} over actions: {actions} in state: {state}"
     )
 
 
+def _sample_epsilon_greedy(
+    policy: Policy, state: State, n0: float
+) -> tuple[ActionTypeVar, bool] | None:
+    """
+    Samples from an epsilon greedy policy the way sample_action_and_exploration does, without
+    computing the probability of each action. Returns None whenever the best action isn't the
+    most likely valid one, like with epsilon close to 1.
+    """
+    valid_actions = getattr(policy, "reasonable_actions", {}).get(state, policy.actions)
+    n = len(valid_actions)
+    if n == 1:
+        return valid_actions[0], False
+    if (best_action := policy.best_action.get(state)) is None:
+        # uniform, the first action is taken as the most likely
+        i = min(int(n0 * n), n - 1)
+        return valid_actions[i], i != 0
+
+    p_best, p_other = 1 - policy.epsilon, policy.epsilon / (n - 1)
+    if p_best < p_other or best_action not in valid_actions:
+        return None
+    if n0 <= p_best:
+        return best_action, False
+    i = min(int((n0 - p_best) / p_other), n - 2)
+    return valid_actions[i + (i >= valid_actions.index(best_action))], True
+
+
 def get_e_greedy_policy(
     q: Q, states: tuple[State, ...], actions: tuple[Action, ...], epsilon: float = 0.1
 ):
@@ -129,6 +183,9 @@ def get_best_action_from_q(
     :param actions: a list of actions to be considered
     :return: the best action from the list
     """
+    if isinstance(q, QTable):
+        return q.best_action(s, actions)
+
     best_action = actions[0]
     best_score = q.get((s, best_action), 0)
     if len(actions) > 1:
@@ -0,0 +1,408 @@
+import copy
+from dataclasses import dataclass
+from typing import Final, Iterable, Iterator, Mapping, MutableMapping
+
+import numpy as np
+
+from abstractions import Action, State
+from abstractions.type_vars import ActionTypeVar
+
+
+@dataclass(frozen=True)
+class QTableStats:
+    """
+    Size and memory usage of a Q table.
+
+    :param states: number of states with a row in the table
+    :param entries: number of state-action pairs set in the table
+    :param capacity: number of rows allocated
+    :param evictions: number of states dropped to respect a memory bound
+    :param nbytes: memory taken by the arrays of the table
+    """
+
+    states: int
+    entries: int
+    capacity: int
+    evictions: int
+    nbytes: int
+
+
+class QTable(MutableMapping):
+    def __init__(
+        self,
+        actions: tuple[Action, ...],
+        q_0: Mapping[tuple[State, Action], float] = None,
+        states: Iterable[State] = None,
+        initial_capacity: int = 64,
+    ):
+        """
+        A Q function stored as a dense (S, A) array of floats. Each state gets a row the first
+        time it is seen, and the array grows as needed, so the state space doesn't need to be
+        known in advance.
+
+        It behaves like a dict of (state, action) -> value, so it can be used anywhere a Q dict
+        is expected. Entries that were never set work as missing keys, and are stored as 0.
+
+        The best action and value of each row are kept up to date as entries change, so greedy
+        lookups are O(1). A row is only scanned again when its best entry decreases.
+
+        :param actions: actions available, these define the columns of the table
+        :param q_0: initial values for the table
+        :param states: states to register upfront, rows will follow this order
+        :param initial_capacity: number of rows to allocate initially
+        """
+        self.actions: Final[tuple[Action, ...]] = tuple(actions)
+        self.action_index: Final[dict[Action, int]] = {
+            a: i for i, a in enumerate(self.actions)
+        }
+        self.states: list[State] = []
+        self.state_index: dict[State, int] = {}
+        self._values = np.zeros((max(initial_capacity, 1), len(self.actions)))
+        self._known = np.zeros(self._values.shape, dtype=bool)
+        self._best_index = np.zeros(self._values.shape[0], dtype=np.int64)
+        self._best_value = np.zeros(self._values.shape[0])
+        self._size = 0
+        self._columns: dict[
+            tuple[Action, ...], tuple[np.ndarray, np.ndarray, bool]
+        ] = {}
+
+        for s in states if states is not None else []:
+            self.row(s)
+        for key, value in (q_0 if q_0 is not None else {}).items():
+            self[key] = value
+
+    @classmethod
+    def from_arrays(
+        cls,
+        actions: tuple[Action, ...],
+        states: list[State],
+        values: np.ndarray,
+        known: np.ndarray,
+        best_index: np.ndarray = None,
+        best_value: np.ndarray = None,
+    ) -> "QTable":
+        """
+        Builds a table on top of existing arrays, without copying them.
+
+        :param actions: actions available, these define the columns of the table
+        :param states: states of each row
+        :param values: (S, A) array of values
+        :param known: (S, A) mask of entries that are part of the table
+        :param best_index: best column of each row, computed if not provided
+        :param best_value: best value of each row, computed if not provided
+        :return: the table
+        """
+        q = cls(actions)
+        if len(states) == 0:
+            return q
+        q.states = list(states)
+        q.state_index = {s: i for i, s in enumerate(q.states)}
+        q._values = values
+        q._known = known
+        q._size = int(known.sum())
+        if best_index is None or best_value is None:
+            q._best_index = np.zeros(len(states), dtype=np.int64)
+            q._best_value = np.zeros(len(states))
+            q.refresh_best(np.arange(len(states)))
+        else:
+            q._best_index = best_index
+            q._best_value = best_value
+        return q
+
+    @property
+    def array(self) -> np.ndarray:
+        """
+        Live (S, A) view of the values, rows follow self.states. Changes made directly to it
+        must be followed by a call to refresh_best.
+        """
+        return self._values[: len(self.states)]
+
+    @property
+    def known(self) -> np.ndarray:
+        """
+        Live (S, A) mask of the entries that are part of the table, rows follow self.states.
+        """
+        return self._known[: len(self.states)]
+
+    @property
+    def capacity(self) -> int:
+        return self._values.shape[0]
+
+    def row(self, state: State) -> int:
+        """
+        Gets the row for a state, adding it to the table if needed.
+
+        :param state: the state we want the row for
+        :return: the index of the row
+        """
+        if (i := self.state_index.get(state)) is None:
+            i = len(self.states)
+            if i == self.capacity:
+                self._grow()
+            self.states.append(state)
+            self.state_index[state] = i
+        return i
+
+    def rows(self, states: Iterable[State]) -> np.ndarray:
+        """
+        Gets the rows for a collection of states, adding them to the table if needed.
+        """
+        return np.fromiter((self.row(s) for s in states), dtype=np.int64)
+
+    def columns(self, actions: Iterable[Action]) -> np.ndarray:
+        """
+        Gets the columns for a collection of actions.
+        """
+        return self._column_info(actions)[0]
+
+    def action_values(
+        self, state: State, actions: tuple[Action, ...] = None
+    ) -> np.ndarray:
+        """
+        Gets the values of the actions of a state, entries that are not part of the table are 0.
+
+        :param state: the state to be evaluated
+        :param actions: actions to be considered, defaults to all actions in the table
+        :return: the value of each action, in the order of actions
+        """
+        cols = slice(None) if actions is None else self.columns(actions)
+        if (i := self.state_index.get(state)) is None:
+            return np.zeros(len(self.actions))[cols]
+        return self._values[i, cols].copy()
+
+    def best_value(self, state: State, actions: tuple[Action, ...] = None) -> float:
+        """
+        Gets the highest value for a state.
+
+        :param state: the state to be evaluated
+        :param actions: actions to be considered, defaults to all actions in the table
+        :return: the highest value among the actions
+        """
+        if (i := self.state_index.get(state)) is None:
+            return 0.0
+        if actions is None or actions == self.actions:
+            return float(self._best_value[i])
+        cols, mask, ordered = self._column_info(actions)
+        if ordered and mask[self._best_index[i]]:
+            return float(self._best_value[i])
+        return float(self._values[i, cols].max())
+
+    def best_action(
+        self, state: State, actions: tuple[ActionTypeVar, ...] = None
+    ) -> ActionTypeVar:
+        """
+        Gets the action with the highest value for a state, ties are broken by the order of
+        the actions.
+
+        :param state: the state to be evaluated
+        :param actions: actions to be considered, defaults to all actions in the table
+        :return: the action with the highest value
+        """
+        actions = self.actions if actions is None else actions
+        if (i := self.state_index.get(state)) is None:
+            return actions[0]
+        if actions == self.actions:
+            return actions[self._best_index[i]]
+        cols, mask, ordered = self._column_info(actions)
+        if ordered and mask[self._best_index[i]]:
+            # the best action overall is also the first best among actions in the same order
+            return self.actions[self._best_index[i]]
+        return actions[int(self._values[i, cols].argmax())]
+
+    def add_to_rows(self, rows: np.ndarray, deltas: np.ndarray) -> None:
+        """
+        Adds values to whole rows at once. Entries receiving a non zero value become part of
+        the table.
+
+        :param rows: indexes of the rows to be updated, these should not repeat
+        :param deltas: (len(rows), A) array of values to be added
+        """
+        changed = deltas != 0
+        self._size += int((changed & ~self._known[rows]).sum())
+        self._known[rows] |= changed
+        self._values[rows] += deltas
+        self.refresh_best(rows)
+
+    def set_entries(self, rows: np.ndarray, cols: np.ndarray, values: np.ndarray):
+        """
+        Sets many entries at once, these become part of the table.
+
+        :param rows: row of each entry
+        :param cols: column of each entry
+        :param values: the new values, if an entry repeats the last value is kept
+        """
+        new = ~self._known[rows, cols]
+        self._size += np.unique(rows[new] * len(self.actions) + cols[new]).size
+        self._known[rows, cols] = True
+        self._values[rows, cols] = values
+        self.refresh_best(np.unique(rows))
+
+    def add_at(self, rows: np.ndarray, cols: np.ndarray, deltas: np.ndarray) -> None:
+        """
+        Adds values to many entries at once, entries that repeat accumulate all their values.
+
+        :param rows: row of each entry
+        :param cols: column of each entry
+        :param deltas: values to be added
+        """
+        new = ~self._known[rows, cols]
+        self._size += np.unique(rows[new] * len(self.actions) + cols[new]).size
+        self._known[rows, cols] = True
+        np.add.at(self._values, (rows, cols), deltas)
+        self.refresh_best(np.unique(rows))
+
+    def best_values(self, rows: np.ndarray) -> np.ndarray:
+        """
+        Gets the highest value of many rows at once.
+        """
+        return self._best_value[rows]
+
+    def refresh_best(self, rows: np.ndarray) -> None:
+        """
+        Recomputes the best action and value of some rows, this is needed after changing
+        values through the array view.
+
+        :param rows: indexes of the rows to be refreshed
+        """
+        self._best_index[rows] = self._values[rows].argmax(axis=1)
+        self._best_value[rows] = self._values[rows, self._best_index[rows]]
+
+    def freeze(self, states: Iterable[State] = None):
+        """
+        Compiles the greedy policy of the table into a read only policy.
+
+        :param states: states to be covered by the policy, in the order of its state index.
+            Defaults to the states of the table, unknown states get the first action
+        :return: a FrozenGreedyPolicy
+        """
+        from policies.frozen_greedy_policy import FrozenGreedyPolicy
+
+        if states is None:
+            return FrozenGreedyPolicy(
+                self.actions, self.states, self._best_index[: len(self.states)]
+            )
+        states = list(states)
+        rows = np.array([self.state_index.get(s, -1) for s in states], dtype=np.int64)
+        return FrozenGreedyPolicy(
+            self.actions, states, np.where(rows >= 0, self._best_index[rows], 0)
+        )
+
+    def get(self, key: tuple[State, Action], default: float = None) -> float:
+        i = self.state_index.get(key[0])
+        j = self.action_index.get(key[1])
+        if i is None or j is None or not self._known[i, j]:
+            return default
+        return float(self._values[i, j])
+
+    def copy(self) -> "QTable":
+        q = copy.copy(self)
+        q.states = list(self.states)
+        q.state_index = dict(self.state_index)
+        q._values = self._values.copy()
+        q._known = self._known.copy()
+        q._best_index = self._best_index.copy()
+        q._best_value = self._best_value.copy()
+        return q
+
+    def stats(self) -> QTableStats:
+        return QTableStats(
+            states=len(self.states),
+            entries=self._size,
+            capacity=self.capacity,
+            evictions=0,
+            nbytes=self._nbytes(),
+        )
+
+    def _nbytes(self) -> int:
+        return (
+            self._values.nbytes
+            + self._known.nbytes
+            + self._best_index.nbytes
+            + self._best_value.nbytes
+        )
+
+    def __getitem__(self, key: tuple[State, Action]) -> float:
+        if (value := self.get(key)) is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: tuple[State, Action], value: float) -> None:
+        j = self.action_index[key[1]]
+        i = self.row(key[0])
+        if not self._known[i, j]:
+            self._known[i, j] = True
+            self._size += 1
+        self._set_value(i, j, value)
+
+    def __delitem__(self, key: tuple[State, Action]) -> None:
+        i = self.state_index.get(key[0])
+        j = self.action_index.get(key[1])
+        if i is None or j is None or not self._known[i, j]:
+            raise KeyError(key)
+        self._known[i, j] = False
+        self._set_value(i, j, 0)
+        self._size -= 1
+
+    def __iter__(self) -> Iterator[tuple[State, Action]]:
+        for i, j in np.argwhere(self._known[: len(self.states)]).tolist():
+            yield self.states[i], self.actions[j]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _set_value(self, i: int, j: int, value: float) -> None:
+        self._values[i, j] = value
+        best_index = self._best_index[i]
+        best_value = self._best_value[i]
+        if value > best_value or (value == best_value and j < best_index):
+            self._best_index[i] = j
+            self._best_value[i] = value
+        elif j == best_index and value < best_value:
+            # the best entry went down, another one may have taken its place
+            best_index = self._values[i].argmax()
+            self._best_index[i] = best_index
+            self._best_value[i] = self._values[i, best_index]
+
+    def _column_info(
+        self, actions: Iterable[Action]
+    ) -> tuple[np.ndarray, np.ndarray, bool]:
+        """
+        Gets the columns of a collection of actions, a mask of these columns and whether they
+        follow the order of the table.
+        """
+        actions = tuple(actions)
+        if (info := self._columns.get(actions)) is None:
+            cols = np.array([self.action_index[a] for a in actions], dtype=np.int64)
+            mask = np.zeros(len(self.actions), dtype=bool)
+            mask[cols] = True
+            info = cols, mask, bool(np.all(np.diff(cols) > 0))
+            self._columns[actions] = info
+        return info
+
+    def _grow(self, capacity: int = None) -> None:
+        """
+        Reallocates the arrays with more rows, doubling them by default.
+        """
+        capacity = 2 * self.capacity if capacity is None else capacity
+        values = np.zeros((capacity, len(self.actions)))
+        known = np.zeros(values.shape, dtype=bool)
+        values[: self.capacity] = self._values
+        known[: self.capacity] = self._known
+        extra = capacity - self.capacity
+        self._best_index = np.concatenate(
+            [self._best_index, np.zeros(extra, dtype=np.int64)]
+        )
+        self._best_value = np.concatenate([self._best_value, np.zeros(extra)])
+        self._values = values
+        self._known = known
+
+
+def as_q_table(q: Mapping[tuple[State, Action], float], actions: tuple[Action, ...]):
+    """
+    Gets a QTable from Q values, tables are returned as they are and dicts are converted.
+
+    :param q: Q values, will be considered as a constant 0 if None
+    :param actions: actions available
+    :return: a QTable with the values from q
+    """
+    return q if isinstance(q, QTable) else QTable(actions, q)
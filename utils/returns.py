@@ -1,3 +1,5 @@
+import numpy as np
+
 from abstractions import Action, State
 
 
@@ -6,9 +8,9 @@ def returns_from_reward(rewards: list[float], gamma: float = 1) -> list[float]:
     cum_rewards_list = []
     for r in reversed(rewards):
         cum_reward = r + gamma * cum_reward
-        cum_rewards_list = [cum_reward] + cum_rewards_list
+        cum_rewards_list.append(cum_reward)
 
-    return cum_rewards_list
+    return cum_rewards_list[::-1]
 
 
 def first_visit_return(
@@ -22,3 +24,14 @@ def first_visit_return(
             fvr[sa] = episode_returns[i]
 
     return fvr
+
+
+def first_visit_indexes(keys: np.ndarray) -> np.ndarray:
+    """
+    Vectorized version of first visits, works over integer encoded state-action pairs.
+
+    :param keys: integer keys of the state-action pairs in an episode
+    :return: sorted positions where each key shows up for the first time
+    """
+    _, indexes = np.unique(keys, return_index=True)
+    return np.sort(indexes)
@@ -0,0 +1,183 @@
+import dataclasses
+import importlib
+from enum import Enum
+from typing import Any, Callable, Sequence
+
+import numpy as np
+
+from abstractions import State
+
+
+class UnsupportedCheckpointError(TypeError):
+    """
+    Raised when something can't be stored in a checkpoint, like states that aren't made of
+    scalars, tuples, enums and dataclasses.
+    """
+
+
+def get_path(cls: type) -> str:
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def import_path(path: str) -> Any:
+    module, qualname = path.split(":")
+    obj = importlib.import_module(module)
+    for name in qualname.split("."):
+        obj = getattr(obj, name)
+    return obj
+
+
+def encode_value(x: Any) -> Any:
+    """
+    Encodes a value as JSON compatible data. This covers what states and actions are usually
+    made of: scalars, tuples, enums and dataclasses.
+
+    :param x: the value to be encoded
+    :return: JSON compatible data, which can be decoded back with decode_value
+    :raises UnsupportedCheckpointError: for values of any other type
+    """
+    if x is None or isinstance(x, (bool, int, float, str)):
+        return x
+    elif isinstance(x, np.generic):
+        return x.item()
+    elif isinstance(x, Enum):
+        return {"enum": get_path(type(x)), "name": x.name}
+    elif dataclasses.is_dataclass(x) and not isinstance(x, type):
+        return {
+            "dataclass": get_path(type(x)),
+            "fields": {
+                f.name: encode_value(getattr(x, f.name)) for f in dataclasses.fields(x)
+            },
+        }
+    elif isinstance(x, tuple):
+        return {"tuple": [encode_value(v) for v in x]}
+    raise UnsupportedCheckpointError(f"can't encode values of type {type(x)}")
+
+
+def decode_value(x: Any) -> Any:
+    if not isinstance(x, dict):
+        return x
+    elif "enum" in x:
+        return import_path(x["enum"])[x["name"]]
+    elif "dataclass" in x:
+        return import_path(x["dataclass"])(
+            **{k: decode_value(v) for k, v in x["fields"].items()}
+        )
+    return tuple(decode_value(v) for v in x["tuple"])
+
+
+def encode_states(states: Sequence[State]) -> tuple[dict, dict[str, np.ndarray]]:
+    """
+    Encodes many states as arrays. Dataclass states whose fields are numbers, strings or flat
+    tuples of numbers are grouped by type, and each of their fields becomes a column: an array
+    of numbers, an (N, k) array for tuples, or codes into a list of values for strings. For
+    GWorldStates this is a coordinates array and an array of kind codes. Any other state is
+    stored with encode_value.
+
+    :param states: states to be encoded
+    :return: a JSON compatible spec and the arrays, to be decoded with decode_states
+    :raises UnsupportedCheckpointError: whenever a state can't be encoded
+    """
+    positions: dict[type, list[int]] = {}
+    for i, s in enumerate(states):
+        positions.setdefault(type(s), []).append(i)
+
+    spec = {"types": [], "others": []}
+    arrays = {"types": np.full(len(states), -1, dtype=np.int16)}
+    for cls, cls_positions in positions.items():
+        columns = _encode_columns(cls, [states[i] for i in cls_positions])
+        if columns is None:
+            spec["others"].extend([i, encode_value(states[i])] for i in cls_positions)
+            continue
+
+        t = len(spec["types"])
+        arrays["types"][cls_positions] = t
+        fields = []
+        for j, (name, kind, array, values) in enumerate(columns):
+            arrays[f"{t}.{j}"] = array
+            fields.append({"name": name, "kind": kind, "values": values})
+        spec["types"].append({"class": get_path(cls), "fields": fields})
+    return spec, arrays
+
+
+def decode_states(spec: dict, load_array: Callable[[str], np.ndarray]) -> list[State]:
+    """
+    Decodes states encoded with encode_states. States are built a column at a time, without
+    going through per state decoding.
+
+    :param spec: the spec returned by encode_states
+    :param load_array: gets each of the arrays returned by encode_states, by name
+    :return: the states
+    """
+    type_ids = load_array("types")
+    states: list[State] = [None] * len(type_ids)
+    for t, type_spec in enumerate(spec["types"]):
+        cls = import_path(type_spec["class"])
+        columns = [
+            _decode_column(field, load_array(f"{t}.{j}"))
+            for j, field in enumerate(type_spec["fields"])
+        ]
+        positions = np.flatnonzero(type_ids == t)
+        cls_states = list(map(cls, *columns)) if columns else [cls() for _ in positions]
+        if len(positions) == len(states):
+            states = cls_states
+        else:
+            for i, s in zip(positions.tolist(), cls_states):
+                states[i] = s
+
+    for i, x in spec["others"]:
+        states[i] = decode_value(x)
+    return states
+
+
+def _encode_columns(
+    cls: type, states: list[State]
+) -> list[tuple[str, str, np.ndarray, list[str] | None]] | None:
+    """
+    Builds the columns of states of the same type, or returns None if they can't be stored
+    as columns.
+    """
+    if not dataclasses.is_dataclass(cls):
+        return None
+    fields = dataclasses.fields(cls)
+    if not all(f.init and not f.kw_only for f in fields):
+        return None
+
+    columns = []
+    for f in fields:
+        column = [getattr(s, f.name) for s in states]
+        types = {type(v) for v in column}
+        if types == {str}:
+            values, codes = np.unique(column, return_inverse=True)
+            columns.append((f.name, "str", codes.astype(np.int32), values.tolist()))
+        elif len(types) == 1 and types <= {bool, int, float}:
+            columns.append((f.name, "scalar", _as_array(column), None))
+        elif (
+            types == {tuple}
+            and len({len(v) for v in column}) == 1
+            and len(item_types := {type(x) for v in column for x in v}) <= 1
+            and item_types <= {bool, int, float}
+        ):
+            columns.append((f.name, "tuple", _as_array(column), None))
+        else:
+            return None
+
+    # ints too large for int64 can't be stored in arrays
+    return None if any(c[2] is None for c in columns) else columns
+
+
+def _as_array(column: list) -> np.ndarray | None:
+    try:
+        return np.array(column)
+    except OverflowError:
+        return None
+
+
+def _decode_column(field: dict, array: np.ndarray) -> list:
+    if field["kind"] == "str":
+        return np.array(field["values"], dtype=object)[array].tolist()
+    elif field["kind"] == "tuple":
+        if array.shape[1] == 0:
+            return [()] * len(array)
+        return list(zip(*array.T.tolist()))
+    return array.tolist()